@@ -0,0 +1,34 @@
+-- Schema initialization for ATS CV Search PostgreSQL Docker container
+-- Keep in sync with check_and_create_table / migrate_updated_at in setup_postgres.py
+
+CREATE TABLE IF NOT EXISTS resumes (
+    id VARCHAR(255) PRIMARY KEY,
+    category VARCHAR(255),
+    file_path TEXT,
+    name TEXT,
+    phone VARCHAR(50),
+    birthdate DATE,
+    address TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_resumes_category ON resumes(category);
+CREATE INDEX IF NOT EXISTS idx_resumes_name ON resumes(name);
+-- resume catalog watermark: MAX(updated_at) and WHERE updated_at >= ...
+CREATE INDEX IF NOT EXISTS idx_resumes_updated_at ON resumes(updated_at);
+
+-- updated_at moves on every UPDATE that changes the row, ResumeCatalog refreshes incrementally by this column
+CREATE OR REPLACE FUNCTION set_updated_at() RETURNS TRIGGER AS $$
+BEGIN
+    NEW.updated_at = now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS resumes_set_updated_at ON resumes;
+CREATE TRIGGER resumes_set_updated_at
+    BEFORE UPDATE ON resumes
+    FOR EACH ROW
+    WHEN (OLD.* IS DISTINCT FROM NEW.*)
+    EXECUTE FUNCTION set_updated_at();
@@ -35,6 +35,41 @@ def create_connection():
         print(f"Error connecting to PostgreSQL: {e}")
         return None
 
+# updated_at must move on every UPDATE that changes the row, the app's resume catalog refreshes incrementally by this watermark
+UPDATED_AT_MIGRATION = [
+    "ALTER TABLE resumes ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP",
+    "UPDATE resumes SET updated_at = CURRENT_TIMESTAMP WHERE updated_at IS NULL",
+    "CREATE INDEX IF NOT EXISTS idx_resumes_updated_at ON resumes(updated_at)",
+    """
+    CREATE OR REPLACE FUNCTION set_updated_at() RETURNS TRIGGER AS $$
+    BEGIN
+        NEW.updated_at = now();
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS resumes_set_updated_at ON resumes",
+    """
+    CREATE TRIGGER resumes_set_updated_at
+        BEFORE UPDATE ON resumes
+        FOR EACH ROW
+        WHEN (OLD.* IS DISTINCT FROM NEW.*)
+        EXECUTE FUNCTION set_updated_at()
+    """,
+]
+
+def migrate_updated_at(conn):
+    """Add updated_at column, index and BEFORE UPDATE trigger (idempotent, also for existing databases)"""
+    try:
+        cursor = conn.cursor()
+        for statement in UPDATED_AT_MIGRATION:
+            cursor.execute(statement)
+        conn.commit()
+        print("updated_at trigger is in place.")
+    except Error as e:
+        conn.rollback()
+        print(f"Failed to migrate updated_at: {e}")
+
 def check_and_create_table(conn):
     """Check if resumes table exists and create if needed"""
     try:
@@ -74,6 +109,8 @@ def check_and_create_table(conn):
             print("Table 'resumes' created successfully.")
         else:
             print("Table 'resumes' already exists.")
+        
+        migrate_updated_at(conn)
             
     except Error as e:
         print(f"Failed to create table: {e}")
@@ -118,7 +155,8 @@ def import_data_to_db(conn, csv_path, pdf_folder_path):
         for index, row in resumes_df.iterrows():
             resume_id = str(row['ID'])
             category = row['Category']
-            file_path = os.path.join(pdf_folder_path, category, f"{resume_id}.pdf")
+            # canonical absolute path, the app uses it as-is without probing the filesystem
+            file_path = os.path.abspath(os.path.join(pdf_folder_path, category, f"{resume_id}.pdf"))
 
             cursor.execute(sql, (resume_id, category, file_path))
             count += 1
@@ -5,11 +5,13 @@ This package contains pattern matching algorithms including:
 - Boyer-Moore
 - Aho-Corasick
 - Levenshtein Distance
+- Inverted Index (exact keyword lookup)
 """
 
 from .kmp import KMPMatcher
 from .bm import BoyerMooreMatcher
-from .aho_corasick import AhoCorasick
+from .aho_corasick import AhoCorasick, CompiledAhoCorasick
 from .levenshtein import LevenshteinMatcher
+from .inverted_index import InvertedIndex
 
-__all__ = ['KMPMatcher', 'BoyerMooreMatcher', 'AhoCorasick', 'LevenshteinMatcher']
+__all__ = ['KMPMatcher', 'BoyerMooreMatcher', 'AhoCorasick', 'CompiledAhoCorasick', 'LevenshteinMatcher', 'InvertedIndex']
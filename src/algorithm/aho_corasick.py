@@ -1,9 +1,14 @@
+import re
+from array import array
+from collections import deque
+
 class AhoCorasick:
     def __init__(self, keywords=None):
         """inisialisasi aho-corasick automaton"""
         self.goto = [{}]  # trie structure
         self.output = [[] for _ in range(1)]  # output untuk setiap node
         self.failure = [0]  # failure links
+        self.keywords = tuple(keywords or ())  # keywords yang dipakai membangun automaton
         
         if keywords:
             self._build_trie(keywords)
@@ -24,12 +29,12 @@ class AhoCorasick:
                     self.failure.append(0)
                 node = self.goto[node][char]
             
-            # simpan keyword di end node
-            self.output[node].append(keyword)
+            # simpan keyword di end node (keyword duplikat cukup sekali)
+            if keyword not in self.output[node]:
+                self.output[node].append(keyword)
 
     def _build_failure_links(self):
         """bangun failure links menggunakan bfs"""
-        from collections import deque
         queue = deque()
         
         # level 1 nodes (children of root)
@@ -89,12 +94,159 @@ class AhoCorasick:
 
         return results
     
+    def compile(self):
+        """compile trie + failure links jadi dfa berbasis array (lihat CompiledAhoCorasick)"""
+        return CompiledAhoCorasick(self)
+    
     def search_multiple(self, text, keywords):
         """search multiple keywords - interface untuk kompatibilitas"""
-        # rebuild automaton dengan keywords baru
-        self.__init__(keywords)
+        # rebuild automaton hanya jika keywords berubah
+        if tuple(keywords) != self.keywords:
+            self.__init__(keywords)
         return self.search(text)
 
+class CompiledAhoCorasick:
+    """aho-corasick dalam bentuk dfa penuh: tabel transisi flat + output dalam array, picklable"""
+    
+    def __init__(self, automaton: AhoCorasick):
+        # alphabet compression: karakter di keywords dapat class 1..n, karakter lain class 0
+        alphabet = sorted({char for keyword in automaton.keywords for char in keyword})
+        self.width = len(alphabet) + 1
+        self.num_states = len(automaton.goto)
+        
+        # placeholder = karakter di luar alphabet, dipakai untuk semua karakter asing di teks
+        placeholder = next(chr(code) for code in range(len(alphabet) + 1) if chr(code) not in alphabet)
+        self._table = {ord(char): chr(cls) for cls, char in enumerate(alphabet, 1)}
+        self._table[ord(placeholder)] = chr(0)
+        self._placeholder = placeholder
+        self._unknown = re.compile('[^' + ''.join(re.escape(char) for char in alphabet) + ']') if alphabet else None
+        classes = {char: cls for cls, char in enumerate(alphabet, 1)}
+        
+        # failure transitions dilipat ke tabel: delta[row + class] = row next state (row = state * width)
+        self.delta = array('I', [0]) * (self.num_states * self.width)
+        queue = deque([0])
+        while queue:
+            state = queue.popleft()
+            row = state * self.width
+            fail_row = automaton.failure[state] * self.width
+            for cls in range(1, self.width):
+                char = alphabet[cls - 1]
+                child = automaton.goto[state].get(char)
+                if child is not None:
+                    self.delta[row + cls] = child * self.width
+                    queue.append(child)
+                elif state != 0:
+                    self.delta[row + cls] = self.delta[fail_row + cls]
+        
+        # output per state sebagai offset ke flat array index keyword
+        self.keywords = []
+        keyword_index = {}
+        self.out_offsets = array('I', [0])
+        self.out_keywords = array('I')
+        self.accepting = bytearray(self.num_states * self.width)  # di-index dengan row, bukan state
+        for state in range(self.num_states):
+            for keyword in automaton.output[state]:
+                if keyword not in keyword_index:
+                    keyword_index[keyword] = len(self.keywords)
+                    self.keywords.append(keyword)
+                self.out_keywords.append(keyword_index[keyword])
+            self.out_offsets.append(len(self.out_keywords))
+            self.accepting[state * self.width] = self.out_offsets[state + 1] > self.out_offsets[state]
+        self.lengths = array('I', (len(keyword) for keyword in self.keywords))
+        self._rows = self.delta.tolist()  # salinan list untuk loop pencarian (indexing list lebih cepat dari array)
+        self._byte_dfa = None  # dfa level byte untuk search_bytes, dibangun saat pertama dipakai
+    
+    def __getstate__(self):
+        """yang di-pickle hanya array compact, salinan list dibangun ulang di proses tujuan"""
+        state = self.__dict__.copy()
+        del state['_rows']
+        state['_byte_dfa'] = None
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._rows = self.delta.tolist()
+    
+    def _build_byte_dfa(self):
+        """dfa atas keyword utf-8 dengan 256 kolom per state, sehingga nilai byte langsung jadi index tabel"""
+        automaton = AhoCorasick([keyword.encode('utf-8') for keyword in self.keywords])
+        num_states = len(automaton.goto)
+        
+        rows = [0] * (num_states * 256)
+        queue = deque([0])
+        while queue:
+            state = queue.popleft()
+            row = state * 256
+            fail_row = automaton.failure[state] * 256
+            for byte in range(256):
+                child = automaton.goto[state].get(byte)
+                if child is not None:
+                    rows[row + byte] = child * 256
+                    queue.append(child)
+                elif state != 0:
+                    rows[row + byte] = rows[fail_row + byte]
+        
+        # output per row: [(index keyword, panjang byte)]
+        keyword_index = {keyword.encode('utf-8'): idx for idx, keyword in enumerate(self.keywords)}
+        outputs = {state * 256: [(keyword_index[keyword], len(keyword)) for keyword in automaton.output[state]]
+                   for state in range(num_states) if automaton.output[state]}
+        accepting = bytearray(num_states * 256)  # di-index dengan row, bukan state
+        for row in outputs:
+            accepting[row] = 1
+        return rows, accepting, outputs
+    
+    def search_bytes(self, data):
+        """cari semua keywords di bytes / memoryview utf-8, satu lookup tabel per byte; return posisi byte"""
+        if not data or not self.keywords:
+            return {}
+        
+        if self._byte_dfa is None:
+            self._byte_dfa = self._build_byte_dfa()
+        rows, accepting, outputs = self._byte_dfa
+        keywords = self.keywords
+        
+        results = {}
+        row = 0
+        for i, byte in enumerate(data):
+            row = rows[row + byte]
+            if accepting[row]:
+                for keyword_idx, length in outputs[row]:
+                    results.setdefault(keywords[keyword_idx], []).append(i - length + 1)
+        
+        return results
+    
+    def _encode(self, text):
+        """ubah teks jadi deretan class karakter (dikerjakan di c lewat regex + translate)"""
+        if self._unknown is not None:
+            text = self._unknown.sub(self._placeholder, text)
+        codes = text.translate(self._table)
+        if self.width <= 256:
+            return codes.encode('latin-1')
+        return [ord(code) for code in codes]
+    
+    def search(self, text):
+        """cari semua keywords dalam text, satu transisi tabel per karakter tanpa failure loop"""
+        if not text or not self.keywords:
+            return {}
+        
+        rows = self._rows
+        width = self.width
+        accepting = self.accepting
+        out_offsets = self.out_offsets
+        out_keywords = self.out_keywords
+        
+        results = {}
+        row = 0
+        for i, code in enumerate(self._encode(text)):
+            row = rows[row + code]
+            if accepting[row]:
+                state = row // width
+                for k in range(out_offsets[state], out_offsets[state + 1]):
+                    keyword_idx = out_keywords[k]
+                    results.setdefault(self.keywords[keyword_idx], []).append(i - self.lengths[keyword_idx] + 1)
+        
+        return results
+
 # testing function
 def test_aho_corasick():
     """test aho-corasick implementation"""
@@ -109,16 +261,41 @@ def test_aho_corasick():
     print(f"Text: '{text}'")
     print(f"Results: {results}")
     
-    # expected: {'she': [2], 'he': [3], 'hers': [1]}
-    expected = {'she': [2], 'he': [3], 'hers': [1]}
+    # expected: posisi awal tiap keyword dalam "ushers"
+    expected = {'she': [1], 'he': [2], 'hers': [2]}
+    passed = results == expected
+    
+    # satu pass dengan semua keyword harus sama dengan search per keyword
+    text = "project manager with project management and sales management experience"
+    keywords = ["project", "management", "sales", "age", "man", "xyz"]
+    single_pass = AhoCorasick(keywords).search(text)
+    per_keyword = {}
+    for keyword in keywords:
+        per_keyword.update(AhoCorasick([keyword]).search(text))
+    print(f"Single pass: {single_pass}")
+    passed = passed and single_pass == per_keyword
+    
+    # compiled dfa harus sama dengan trie, juga setelah di-pickle (dikirim ke worker)
+    import pickle
+    compiled = pickle.loads(pickle.dumps(AhoCorasick(keywords).compile()))
+    for sample in (text, "ushers", "", "ÿ\x00 manaGEment unicode ✓ project"):
+        passed = passed and compiled.search(sample) == AhoCorasick(keywords).search(sample)
+        
+        # search_bytes pada ascii harus sama persis, pada non-ascii posisi byte dikonversi ke posisi karakter
+        data = sample.encode('utf-8')
+        byte_results = {keyword: [len(data[:pos].decode('utf-8')) for pos in positions]
+                        for keyword, positions in compiled.search_bytes(memoryview(data)).items()}
+        passed = passed and byte_results == compiled.search(sample)
+    print(f"Compiled: {compiled.search(text)}")
     
-    if results == expected:
+    if passed:
         print("✅ Test PASSED")
     else:
         print("❌ Test FAILED")
         print(f"Expected: {expected}")
+        print(f"Per keyword: {per_keyword}")
     
-    return results == expected
+    return passed
 
 if __name__ == "__main__":
     test_aho_corasick()
\ No newline at end of file
@@ -1,45 +1,31 @@
-class BoyerMooreMatcher:
-    def __init__(self):
-        self.pattern = None
-        self.bad_char = None
-        self.good_suffix = None
-    
-    def _compute_bad_char_table(self, pattern):
-        """hitung bad character table untuk pattern"""
-        bad_char = {}
-        
-        # isi tabel untuk semua karakter ascii
-        for i in range(256):
-            bad_char[chr(i)] = -1
-        
-        # update posisi terakhir setiap karakter dalam pattern
-        for i in range(len(pattern)):
-            bad_char[pattern[i]] = i
-        
-        return bad_char
+from array import array
+from functools import lru_cache
+
+# variant yang bisa dipilih lewat search(): boyer-moore penuh, horspool, sunday
+VARIANTS = ('full', 'horspool', 'sunday')
+
+class CompiledBoyerMoore:
+    """pattern boyer-moore yang sudah di-preprocess, bisa dipakai ulang untuk banyak teks"""
     
-    def _compute_good_suffix_table(self, pattern):
-        """hitung good suffix table untuk pattern - DIPERBAIKI"""
-        m = len(pattern)
-        good_suffix = [m] * m  # default shift = pattern length
-        
-        # simple good suffix implementation untuk konsistensi
-        for i in range(m):
-            good_suffix[i] = max(1, m - i - 1)  # minimal shift 1
+    def __init__(self, pattern, bad_char, good_suffix):
+        self.pattern = pattern
+        self.bad_char = bad_char
+        self.good_suffix = good_suffix
         
-        return good_suffix
+        # versi utf-8 untuk search_bytes: bad character table 256 entry di-index langsung dengan nilai byte
+        self.pattern_bytes = pattern.encode('utf-8')
+        self.bad_char_bytes = BoyerMooreMatcher._compute_byte_table(self.pattern_bytes, lambda i, m: i, -1)
+        self.good_suffix_bytes = good_suffix if pattern.isascii() else BoyerMooreMatcher._compute_good_suffix_table(self.pattern_bytes)
     
-    def search(self, text, pattern):
-        """cari pattern dalam text menggunakan algoritma boyer-moore - DIPERBAIKI"""
+    def search(self, text):
+        """cari pattern dalam text dengan bad character + strong good suffix rule"""
+        pattern = self.pattern
         if not pattern or not text:
             return {}
         
-        # preprocessing
-        self.pattern = pattern
-        self.bad_char = self._compute_bad_char_table(pattern)
-        self.good_suffix = self._compute_good_suffix_table(pattern)
-        
-        results = {}
+        bad_char = self.bad_char
+        good_suffix = self.good_suffix
+        positions = []
         text_len = len(text)
         pattern_len = len(pattern)
         
@@ -53,25 +39,233 @@ class BoyerMooreMatcher:
                 j -= 1
             
             if j < 0:
-                # pattern ditemukan
-                if pattern not in results:
-                    results[pattern] = []
-                results[pattern].append(shift)
-                
-                # PERBAIKAN: untuk overlapping search, shift minimal 1
-                shift += 1
+                # pattern ditemukan, geser sejauh period pattern (aman untuk overlapping match)
+                positions.append(shift)
+                shift += good_suffix[0]
             else:
-                # karakter tidak match, hitung shift
-                # PERBAIKAN: gunakan bad character heuristic yang benar
-                bad_char_shift = max(1, j - self.bad_char.get(text[shift + j], -1))
-                
-                # PERBAIKAN: good suffix shift yang lebih konservatif
-                good_suffix_shift = 1 if j >= len(self.good_suffix) else max(1, self.good_suffix[j])
-                
-                # ambil shift maksimum tapi minimal 1
-                shift += max(bad_char_shift, good_suffix_shift, 1)
-        
-        return results
+                # ambil shift terbesar dari bad character dan good suffix
+                bad_char_shift = j - bad_char.get(text[shift + j], -1)
+                shift += max(bad_char_shift, good_suffix[j + 1])
+        
+        return {pattern: positions} if positions else {}
+    
+    def search_bytes(self, data):
+        """cari pattern di bytes / memoryview utf-8 (bad character + strong good suffix); return posisi byte"""
+        pattern = self.pattern_bytes
+        if not pattern or not data:
+            return {}
+        
+        bad_char = self.bad_char_bytes
+        good_suffix = self.good_suffix_bytes
+        positions = []
+        last = len(data) - len(pattern)
+        pattern_end = len(pattern) - 1
+        
+        shift = 0
+        while shift <= last:
+            j = pattern_end
+            while j >= 0 and pattern[j] == data[shift + j]:
+                j -= 1
+            
+            if j < 0:
+                positions.append(shift)
+                shift += good_suffix[0]
+            else:
+                bad_char_shift = j - bad_char[data[shift + j]]
+                good_suffix_shift = good_suffix[j + 1]
+                shift += bad_char_shift if bad_char_shift > good_suffix_shift else good_suffix_shift
+        
+        return {self.pattern: positions} if positions else {}
+
+class CompiledHorspool:
+    """varian horspool: shift hanya dari karakter teks yang sejajar dengan akhir pattern"""
+    
+    def __init__(self, pattern, shift_table):
+        self.pattern = pattern
+        self.shift_table = shift_table
+        
+        self.pattern_bytes = pattern.encode('utf-8')
+        self.shift_bytes = BoyerMooreMatcher._compute_byte_table(self.pattern_bytes[:-1], lambda i, m: m - i, len(self.pattern_bytes))
+    
+    def search(self, text):
+        """cari pattern dalam text menggunakan horspool shift table"""
+        pattern = self.pattern
+        if not pattern or not text:
+            return {}
+        
+        shift_table = self.shift_table
+        positions = []
+        pattern_len = len(pattern)
+        last_char = pattern[-1]
+        last = len(text) - pattern_len
+        
+        shift = 0
+        while shift <= last:
+            end_char = text[shift + pattern_len - 1]
+            if end_char == last_char and text[shift:shift + pattern_len] == pattern:
+                positions.append(shift)
+            shift += shift_table.get(end_char, pattern_len)
+        
+        return {pattern: positions} if positions else {}
+    
+    def search_bytes(self, data):
+        """cari pattern di bytes / memoryview utf-8 dengan shift table 256 entry; return posisi byte"""
+        pattern = self.pattern_bytes
+        if not pattern or not data:
+            return {}
+        
+        shift_table = self.shift_bytes
+        positions = []
+        pattern_end = len(pattern) - 1
+        head = pattern[:-1]
+        last_byte = pattern[-1]
+        last = len(data) - len(pattern)
+        
+        shift = 0
+        while shift <= last:
+            end_byte = data[shift + pattern_end]
+            if end_byte == last_byte and data[shift:shift + pattern_end] == head:
+                positions.append(shift)
+            shift += shift_table[end_byte]
+        
+        return {self.pattern: positions} if positions else {}
+
+class CompiledSunday:
+    """varian sunday (quick search): shift dari karakter teks tepat setelah window"""
+    
+    def __init__(self, pattern, shift_table):
+        self.pattern = pattern
+        self.shift_table = shift_table
+        
+        self.pattern_bytes = pattern.encode('utf-8')
+        self.shift_bytes = BoyerMooreMatcher._compute_byte_table(self.pattern_bytes, lambda i, m: m - i, len(self.pattern_bytes) + 1)
+    
+    def search(self, text):
+        """cari pattern dalam text menggunakan sunday shift table"""
+        pattern = self.pattern
+        if not pattern or not text:
+            return {}
+        
+        shift_table = self.shift_table
+        positions = []
+        text_len = len(text)
+        pattern_len = len(pattern)
+        default_shift = pattern_len + 1
+        
+        shift = 0
+        while shift <= text_len - pattern_len:
+            if text[shift:shift + pattern_len] == pattern:
+                positions.append(shift)
+            if shift + pattern_len >= text_len:
+                break
+            shift += shift_table.get(text[shift + pattern_len], default_shift)
+        
+        return {pattern: positions} if positions else {}
+    
+    def search_bytes(self, data):
+        """cari pattern di bytes / memoryview utf-8 dengan shift table 256 entry; return posisi byte"""
+        pattern = self.pattern_bytes
+        if not pattern or not data:
+            return {}
+        
+        shift_table = self.shift_bytes
+        positions = []
+        text_len = len(data)
+        pattern_len = len(pattern)
+        last_byte = pattern[-1]
+        
+        shift = 0
+        while shift <= text_len - pattern_len:
+            # cek byte terakhir dulu supaya slice hanya dibuat untuk kandidat
+            if data[shift + pattern_len - 1] == last_byte and data[shift:shift + pattern_len] == pattern:
+                positions.append(shift)
+            if shift + pattern_len >= text_len:
+                break
+            shift += shift_table[data[shift + pattern_len]]
+        
+        return {self.pattern: positions} if positions else {}
+
+class BoyerMooreMatcher:
+    def __init__(self, variant='full'):
+        self.variant = variant  # 'full', 'horspool' atau 'sunday'
+        self.pattern = None
+        self.bad_char = None
+        self.good_suffix = None
+    
+    @staticmethod
+    def _compute_bad_char_table(pattern):
+        """hitung bad character table (posisi terakhir setiap karakter dalam pattern)"""
+        bad_char = {}
+        for i in range(len(pattern)):
+            bad_char[pattern[i]] = i
+        return bad_char
+    
+    @staticmethod
+    def _compute_byte_table(pattern_bytes, value, default):
+        """tabel 256 entry (array int) untuk nilai byte, entry = value(posisi terakhir byte, panjang pattern)"""
+        table = array('i', [default]) * 256
+        for i, byte in enumerate(pattern_bytes):
+            table[byte] = value(i, len(pattern_bytes))
+        return table
+    
+    @staticmethod
+    def _compute_good_suffix_table(pattern):
+        """hitung strong good suffix table, shift[j + 1] dipakai saat mismatch di posisi j"""
+        m = len(pattern)
+        shift = [0] * (m + 1)
+        border = [0] * (m + 1)  # border[i] = awal border terpanjang dari pattern[i:]
+        
+        # kasus 1: suffix yang cocok muncul lagi di pattern dengan karakter sebelum yang berbeda
+        i, j = m, m + 1
+        border[i] = j
+        while i > 0:
+            while j <= m and pattern[i - 1] != pattern[j - 1]:
+                if shift[j] == 0:
+                    shift[j] = j - i
+                j = border[j]
+            i -= 1
+            j -= 1
+            border[i] = j
+        
+        # kasus 2: hanya sebagian suffix yang cocok dengan prefix pattern
+        j = border[0]
+        for i in range(m + 1):
+            if shift[i] == 0:
+                shift[i] = j
+            if i == j:
+                j = border[j]
+        
+        return shift
+    
+    @staticmethod
+    def _compute_horspool_table(pattern):
+        """shift horspool: jarak karakter (kecuali karakter terakhir) ke akhir pattern"""
+        m = len(pattern)
+        return {pattern[i]: m - 1 - i for i in range(m - 1)}
+    
+    @staticmethod
+    def _compute_sunday_table(pattern):
+        """shift sunday: jarak karakter ke satu posisi setelah akhir pattern"""
+        m = len(pattern)
+        return {pattern[i]: m - i for i in range(m)}
+    
+    def compile(self, pattern, variant=None):
+        """preprocess pattern sekali, hasilnya dipakai ulang lintas cv dan lintas query"""
+        return _compile_pattern(pattern, variant or self.variant)
+    
+    def search(self, text, pattern, variant=None):
+        """cari pattern dalam text menggunakan algoritma boyer-moore (atau varian horspool/sunday)"""
+        if not pattern or not text:
+            return {}
+        
+        # preprocessing (diambil dari cache jika sudah pernah)
+        compiled = self.compile(pattern, variant)
+        self.pattern = compiled.pattern
+        if isinstance(compiled, CompiledBoyerMoore):
+            self.bad_char = compiled.bad_char
+            self.good_suffix = compiled.good_suffix
+        
+        return compiled.search(text)
     
     def search_multiple(self, text, patterns):
         """cari multiple patterns dalam text"""
@@ -86,17 +280,29 @@ class BoyerMooreMatcher:
         
         return all_results
 
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern, variant='full'):
+    """compiled pattern disimpan di lru cache (maks 256 pattern terakhir)"""
+    if variant == 'horspool':
+        return CompiledHorspool(pattern, BoyerMooreMatcher._compute_horspool_table(pattern))
+    if variant == 'sunday':
+        return CompiledSunday(pattern, BoyerMooreMatcher._compute_sunday_table(pattern))
+    if variant != 'full':
+        raise ValueError(f"unknown boyer-moore variant: {variant} (pilih dari {VARIANTS})")
+    return CompiledBoyerMoore(pattern, BoyerMooreMatcher._compute_bad_char_table(pattern), BoyerMooreMatcher._compute_good_suffix_table(pattern))
+
 # test function untuk validasi
+def naive_search(text, pattern):
+    """implementasi naive untuk comparison"""
+    results = {pattern: []}
+    for i in range(len(text) - len(pattern) + 1):
+        if text[i:i+len(pattern)] == pattern:
+            results[pattern].append(i)
+    return results if results[pattern] else {}
+
 def test_boyer_moore_consistency():
-    """test apakah BM memberikan hasil sama dengan implementasi naive"""
-    
-    def naive_search(text, pattern):
-        """implementasi naive untuk comparison"""
-        results = {pattern: []}
-        for i in range(len(text) - len(pattern) + 1):
-            if text[i:i+len(pattern)] == pattern:
-                results[pattern].append(i)
-        return results if results[pattern] else {}
+    """test apakah BM (semua varian) memberikan hasil sama dengan implementasi naive"""
+    import random
     
     # test cases
     test_cases = [
@@ -105,29 +311,48 @@ def test_boyer_moore_consistency():
         ("hello world hello", "hello"),
         ("abcdefg", "xyz"),  # not found
         ("SQL database SQL queries SQL", "SQL"),
+        ("abababababa", "ababa"),  # periodic pattern
+        ("project management and project manager", "project management"),
+        ("x", "xyz"),  # pattern lebih panjang dari text
+        ("résumé café résumé", "résumé"),  # non-ascii (posisi byte berbeda dengan posisi karakter)
+        ("ééé", "éé"),
     ]
     
-    bm = BoyerMooreMatcher()
+    # random text dengan alphabet kecil supaya banyak partial match
+    rng = random.Random(7)
+    for _ in range(300):
+        text = ''.join(rng.choice('ab c') for _ in range(rng.randint(0, 60)))
+        pattern = ''.join(rng.choice('ab c') for _ in range(rng.randint(1, 6)))
+        test_cases.append((text, pattern))
     
     print("=== BOYER-MOORE CONSISTENCY TEST ===")
     all_passed = True
     
-    for text, pattern in test_cases:
-        bm_result = bm.search(text, pattern)
-        naive_result = naive_search(text, pattern)
+    for variant in VARIANTS:
+        bm = BoyerMooreMatcher(variant)
+        failures = 0
         
-        print(f"Text: '{text}'")
-        print(f"Pattern: '{pattern}'")
-        print(f"BM Result: {bm_result}")
-        print(f"Naive Result: {naive_result}")
-        
-        if bm_result == naive_result:
-            print("✅ CONSISTENT")
-        else:
-            print("❌ INCONSISTENT!")
-            all_passed = False
+        for text, pattern in test_cases:
+            bm_result = bm.search(text, pattern)
+            naive_result = naive_search(text, pattern)
+            
+            # search_bytes harus sama dengan naive search di level byte (memoryview juga)
+            data = text.encode('utf-8')
+            naive_bytes = naive_search(data, pattern.encode('utf-8'))
+            bytes_result = bm.compile(pattern).search_bytes(memoryview(data))
+            if bytes_result != ({pattern: naive_bytes[pattern.encode('utf-8')]} if naive_bytes else {}):
+                failures += 1
+                print(f"❌ INCONSISTENT BYTES ({variant}): text='{text}' pattern='{pattern}' result={bytes_result}")
+            
+            if bm_result != naive_result:
+                failures += 1
+                print(f"❌ INCONSISTENT ({variant}): text='{text}' pattern='{pattern}'")
+                print(f"   BM Result: {bm_result}")
+                print(f"   Naive Result: {naive_result}")
         
-        print("-" * 40)
+        status = "✅ CONSISTENT" if failures == 0 else f"❌ {failures} INCONSISTENT"
+        print(f"{variant:9s} {status} ({len(test_cases)} cases)")
+        all_passed = all_passed and failures == 0
     
     return all_passed
 
@@ -136,4 +361,4 @@ if __name__ == "__main__":
     if success:
         print("🎉 Boyer-Moore implementation is CORRECT!")
     else:
-        print("❌ Boyer-Moore needs more fixes!")
\ No newline at end of file
+        print("❌ Boyer-Moore needs more fixes!")
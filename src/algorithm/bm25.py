@@ -0,0 +1,118 @@
+import heapq
+import math
+
+class BM25Scorer:
+    """okapi bm25: idf per keyword dan normalisasi panjang dokumen
+
+    semua statistik (document frequency, panjang dokumen, rata-rata panjang) sudah dihitung
+    sebelumnya dari postings, jadi skor dihitung O(postings) tanpa scan corpus tambahan
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1  # saturasi term frequency
+        self.b = b  # kekuatan normalisasi panjang dokumen (0 = tanpa normalisasi)
+
+    @staticmethod
+    def idf(df: int, n_docs: int) -> float:
+        """idf bm25 (varian lucene, selalu positif)"""
+        return math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+
+    def term_score(self, tf: int, idf: float, doc_length: int, avg_length: float) -> float:
+        """kontribusi satu keyword untuk satu dokumen"""
+        norm = 1.0 - self.b + self.b * doc_length / avg_length if avg_length > 0 else 1.0
+        return idf * tf * (self.k1 + 1.0) / (tf + self.k1 * norm)
+
+    def upper_bound(self, max_tf: int, idf: float) -> float:
+        """skor maksimum keyword di dokumen mana pun (tf tertinggi, panjang dokumen 0)"""
+        return idf * max_tf * (self.k1 + 1.0) / (max_tf + self.k1 * (1.0 - self.b))
+
+    def score_all(self, term_postings, doc_length, n_docs: int, avg_length: float) -> dict:
+        """skor bm25 lengkap semua dokumen, term_postings = list {doc: tf}"""
+        scores = {}
+        for postings in term_postings:
+            if not postings:
+                continue
+            idf = self.idf(len(postings), n_docs)
+            for doc, tf in postings.items():
+                scores[doc] = scores.get(doc, 0.0) + self.term_score(tf, idf, doc_length(doc), avg_length)
+        return scores
+
+    def top_k(self, term_postings, doc_length, n_docs: int, avg_length: float, k: int) -> dict:
+        """skor bm25 dengan early termination maxscore (term-at-a-time)
+
+        keyword diproses dari upper bound terbesar. begitu jumlah upper bound keyword yang tersisa
+        lebih kecil dari skor ke-k saat ini, dokumen baru tidak mungkin masuk top-k: postings sisa
+        hanya dipakai untuk melengkapi skor kandidat yang masih bisa menyusul. return {doc: skor}
+        yang pasti memuat top-k dengan skor lengkap
+        """
+        if k <= 0:
+            return {}
+
+        terms = []
+        for postings in term_postings:
+            if postings:
+                idf = self.idf(len(postings), n_docs)
+                terms.append((self.upper_bound(max(postings.values()), idf), idf, postings))
+        terms.sort(key=lambda term: term[0], reverse=True)
+
+        remaining = sum(bound for bound, _, _ in terms)
+        scores = {}
+        for bound, idf, postings in terms:
+            threshold = heapq.nlargest(k, scores.values())[-1] if len(scores) >= k else None
+            if threshold is not None and remaining < threshold:
+                # buang kandidat yang tidak bisa mencapai skor ke-k walau dapat semua upper bound sisa
+                scores = {doc: score for doc, score in scores.items() if score + remaining >= threshold}
+                for doc in scores:
+                    tf = postings.get(doc)
+                    if tf:
+                        scores[doc] += self.term_score(tf, idf, doc_length(doc), avg_length)
+            else:
+                for doc, tf in postings.items():
+                    scores[doc] = scores.get(doc, 0.0) + self.term_score(tf, idf, doc_length(doc), avg_length)
+            remaining -= bound
+
+        return scores
+
+# testing function
+def test_bm25():
+    """top-k dengan early termination harus sama dengan ranking skor lengkap"""
+    import random
+
+    print("=== BM25 TEST ===")
+    scorer = BM25Scorer()
+    all_passed = True
+
+    # dokumen pendek yang match semua keyword sekali mengalahkan dokumen panjang yang mengulang kata umum
+    lengths = {'short': 50, 'long': 2000, 'other': 300}
+    postings = [{'short': 1, 'long': 30}, {'short': 1}, {'short': 1, 'other': 2}]
+    scores = scorer.score_all(postings, lengths.get, 100, 300.0)
+    status = "✅" if scores['short'] > scores['long'] else "❌"
+    all_passed = all_passed and scores['short'] > scores['long']
+    print(f"{status} short cv ranked above long cv: {scores['short']:.3f} > {scores['long']:.3f}")
+
+    rng = random.Random(7)
+    for trial in range(200):
+        n_docs = rng.randint(1, 300)
+        lengths = {doc: rng.randint(1, 1000) for doc in range(n_docs)}
+        avg_length = sum(lengths.values()) / n_docs
+        term_postings = []
+        for _ in range(rng.randint(1, 6)):
+            docs = rng.sample(range(n_docs), rng.randint(0, n_docs))
+            term_postings.append({doc: rng.choice([1, 1, 1, 2, 3, 8, 25]) for doc in docs})
+
+        # urutan penjumlahan float berbeda, bandingkan skor yang dibulatkan
+        k = rng.randint(1, 20)
+        expected = heapq.nlargest(k, ((round(score, 9), -doc) for doc, score in scorer.score_all(term_postings, lengths.get, n_docs, avg_length).items()))
+        result = heapq.nlargest(k, ((round(score, 9), -doc) for doc, score in scorer.top_k(term_postings, lengths.get, n_docs, avg_length, k).items()))
+        if result != expected:
+            all_passed = False
+            print(f"❌ trial {trial}: top-{k} differs")
+
+    print(f"{'✅' if all_passed else '❌'} maxscore top-k equals full scoring (200 random trials)")
+    return all_passed
+
+if __name__ == "__main__":
+    if test_bm25():
+        print("✅ Test PASSED")
+    else:
+        print("❌ Test FAILED")
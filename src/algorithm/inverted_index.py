@@ -0,0 +1,306 @@
+import re
+from array import array
+from bisect import bisect_right
+
+# term = run karakter non-whitespace; keyword tanpa spasi selalu berada di dalam satu term
+TERM_PATTERN = re.compile(r'\S+')
+
+class InvertedIndex:
+    """inverted index term -> (doc, posisi) untuk exact keyword search tanpa scan ulang teks"""
+
+    def __init__(self):
+        self.postings = {}  # term: (array docs, array start positions), urut berdasarkan doc
+        self.doc_terms = {}  # doc: tuple distinct terms, dipakai saat remove
+        self.doc_lengths = {}  # doc: jumlah term dalam dokumen
+        self.total_length = 0  # jumlah doc_lengths, untuk rata-rata panjang dokumen (bm25)
+
+        # vocabulary blob untuk substring lookup, dibangun ulang lazy setelah index berubah
+        self._vocab_blob = None
+        self._vocab_terms = None
+        self._vocab_starts = None
+
+    @staticmethod
+    def is_indexable(keyword: str) -> bool:
+        """keyword tanpa whitespace bisa dijawab langsung dari postings"""
+        return bool(keyword) and TERM_PATTERN.fullmatch(keyword) is not None
+
+    def add_document(self, doc: int, text: str):
+        """tambahkan dokumen (doc harus integer yang lebih besar dari doc sebelumnya)"""
+        self.add_tokens(doc, ((match.group(), match.start()) for match in TERM_PATTERN.finditer(text)))
+
+    def add_tokens(self, doc: int, tokens):
+        """tambahkan dokumen dari pasangan (term, start position) yang sudah di-tokenize"""
+        if doc in self.doc_terms:
+            self.remove_document(doc)
+
+        distinct_terms = set()
+        length = 0
+
+        for term, start in tokens:
+            entry = self.postings.get(term)
+            if entry is None:
+                entry = (array('I'), array('I'))
+                self.postings[term] = entry
+            entry[0].append(doc)
+            entry[1].append(start)
+            distinct_terms.add(term)
+            length += 1
+
+        self.doc_terms[doc] = tuple(distinct_terms)
+        self.doc_lengths[doc] = length
+        self.total_length += length
+        self._vocab_blob = None
+
+    def remove_document(self, doc: int):
+        """hapus dokumen dari semua postings"""
+        terms = self.doc_terms.pop(doc, None)
+        if terms is None:
+            return
+
+        for term in terms:
+            docs, starts = self.postings[term]
+            keep = [i for i in range(len(docs)) if docs[i] != doc]
+            if keep:
+                self.postings[term] = (array('I', (docs[i] for i in keep)), array('I', (starts[i] for i in keep)))
+            else:
+                del self.postings[term]
+
+        self.total_length -= self.doc_lengths.pop(doc, 0)
+        self._vocab_blob = None
+
+    def average_length(self) -> float:
+        """rata-rata jumlah term per dokumen"""
+        return self.total_length / len(self.doc_lengths) if self.doc_lengths else 0.0
+
+    def _build_vocabulary(self):
+        """gabungkan semua term jadi satu string supaya substring lookup pakai str.find"""
+        self._vocab_terms = list(self.postings)
+        self._vocab_starts = []
+        parts = []
+        offset = 1  # blob diawali '\n'
+
+        for term in self._vocab_terms:
+            self._vocab_starts.append(offset)
+            parts.append(term)
+            offset += len(term) + 1
+
+        self._vocab_blob = '\n' + '\n'.join(parts) + '\n'
+
+    def _find_in_vocabulary(self, needle: str):
+        """cari semua kemunculan needle di vocabulary, yield (term index, offset dalam term)"""
+        if self._vocab_blob is None:
+            self._build_vocabulary()
+
+        blob = self._vocab_blob
+        pos = blob.find(needle)
+        while pos != -1:
+            term_idx = bisect_right(self._vocab_starts, pos) - 1
+            if term_idx >= 0:
+                yield term_idx, pos - self._vocab_starts[term_idx]
+            pos = blob.find(needle, pos + 1)
+
+    def lookup(self, keyword: str) -> dict:
+        """cari keyword (tanpa spasi) sebagai substring term, return {doc: [positions]}"""
+        if not self.is_indexable(keyword):
+            return {}
+
+        # kumpulkan offset keyword di setiap term yang mengandungnya
+        term_offsets = {}
+        for term_idx, offset in self._find_in_vocabulary(keyword):
+            term_offsets.setdefault(term_idx, []).append(offset)
+
+        results = {}
+        merged = set()  # doc yang dapat posisi dari lebih dari satu term, perlu di-sort ulang
+        for term_idx, offsets in term_offsets.items():
+            docs, starts = self.postings[self._vocab_terms[term_idx]]
+            exact_term = offsets == [0]
+            lo, count = 0, len(docs)
+
+            # postings urut berdasarkan doc, ambil posisi per doc dengan slicing
+            while lo < count:
+                doc = docs[lo]
+                hi = bisect_right(docs, doc, lo)
+                if exact_term:
+                    positions = starts[lo:hi].tolist()
+                else:
+                    positions = [start + offset for start in starts[lo:hi] for offset in offsets]
+
+                existing = results.get(doc)
+                if existing is None:
+                    results[doc] = positions
+                else:
+                    existing.extend(positions)
+                    merged.add(doc)
+                lo = hi
+
+        for doc in merged:
+            results[doc].sort()
+
+        return results
+
+    def lookup_docs(self, keyword: str) -> set:
+        """doc yang mengandung keyword (tanpa spasi) sebagai substring term, tanpa mengumpulkan posisi"""
+        if not self.is_indexable(keyword):
+            return set()
+
+        docs = set()
+        seen_terms = set()
+        for term_idx, _ in self._find_in_vocabulary(keyword):
+            if term_idx not in seen_terms:
+                seen_terms.add(term_idx)
+                docs.update(self.postings[self._vocab_terms[term_idx]][0])
+        return docs
+
+    def lookup_terms(self, terms) -> dict:
+        """gabungkan postings beberapa term utuh, return {doc: [positions]}"""
+        results = {}
+        for term in terms:
+            entry = self.postings.get(term)
+            if entry is None:
+                continue
+            docs, starts = entry
+            for i in range(len(docs)):
+                results.setdefault(docs[i], []).append(starts[i])
+
+        if len(terms) > 1:
+            for positions in results.values():
+                positions.sort()
+
+        return results
+
+    def _matching_terms(self, needle: str):
+        """term yang mengandung needle (needle boleh diapit '\n' sebagai anchor awal/akhir term)"""
+        seen_terms = set()
+        anchored_start = needle.startswith('\n')
+
+        for term_idx, _ in self._find_in_vocabulary(needle):
+            # anchor '\n' di depan menunjuk ke term berikutnya
+            if anchored_start:
+                term_idx += 1
+            if term_idx not in seen_terms and term_idx < len(self._vocab_terms):
+                seen_terms.add(term_idx)
+                yield self._vocab_terms[term_idx]
+
+    def phrase_lookup(self, phrase: str) -> dict:
+        """cari phrase multi-kata lewat posisi term di postings, return {doc: [positions]}"""
+        parts = phrase.split(' ')
+        if len(parts) == 1:
+            return self.lookup(phrase)
+
+        # teks sudah dinormalisasi jadi satu spasi antar term, phrase dengan whitespace lain tidak mungkin match
+        if not all(self.is_indexable(part) for part in parts):
+            return {}
+
+        # kata pertama = suffix sebuah term: simpan (awal phrase, akhir term) per doc
+        current = {}
+        for term in self._matching_terms(parts[0] + '\n'):
+            docs, starts = self.postings[term]
+            cut = len(term) - len(parts[0])
+            for i in range(len(docs)):
+                current.setdefault(docs[i], []).append((starts[i] + cut, starts[i] + len(term)))
+
+        # kata tengah = term utuh, kata terakhir = prefix term; term berikutnya selalu mulai di akhir + 1
+        last = len(parts) - 1
+        for index, part in enumerate(parts[1:], 1):
+            if not current:
+                return {}
+
+            terms = [part] if index < last else self._matching_terms('\n' + part)
+            next_starts = {}
+            for term in terms:
+                entry = self.postings.get(term)
+                if entry is None:
+                    continue
+                docs, starts = entry
+                for i in range(len(docs)):
+                    if docs[i] in current:
+                        next_starts.setdefault(docs[i], set()).add(starts[i])
+
+            extended = {}
+            for doc, occurrences in current.items():
+                doc_starts = next_starts.get(doc)
+                if not doc_starts:
+                    continue
+                kept = [(start, end + 1 + len(part)) for start, end in occurrences if end + 1 in doc_starts]
+                if kept:
+                    extended[doc] = kept
+            current = extended
+
+        return {doc: sorted(start for start, _ in occurrences) for doc, occurrences in current.items()}
+
+    def phrase_candidates(self, phrase: str) -> set:
+        """doc yang benar-benar mengandung phrase (diverifikasi lewat posisi term)"""
+        return set(self.phrase_lookup(phrase))
+
+    def __getstate__(self):
+        """vocabulary blob tidak ikut di-pickle, dibangun ulang saat dibutuhkan"""
+        state = self.__dict__.copy()
+        state['_vocab_blob'] = None
+        state['_vocab_terms'] = None
+        state['_vocab_starts'] = None
+        return state
+
+    def get_stats(self):
+        """statistik index untuk monitoring"""
+        return {
+            'documents': len(self.doc_terms),
+            'terms': len(self.postings),
+            'postings': sum(len(docs) for docs, _ in self.postings.values())
+        }
+
+# testing function
+def test_inverted_index():
+    """test lookup index harus sama dengan scan substring biasa"""
+    texts = [
+        "python developer with python, sql and java",
+        "javascript and node.js engineer",
+        "project management office; project manager",
+    ]
+
+    index = InvertedIndex()
+    for doc, text in enumerate(texts):
+        index.add_document(doc, text)
+
+    def naive_positions(text, keyword):
+        return [i for i in range(len(text) - len(keyword) + 1) if text[i:i + len(keyword)] == keyword]
+
+    print("=== INVERTED INDEX TEST ===")
+    all_passed = True
+
+    for keyword in ["python", "java", "node.js", "sql", "on", "project", "xyz"]:
+        expected = {}
+        for doc, text in enumerate(texts):
+            positions = naive_positions(text, keyword)
+            if positions:
+                expected[doc] = positions
+
+        result = index.lookup(keyword)
+        status = "✅" if result == expected else "❌"
+        all_passed = all_passed and result == expected and index.lookup_docs(keyword) == set(expected)
+        print(f"{status} {keyword}: {result}")
+
+    for phrase in ["project management", "ject manag", "python developer with", "and java", "manager office"]:
+        expected = {}
+        for doc, text in enumerate(texts):
+            positions = naive_positions(text, phrase)
+            if positions:
+                expected[doc] = positions
+
+        result = index.phrase_lookup(phrase)
+        status = "✅" if result == expected else "❌"
+        all_passed = all_passed and result == expected
+        print(f"{status} '{phrase}': {result}")
+
+    all_passed = all_passed and index.average_length() == sum(len(text.split()) for text in texts) / len(texts)
+
+    index.remove_document(0)
+    all_passed = all_passed and index.lookup("python") == {}
+    all_passed = all_passed and index.total_length == sum(len(text.split()) for text in texts[1:])
+
+    return all_passed
+
+if __name__ == "__main__":
+    if test_inverted_index():
+        print("✅ Test PASSED")
+    else:
+        print("❌ Test FAILED")
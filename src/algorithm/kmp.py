@@ -1,38 +1,23 @@
-class KMPMatcher:
-    def __init__(self):
-        self.pattern = None
-        self.lps = None
+from functools import lru_cache
+
+class CompiledKMP:
+    """pattern kmp yang sudah di-preprocess, bisa dipakai ulang untuk banyak teks"""
     
-    def _compute_lps(self, pattern):
-        """hitung longest prefix suffix array untuk pattern"""
-        length = len(pattern)
-        lps = [0] * length
-        prefix_len = 0
-        i = 1
-        
-        while i < length:
-            if pattern[i] == pattern[prefix_len]:
-                prefix_len += 1
-                lps[i] = prefix_len
-                i += 1
-            else:
-                if prefix_len != 0:
-                    prefix_len = lps[prefix_len - 1]
-                else:
-                    lps[i] = 0
-                    i += 1
+    def __init__(self, pattern, lps):
+        self.pattern = pattern
+        self.lps = lps
         
-        return lps
+        # versi utf-8 untuk search_bytes (lps dihitung ulang jika pattern bukan ascii)
+        self.pattern_bytes = pattern.encode('utf-8')
+        self.lps_bytes = lps if pattern.isascii() else KMPMatcher._compute_lps(self.pattern_bytes)
     
-    def search(self, text, pattern):
-        """cari pattern dalam text menggunakan algoritma kmp"""
+    def search(self, text):
+        """cari pattern dalam text menggunakan lps yang sudah dihitung"""
+        pattern = self.pattern
         if not pattern or not text:
             return {}
         
-        # preprocessing pattern
-        self.pattern = pattern
-        self.lps = self._compute_lps(pattern)
-        
+        lps = self.lps
         results = {}
         text_len = len(text)
         pattern_len = len(pattern)
@@ -52,15 +37,87 @@ class KMPMatcher:
                 results[pattern].append(i - j)
                 
                 # lanjut cari overlap
-                j = self.lps[j - 1]
+                j = lps[j - 1]
             elif i < text_len and (j == 0 or text[i] != pattern[j]):
                 if j != 0:
-                    j = self.lps[j - 1]
+                    j = lps[j - 1]
                 else:
                     i += 1
         
         return results
     
+    def search_bytes(self, data):
+        """cari pattern di bytes / memoryview utf-8, karakter dibandingkan sebagai integer; return posisi byte"""
+        pattern = self.pattern_bytes
+        if not pattern or not data:
+            return {}
+        
+        lps = self.lps_bytes
+        positions = []
+        text_len = len(data)
+        pattern_len = len(pattern)
+        
+        i = 0  # index untuk data
+        j = 0  # index untuk pattern
+        
+        while i < text_len:
+            if data[i] == pattern[j]:
+                i += 1
+                j += 1
+                if j == pattern_len:
+                    # pattern ditemukan, lanjut cari overlap
+                    positions.append(i - j)
+                    j = lps[j - 1]
+            elif j != 0:
+                j = lps[j - 1]
+            else:
+                i += 1
+        
+        return {self.pattern: positions} if positions else {}
+
+class KMPMatcher:
+    def __init__(self):
+        self.pattern = None
+        self.lps = None
+    
+    @staticmethod
+    def _compute_lps(pattern):
+        """hitung longest prefix suffix array untuk pattern"""
+        length = len(pattern)
+        lps = [0] * length
+        prefix_len = 0
+        i = 1
+        
+        while i < length:
+            if pattern[i] == pattern[prefix_len]:
+                prefix_len += 1
+                lps[i] = prefix_len
+                i += 1
+            else:
+                if prefix_len != 0:
+                    prefix_len = lps[prefix_len - 1]
+                else:
+                    lps[i] = 0
+                    i += 1
+        
+        return lps
+    
+    def compile(self, pattern):
+        """preprocess pattern sekali, hasilnya dipakai ulang lintas cv dan lintas query"""
+        return _compile_pattern(pattern)
+    
+    def search(self, text, pattern):
+        """cari pattern dalam text menggunakan algoritma kmp"""
+        if not pattern or not text:
+            return {}
+        
+        # preprocessing pattern (diambil dari cache jika sudah pernah)
+        compiled = self.compile(pattern)
+        self.pattern = compiled.pattern
+        self.lps = compiled.lps
+        
+        return compiled.search(text)
+    
     def search_multiple(self, text, patterns):
         """cari multiple patterns dalam text"""
         all_results = {}
@@ -72,4 +129,9 @@ class KMPMatcher:
                 if results:
                     all_results.update(results)
         
-        return all_results
\ No newline at end of file
+        return all_results
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern):
+    """compiled pattern disimpan di lru cache (maks 256 pattern terakhir)"""
+    return CompiledKMP(pattern, KMPMatcher._compute_lps(pattern))
\ No newline at end of file
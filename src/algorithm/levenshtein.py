@@ -1,14 +1,169 @@
+import re
+from collections import OrderedDict
+
+# kata = run karakter non-whitespace (sama dengan text.split())
+WORD_PATTERN = re.compile(r'\S+')
+
+def edit_distance(s1: str, s2: str, max_distance: int = None) -> int:
+    """levenshtein distance murni (metric, tanpa shortcut) dengan bit-parallel myers/hyyrö
+    
+    jika max_distance diberikan, berhenti lebih awal dan return max_distance + 1 begitu
+    distance pasti melebihi batas tersebut
+    """
+    # string yang lebih pendek jadi pattern (bit vector), distance simetris
+    if len(s1) > len(s2):
+        s1, s2 = s2, s1
+    m, n = len(s1), len(s2)
+    
+    if max_distance is not None and n - m > max_distance:
+        return max_distance + 1
+    if m == 0:
+        return n
+    
+    # peq[c] = bitmask posisi karakter c di pattern
+    peq = {}
+    for i, char in enumerate(s1):
+        peq[char] = peq.get(char, 0) | (1 << i)
+    
+    mask = (1 << m) - 1
+    high_bit = 1 << (m - 1)
+    pv = mask  # vertical delta +1
+    mv = 0  # vertical delta -1
+    score = m
+    
+    for j, char in enumerate(s2):
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        
+        # score = distance pattern penuh terhadap prefix text sampai kolom j
+        if ph & high_bit:
+            score += 1
+        elif mh & high_bit:
+            score -= 1
+        
+        # sisa kolom hanya bisa menurunkan score maksimal satu per kolom
+        if max_distance is not None and score - (n - 1 - j) > max_distance:
+            return max_distance + 1
+        
+        ph = (ph << 1) | 1
+        mh <<= 1
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv & mask
+    
+    if max_distance is not None and score > max_distance:
+        return max_distance + 1
+    return score
+
+def min_raw_similarity(threshold: float) -> float:
+    """skor mentah terkecil (sebelum scaling di LevenshteinMatcher.similarity) yang masih bisa mencapai threshold
+
+    scaling tidak monoton di 0.5 (0.5 -> 0.52, 0.5001 -> 0.5001), jadi setiap cabang dihitung terpisah
+    """
+    options = [max(0.5 + (threshold - 0.5) / 1.2, 0.5)]
+    if threshold <= 0.52:
+        options.append(max(0.3 + (threshold - 0.3) / 1.1, 0.3))
+    if threshold <= 0.3:
+        options.append(threshold)
+    return min(options)
+
+def edit_distance_dp(s1: str, s2: str) -> int:
+    """levenshtein distance dengan dua baris dp (referensi untuk test edit_distance)"""
+    if not s1:
+        return len(s2)
+    if not s2:
+        return len(s1)
+    
+    m, n = len(s1), len(s2)
+    
+    # gunakan dua baris saja untuk menghemat memory
+    prev_row = list(range(n + 1))
+    curr_row = [0] * (n + 1)
+    
+    for i in range(1, m + 1):
+        curr_row[0] = i
+        for j in range(1, n + 1):
+            if s1[i-1] == s2[j-1]:
+                curr_row[j] = prev_row[j-1]  # no operation needed
+            else:
+                curr_row[j] = 1 + min(
+                    prev_row[j],      # deletion
+                    curr_row[j-1],    # insertion
+                    prev_row[j-1]     # substitution
+                )
+        
+        # swap rows
+        prev_row, curr_row = curr_row, prev_row
+    
+    return prev_row[n]
+
+def _approximate_match_ends(pattern: str, text: str, start: int, end: int, max_distance: int) -> list:
+    """sellers/myers search: [(posisi akhir, distance)] untuk substring text[.. : posisi akhir + 1] dalam max_distance"""
+    m = len(pattern)
+    peq = {}
+    for i, char in enumerate(pattern):
+        peq[char] = peq.get(char, 0) | (1 << i)
+    
+    mask = (1 << m) - 1
+    high_bit = 1 << (m - 1)
+    pv = mask
+    mv = 0
+    score = m
+    ends = []
+    
+    for j in range(start, end):
+        eq = peq.get(text[j], 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        
+        if ph & high_bit:
+            score += 1
+        elif mh & high_bit:
+            score -= 1
+        if score <= max_distance:
+            ends.append((j, score))
+        
+        # baris 0 selalu 0: match boleh mulai di posisi mana saja (beda dengan edit_distance)
+        ph <<= 1
+        mh <<= 1
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv & mask
+    
+    return ends
+
+def _approximate_match_start(pattern: str, text: str, match_end: int, max_distance: int) -> int:
+    """cari posisi awal match yang berakhir di match_end (panjang match m - k sampai m + k)"""
+    m = len(pattern)
+    best_start, best_distance = max(0, match_end + 1 - m), max_distance + 1
+    
+    for length in range(max(1, m - max_distance), min(m + max_distance, match_end + 1) + 1):
+        start = match_end + 1 - length
+        distance = edit_distance(pattern, text[start:match_end + 1], max_distance)
+        if distance < best_distance:
+            best_start, best_distance = start, distance
+    
+    return best_start
+
 class LevenshteinMatcher:
     """implementasi levenshtein distance untuk fuzzy matching dengan optimasi dan sensitivity tinggi"""
     
-    def __init__(self):
-        self.cache = {}  # cache untuk memoization
+    def __init__(self, max_cache_size: int = 100000):
+        self.cache = OrderedDict()  # cache untuk memoization, dibatasi max_cache_size (lru)
+        self.max_cache_size = max_cache_size
     
-    def distance(self, s1: str, s2: str) -> int:
-        """hitung levenshtein distance antara dua string dengan optimasi"""
-        # cek cache
+    def distance(self, s1: str, s2: str, max_distance: int = None) -> int:
+        """hitung levenshtein distance antara dua string dengan optimasi
+        
+        dengan max_distance, hasil > max_distance berarti distance melebihi batas (bukan nilai persis)
+        """
+        # cek cache (hanya berisi distance persis)
         cache_key = (s1, s2)
         if cache_key in self.cache:
+            self.cache.move_to_end(cache_key)
             return self.cache[cache_key]
         
         # base cases
@@ -19,44 +174,59 @@ class LevenshteinMatcher:
         
         # quick check untuk exact match
         if s1 == s2:
-            self.cache[cache_key] = 0
+            self._cache_result(cache_key, 0)
             return 0
         
         # optimasi untuk string yang sangat berbeda panjangnya
         len_diff = abs(len(s1) - len(s2))
         if len_diff > min(len(s1), len(s2)):
             result = max(len(s1), len(s2))
-            self.cache[cache_key] = result
+            self._cache_result(cache_key, result)
             return result
         
-        # buat matrix dengan optimasi space
-        m, n = len(s1), len(s2)
-        
-        # gunakan dua baris saja untuk menghemat memory
-        prev_row = list(range(n + 1))
-        curr_row = [0] * (n + 1)
-        
-        for i in range(1, m + 1):
-            curr_row[0] = i
-            for j in range(1, n + 1):
-                if s1[i-1] == s2[j-1]:
-                    curr_row[j] = prev_row[j-1]  # no operation needed
-                else:
-                    curr_row[j] = 1 + min(
-                        prev_row[j],      # deletion
-                        curr_row[j-1],    # insertion
-                        prev_row[j-1]     # substitution
-                    )
-            
-            # swap rows
-            prev_row, curr_row = curr_row, prev_row
-        
-        result = prev_row[n]
-        self.cache[cache_key] = result
+        result = edit_distance(s1, s2, max_distance)
+        if max_distance is None or result <= max_distance:
+            self._cache_result(cache_key, result)
         return result
     
-    def similarity(self, s1: str, s2: str) -> float:
-        """hitung similarity score (0.0 - 1.0) antara dua string dengan precision tinggi"""
+    def _cache_result(self, cache_key, result):
+        """simpan hasil distance, buang entry paling lama jika cache penuh"""
+        self.cache[cache_key] = result
+        if len(self.cache) > self.max_cache_size:
+            self.cache.popitem(last=False)
+    
+    @staticmethod
+    def normalize_word(word: str) -> str:
+        """bersihkan word dari punctuation (alnum lowercase)"""
+        return ''.join(c for c in word if c.isalnum()).lower()
+    
+    @staticmethod
+    def tokenize(text: str):
+        """yield (clean word, start offset) untuk setiap kata di text, clean word = alnum lowercase"""
+        for match in WORD_PATTERN.finditer(text):
+            clean_word = LevenshteinMatcher.normalize_word(match.group())
+            if clean_word:
+                yield clean_word, match.start()
+    
+    @staticmethod
+    def max_distance_for(pattern: str, threshold: float) -> int:
+        """batas edit distance approximate search (keyword multi-kata) untuk threshold similarity (1 sampai 3 edit)"""
+        return max(1, min(3, round((1.0 - threshold) * len(pattern))))
+    
+    def match_vocabulary(self, pattern: str, vocabulary, threshold: float = 0.7) -> list:
+        """cari token vocabulary yang mirip dengan pattern, setiap token unik dinilai sekali"""
+        if not pattern:
+            return []
+        
+        pattern_lower = pattern.lower()
+        return [token for token in vocabulary if self.similarity(token, pattern_lower, threshold) >= threshold]
+    
+    def similarity(self, s1: str, s2: str, threshold: float = None) -> float:
+        """hitung similarity score (0.0 - 1.0) antara dua string dengan precision tinggi
+        
+        dengan threshold, edit distance berhenti lebih awal begitu skor pasti di bawah threshold:
+        skor yang >= threshold tetap persis, skor di bawahnya hanya dijamin < threshold
+        """
         if not s1 and not s2:
             return 1.0
         if not s1 or not s2:
@@ -74,17 +244,7 @@ class LevenshteinMatcher:
         if len(s1_lower) <= 3 or len(s2_lower) <= 3:
             return self._short_string_similarity(s1_lower, s2_lower)
         
-        # hitung distance
-        dist = self.distance(s1_lower, s2_lower)
         max_len = max(len(s1_lower), len(s2_lower))
-        min_len = min(len(s1_lower), len(s2_lower))
-        
-        # advanced similarity calculation dengan weighting
-        if max_len == 0:
-            return 1.0
-        
-        # base similarity dengan normalized levenshtein
-        base_sim = 1.0 - (dist / max_len)
         
         # bonus untuk common prefix/suffix
         prefix_bonus = self._get_prefix_bonus(s1_lower, s2_lower)
@@ -99,6 +259,18 @@ class LevenshteinMatcher:
         # bonus untuk character frequency similarity
         char_freq_bonus = self._get_char_frequency_bonus(s1_lower, s2_lower)
         
+        # bonus sudah diketahui, jadi edit distance terbesar yang masih bisa lolos threshold bisa dihitung
+        max_distance = None
+        if threshold is not None:
+            slack = 1.0 + prefix_bonus + suffix_bonus + substring_bonus + char_freq_bonus - length_penalty - min_raw_similarity(threshold)
+            max_distance = max(-1, int(slack * max_len + 1e-6))
+        
+        # hitung distance (di atas max_distance berarti pasti di bawah threshold)
+        dist = max_len if max_distance == -1 else self.distance(s1_lower, s2_lower, max_distance)
+        
+        # base similarity dengan normalized levenshtein
+        base_sim = 1.0 - (dist / max_len)
+        
         # final similarity dengan fine-tuning yang lebih sensitif
         final_sim = (base_sim + 
                     prefix_bonus + 
@@ -223,45 +395,93 @@ class LevenshteinMatcher:
                 i += 1
         return i == len(s1)
     
-    def search(self, text: str, pattern: str, threshold: float = 0.7) -> dict:
-        """cari pattern dalam text dengan fuzzy matching yang lebih sensitif"""
-        if not text or not pattern:
+    def search(self, text: str, pattern: str, threshold: float = 0.7, tokens=None) -> dict:
+        """cari pattern dalam text dengan fuzzy matching yang lebih sensitif
+        
+        tokens boleh diisi (clean word, start offset) yang sudah di-tokenize (misal dari token stream cv)
+        """
+        if not (text or tokens) or not pattern:
             return {}
         
-        results = {}
-        words = text.split()
         pattern_lower = pattern.lower()
+        if tokens is None:
+            # tokenize satu pass: posisi karakter langsung dari match regex, tidak dihitung ulang per kata
+            tokens = self.tokenize(text)
         
-        matches = []
-        scores = []  # simpan scores untuk debugging
+        positions = [start for clean_word, start in tokens if self.similarity(clean_word, pattern_lower, threshold) >= threshold]
         
-        for i, word in enumerate(words):
-            # bersihkan word dari punctuation
-            clean_word = ''.join(c for c in word if c.isalnum()).lower()
-            if not clean_word:
-                continue
-                
-            # hitung similarity dengan pattern
-            score = self.similarity(clean_word, pattern_lower)
-            scores.append((word, score))
-            
-            # gunakan threshold yang lebih strict
-            if score >= threshold:
-                matches.append(i)
-        
-        if matches:
-            # format hasil seperti algoritma lain (pattern: [positions])
-            positions = []
-            for word_idx in matches:
-                # hitung posisi karakter awal kata di text
-                char_pos = 0
-                for j in range(word_idx):
-                    char_pos += len(words[j]) + 1  # +1 for space
-                positions.append(char_pos)
-            
-            results[pattern] = positions
+        # format hasil seperti algoritma lain (pattern: [positions])
+        return {pattern: positions} if positions else {}
+    
+    def search_approximate(self, text: str, pattern: str, max_distance: int = None, threshold: float = 0.7) -> dict:
+        """cari semua posisi pattern (boleh multi-kata) di text dengan maksimal k edit, return {pattern: [positions]}"""
+        if not text or not pattern:
+            return {}
         
-        return results
+        text_lower = text.lower()
+        pattern_lower = pattern.lower()
+        m = len(pattern_lower)
+        if max_distance is None:
+            max_distance = self.max_distance_for(pattern_lower, threshold)
+        max_distance = min(max_distance, m - 1)  # k >= m berarti semua posisi match
+        
+        # filter pigeonhole: pattern dipecah k + s bagian, setiap match dalam k edit memuat minimal s bagian
+        # secara exact dengan posisi awal (diagonal) yang selisihnya tidak lebih dari 2k
+        # bagian 3 karakter lebih selektif, bagian 2 karakter hanya dipakai jika 3 karakter cuma menyisakan s = 1
+        required = m // 3 - max_distance
+        if required < 2:
+            required = max(1, m // 2 - max_distance)
+        pieces = max_distance + required
+        piece_len, extra = divmod(m, pieces)
+        hits = []
+        offset = 0
+        for piece_idx in range(pieces):
+            length = piece_len + (1 if piece_idx < extra else 0)
+            piece = pattern_lower[offset:offset + length]
+            pos = text_lower.find(piece)
+            while pos != -1:
+                hits.append((pos - offset, piece_idx))
+                pos = text_lower.find(piece, pos + 1)
+            offset += length
+        
+        hits.sort()
+        windows = []
+        hi = 0
+        for lo in range(len(hits)):
+            while hi < len(hits) and hits[hi][0] - hits[lo][0] <= 2 * max_distance:
+                hi += 1
+            if hi - lo >= required and len({piece_idx for _, piece_idx in hits[lo:hi]}) >= required:
+                windows.append((max(0, hits[lo][0] - max_distance), min(len(text_lower), hits[hi - 1][0] + m + max_distance)))
+        
+        if not windows:
+            return {}
+        
+        # gabungkan window yang overlap, lalu scan bit-parallel hanya di dalam window
+        windows.sort()
+        merged = [list(windows[0])]
+        for start, end in windows[1:]:
+            if start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        
+        ends = []
+        for start, end in merged:
+            ends.extend(_approximate_match_ends(pattern_lower, text_lower, start, end, max_distance))
+        
+        # posisi akhir berurutan = satu kemunculan, ambil akhir dengan distance terkecil
+        positions = []
+        best = None
+        for i, (match_end, distance) in enumerate(ends):
+            if best is not None and match_end != ends[i - 1][0] + 1:
+                positions.append(_approximate_match_start(pattern_lower, text_lower, best[0], max_distance))
+                best = None
+            if best is None or distance < best[1]:
+                best = (match_end, distance)
+        if best is not None:
+            positions.append(_approximate_match_start(pattern_lower, text_lower, best[0], max_distance))
+        
+        return {pattern: sorted(set(positions))} if positions else {}
     
     def search_multiple(self, text: str, patterns: list, threshold: float = 0.7) -> dict:
         """cari multiple patterns dalam text dengan fuzzy matching"""
@@ -294,7 +514,7 @@ class LevenshteinMatcher:
             if not clean_word:
                 continue
                 
-            score = self.similarity(clean_word, target_lower)
+            score = self.similarity(clean_word, target_lower, threshold)
             if score >= threshold:
                 word_scores.append((word, score))
         
@@ -305,16 +525,20 @@ class LevenshteinMatcher:
         return word_scores[:max_results]
     
     def get_suggestions(self, target: str, candidates: list, threshold: float = 0.6, max_suggestions: int = 5) -> list:
-        """dapatkan saran kata yang mirip dengan threshold sensitivity"""
+        """dapatkan saran kata yang mirip dengan threshold sensitivity (candidates: list kata atau SimilarityFilter)"""
         if not candidates or not target:
             return []
         
         target_lower = target.lower()
         suggestions = []
         
+        # similarity filter: hanya kata yang batas atas similarity-nya lolos threshold yang dinilai
+        if hasattr(candidates, 'candidates'):
+            candidates = candidates.candidates(target_lower, threshold)
+        
         for candidate in candidates:
             clean_candidate = ''.join(c for c in candidate if c.isalnum()).lower()
-            score = self.similarity(clean_candidate, target_lower)
+            score = self.similarity(clean_candidate, target_lower, threshold)
             if score >= threshold:
                 suggestions.append((candidate, score))
         
@@ -395,7 +619,85 @@ def test_levenshtein_sensitivity():
             match_status = "✓" if results else "✗"
             print(f"    {threshold:.2f}: {match_status}")
     
-    return True
+    # posisi harus offset karakter asli, termasuk setelah whitespace ganda
+    text = "skills:  pyton,\tjava   and  pythn"
+    result = matcher.search(text, "python", 0.7)
+    print(f"\nPositions: {result}")
+    return result == {"python": [9, 28]}
+
+def test_edit_distance():
+    """test edit distance bit-parallel harus sama dengan dp biasa, termasuk versi dengan batas"""
+    import random
+    
+    rng = random.Random(11)
+    all_passed = True
+    for _ in range(2000):
+        s1 = ''.join(rng.choice('abcd') for _ in range(rng.randint(0, 12)))
+        s2 = ''.join(rng.choice('abcd') for _ in range(rng.randint(0, 12)))
+        expected = edit_distance_dp(s1, s2)
+        all_passed = all_passed and edit_distance(s1, s2) == expected
+        
+        max_distance = rng.randint(0, 5)
+        bounded = expected if expected <= max_distance else max_distance + 1
+        all_passed = all_passed and edit_distance(s1, s2, max_distance) == bounded
+    
+    # pattern lebih panjang dari 64 karakter tetap benar (python int tidak terbatas)
+    long_word = "pneumonoultramicroscopicsilicovolcanoconiosis" * 2
+    all_passed = all_passed and edit_distance(long_word, long_word[::-1]) == edit_distance_dp(long_word, long_word[::-1])
+    
+    print(f"\n=== EDIT DISTANCE TEST ===\n{'✅' if all_passed else '❌'} bit-parallel vs dp (2000 random pairs)")
+    return all_passed
+
+def test_similarity_cutoff():
+    """similarity dengan threshold (edit distance dengan batas) harus memberi keputusan dan skor yang sama"""
+    import random
+    
+    rng = random.Random(7)
+    words = ["python", "pythonic", "node", "nodejs", "engineer", "engineering", "developer", "management", "managment"]
+    words += [''.join(rng.choice('aeimnoprst') for _ in range(rng.randint(1, 12))) for _ in range(400)]
+    
+    exact, bounded = LevenshteinMatcher(), LevenshteinMatcher()
+    all_passed = True
+    for pattern in ["python", "node", "engineer", "managment", "sql", "pattern"]:
+        for threshold in (0.5, 0.6, 0.7, 0.8, 0.9):
+            for word in words:
+                score = exact.similarity(word, pattern)
+                cutoff_score = bounded.similarity(word, pattern, threshold)
+                if (score >= threshold) != (cutoff_score >= threshold) or (score >= threshold and score != cutoff_score):
+                    all_passed = False
+                    print(f"❌ {word} vs {pattern} (threshold {threshold}): {score} vs {cutoff_score}")
+    
+    print(f"\n=== SIMILARITY CUTOFF TEST ===\n{'✅' if all_passed else '❌'} threshold cutoff vs full edit distance")
+    return all_passed
+
+def test_approximate_search():
+    """test approximate substring search terhadap brute force edit distance semua substring"""
+    import random
+    
+    matcher = LevenshteinMatcher()
+    all_passed = True
+    
+    result = matcher.search_approximate("skills: machine learning, deep learning", "machine lerning", 1)
+    print(f"\n=== APPROXIMATE SEARCH TEST ===\nmachine lerning: {result}")
+    all_passed = all_passed and result == {"machine lerning": [8]}
+    
+    # setiap kemunculan brute force (substring dalam k edit) harus tercakup satu posisi hasil search
+    rng = random.Random(5)
+    for _ in range(300):
+        text = ''.join(rng.choice('ab c') for _ in range(rng.randint(0, 40)))
+        pattern = ''.join(rng.choice('ab c') for _ in range(rng.randint(2, 10)))
+        k = rng.randint(0, 2)
+        found = matcher.search_approximate(text, pattern, k).get(pattern, [])
+        
+        hit_ends = {end for end in range(len(text)) for start in range(end + 1) if edit_distance_dp(pattern, text[start:end + 1]) <= min(k, len(pattern) - 1)}
+        all_passed = all_passed and bool(found) == bool(hit_ends)
+        all_passed = all_passed and all(any(edit_distance_dp(pattern, text[pos:end + 1]) <= k for end in hit_ends if end >= pos) for pos in found)
+    
+    print(f"{'✅' if all_passed else '❌'} approximate search vs brute force (300 random cases)")
+    return all_passed
 
 if __name__ == "__main__":
-    test_levenshtein_sensitivity()
\ No newline at end of file
+    print("✅ Sensitivity test PASSED" if test_levenshtein_sensitivity() else "❌ Sensitivity test FAILED")
+    print("✅ Edit distance test PASSED" if test_edit_distance() else "❌ Edit distance test FAILED")
+    print("✅ Similarity cutoff test PASSED" if test_similarity_cutoff() else "❌ Similarity cutoff test FAILED")
+    print("✅ Approximate search test PASSED" if test_approximate_search() else "❌ Approximate search test FAILED")
\ No newline at end of file
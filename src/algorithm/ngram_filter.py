@@ -0,0 +1,135 @@
+import numpy as np
+
+def _popcount(words):
+    """jumlah bit 1 per baris array uint64 (np.bitwise_count baru ada di numpy 2)"""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(words).sum(axis=-1, dtype=np.int64)
+    return np.unpackbits(np.ascontiguousarray(words).view(np.uint8), axis=-1).sum(axis=-1, dtype=np.int64)
+
+class NGramFilter:
+    """bitset trigram karakter per dokumen dalam satu matrix numpy uint64 (satu baris per doc)
+
+    dipakai sebagai prefilter sebelum scan teks: satu operasi AND + compare atas semua dokumen
+    menyingkirkan dokumen yang pasti tidak mengandung keyword (exact maupun dalam k edit)
+    """
+
+    N = 3  # trigram jauh lebih selektif dari bigram untuk teks cv (bigram umum hampir selalu ada)
+    BITS = 16384  # trigram di-hash ke 16384 bit = 256 word uint64 (2 KB) per dokumen
+    WORDS = BITS // 64
+
+    def __init__(self):
+        self.rows = np.zeros((0, self.WORDS), dtype=np.uint64)
+        self.count = 0  # jumlah baris terpakai (doc tertinggi + 1)
+
+    @classmethod
+    def _codes(cls, text: str):
+        """hash semua n-gram karakter di text (vectorized atas codepoint utf-32)"""
+        codepoints = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).astype(np.uint64)
+        count = len(codepoints) - cls.N + 1
+        if count <= 0:
+            return np.zeros(0, dtype=np.uint64)
+
+        codes = codepoints[:count].copy()
+        for offset in range(1, cls.N):
+            codes = codes * np.uint64(65599) + codepoints[offset:offset + count]
+        return codes % np.uint64(cls.BITS)
+
+    @classmethod
+    def _mask(cls, text: str):
+        """bitset n-gram dari text, return array uint64 sepanjang WORDS"""
+        mask = np.zeros(cls.WORDS, dtype=np.uint64)
+        codes = np.unique(cls._codes(text))
+        np.bitwise_or.at(mask, codes >> np.uint64(6), np.uint64(1) << (codes & np.uint64(63)))
+        return mask
+
+    def add(self, doc: int, text: str):
+        """set bitset n-gram dokumen (doc = integer slot)"""
+        if doc >= len(self.rows):
+            capacity = max(doc + 1, 2 * len(self.rows), 64)
+            rows = np.zeros((capacity, self.WORDS), dtype=np.uint64)
+            rows[:len(self.rows)] = self.rows
+            self.rows = rows
+        self.rows[doc] = self._mask(text)
+        self.count = max(self.count, doc + 1)
+
+    def remove(self, doc: int):
+        if doc < len(self.rows):
+            self.rows[doc] = 0
+
+    def candidates(self, keyword: str, max_distance: int = 0):
+        """doc yang mungkin mengandung keyword dalam max_distance edit, return array doc (urut)
+
+        q-gram lemma: satu edit merusak maksimal N n-gram, jadi dokumen harus memuat minimal
+        (jumlah n-gram berbeda keyword - N * k) n-gram keyword. k = 0 berarti semua n-gram harus ada
+        """
+        if len(keyword) < self.N:
+            return np.arange(self.count)
+
+        mask = self._mask(keyword)
+        required = int(_popcount(mask)) - self.N * max_distance
+        if required <= 0:
+            return np.arange(self.count)
+
+        # hanya kolom yang punya bit keyword yang perlu dibandingkan
+        columns = np.nonzero(mask)[0]
+        present = self.rows[:self.count, columns] & mask[columns]
+        if max_distance == 0:
+            return np.nonzero((present == mask[columns]).all(axis=1))[0]
+
+        return np.nonzero(_popcount(present) >= required)[0]
+
+    def __getstate__(self):
+        """hanya baris terpakai yang di-pickle"""
+        return {'rows': self.rows[:self.count].copy(), 'count': self.count}
+
+    def get_stats(self):
+        return {
+            'documents': self.count,
+            'bytes': self.count * self.WORDS * 8,
+        }
+
+# testing function
+def test_ngram_filter():
+    """prefilter tidak boleh membuang dokumen yang benar-benar match (exact maupun dalam k edit)"""
+    import random
+
+    def approximate_match(text, keyword, max_distance):
+        """dp sellers: baris 0 selalu 0 sehingga match boleh mulai di posisi mana saja"""
+        column = list(range(len(keyword) + 1))
+        for char in text:
+            previous, column[0] = column[0], 0
+            for i in range(1, len(keyword) + 1):
+                current = min(column[i] + 1, column[i - 1] + 1, previous + (keyword[i - 1] != char))
+                previous, column[i] = column[i], current
+            if column[-1] <= max_distance:
+                return True
+        return column[-1] <= max_distance
+
+    rng = random.Random(3)
+    texts = [''.join(rng.choice('abcde ') for _ in range(rng.randint(0, 80))) for _ in range(200)]
+    ngram_filter = NGramFilter()
+    for doc, text in enumerate(texts):
+        ngram_filter.add(doc, text)
+
+    all_passed = True
+    rejected = 0
+    for _ in range(100):
+        keyword = ''.join(rng.choice('abcde ') for _ in range(rng.randint(2, 8)))
+        for max_distance in (0, 1, 2):
+            candidates = set(ngram_filter.candidates(keyword, max_distance).tolist())
+            rejected += len(texts) - len(candidates)
+            for doc, text in enumerate(texts):
+                found = keyword in text if max_distance == 0 else approximate_match(text, keyword, max_distance)
+                if found and doc not in candidates:
+                    all_passed = False
+                    print(f"❌ doc {doc} dropped for '{keyword}' (k={max_distance})")
+
+    print("=== N-GRAM FILTER TEST ===")
+    print(f"{'✅' if all_passed else '❌'} no false negatives ({rejected} doc rejected by prefilter)")
+    return all_passed
+
+if __name__ == "__main__":
+    if test_ngram_filter():
+        print("✅ Test PASSED")
+    else:
+        print("❌ Test FAILED")
@@ -0,0 +1,202 @@
+import numpy as np
+try:
+    from algorithm.levenshtein import min_raw_similarity
+except ImportError:  # dijalankan langsung: python algorithm/similarity_filter.py
+    from levenshtein import min_raw_similarity
+
+def _bucket(char: str) -> int:
+    """bucket histogram karakter: digit 0-9, huruf a-z 10-35, karakter lain 36-39"""
+    code = ord(char)
+    if 48 <= code <= 57:
+        return code - 48
+    if 97 <= code <= 122:
+        return code - 87
+    return 36 + code % 4
+
+class SimilarityFilter:
+    """prefilter vocabulary untuk LevenshteinMatcher.similarity tanpa false negative
+
+    setiap kata disimpan sebagai histogram karakter, 4 karakter awal/akhir dan panjang dalam array numpy.
+    batas atas similarity dihitung vectorized untuk semua kata sekaligus: bonus prefix/suffix dan
+    penalty panjang dihitung persis, edit distance dibatasi bawah oleh bag distance histogram, bonus
+    substring dan frekuensi karakter memakai nilai maksimumnya. hanya kata yang batas atasnya lolos
+    threshold yang dinilai similarity() penuh, jadi hasilnya sama dengan scan seluruh vocabulary
+
+    sengaja linear (satu operasi numpy per kolom, bukan bk-tree / deletion dictionary): bonus prefix, suffix,
+    substring dan frekuensi karakter bisa menambah skor sampai ~0.72, sehingga kata yang lolos threshold 0.7
+    bisa berjarak lebih dari separuh panjangnya. index berbasis batas edit distance yang sound akan memeriksa
+    hampir seluruh vocabulary, sedangkan batas yang lebih ketat kehilangan match (node -> nodejs, sql -> mysql)
+    """
+
+    BUCKETS = 40
+    EDGE = 4  # prefix/suffix bonus similarity melihat maksimal 4 karakter
+
+    def __init__(self):
+        self.words = []
+        self.nodes = {}  # kata -> baris
+        self.lengths = np.zeros(0, dtype=np.int32)
+        self.histograms = np.zeros((0, self.BUCKETS), dtype=np.uint16)
+        self.prefixes = np.zeros((0, self.EDGE), dtype=np.int32)  # codepoint, -1 jika kata lebih pendek
+        self.suffixes = np.zeros((0, self.EDGE), dtype=np.int32)  # dibaca dari belakang
+
+    @classmethod
+    def _histogram(cls, word: str):
+        histogram = np.zeros(cls.BUCKETS, dtype=np.int32)
+        for char in word:
+            histogram[_bucket(char)] += 1
+        return histogram
+
+    @classmethod
+    def _edges(cls, word: str):
+        prefix = [ord(char) for char in word[:cls.EDGE]]
+        suffix = [ord(char) for char in word[::-1][:cls.EDGE]]
+        pad = [-1] * cls.EDGE
+        return (prefix + pad)[:cls.EDGE], (suffix + pad)[:cls.EDGE]
+
+    def add(self, word: str) -> bool:
+        """tambahkan kata ke vocabulary, return False jika sudah ada"""
+        if not word or word in self.nodes:
+            return False
+
+        row = len(self.words)
+        if row >= len(self.lengths):
+            capacity = max(2 * len(self.lengths), 1024)
+            for name in ('lengths', 'histograms', 'prefixes', 'suffixes'):
+                old = getattr(self, name)
+                grown = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+                grown[:len(old)] = old
+                setattr(self, name, grown)
+
+        self.words.append(word)
+        self.nodes[word] = row
+        self.lengths[row] = len(word)
+        self.histograms[row] = np.minimum(self._histogram(word), np.iinfo(np.uint16).max)
+        self.prefixes[row], self.suffixes[row] = self._edges(word)
+        return True
+
+    @staticmethod
+    def _common_run(edges, pattern_edges):
+        """panjang run karakter sama dari awal (prefix) atau dari belakang (suffix), maksimal EDGE"""
+        equal = (edges == np.asarray(pattern_edges, dtype=np.int32)) & (edges >= 0)
+        return np.cumprod(equal, axis=1).sum(axis=1)
+
+    def candidates(self, pattern: str, threshold: float) -> list:
+        """kata yang mungkin punya similarity(kata, pattern) >= threshold (superset hasil sebenarnya)"""
+        pattern = pattern.lower().strip()
+        count = len(self.words)
+        if not pattern or count == 0:
+            return []
+
+        m = len(pattern)
+        n = self.lengths[:count].astype(np.float64)
+        longest = np.maximum(n, m)
+        histograms = self.histograms[:count].astype(np.int32)
+        pattern_histogram = self._histogram(pattern)
+
+        # jalur string pendek (salah satu <= 3 karakter): common chars / panjang terpanjang + bonus maks 0.4
+        present = np.nonzero(pattern_histogram)[0]
+        common = histograms[:, present].sum(axis=1)
+        short_ok = common / longest + 0.4 >= threshold - 1e-9
+
+        # jalur normal: batas atas skor mentah sebelum scaling
+        diff = histograms - pattern_histogram
+        distance = np.maximum(np.maximum(diff, 0).sum(axis=1), np.maximum(-diff, 0).sum(axis=1))
+        distance = np.maximum(distance, np.abs(n - m))
+
+        prefix_edges, suffix_edges = self._edges(pattern)
+        common_prefix = self._common_run(self.prefixes[:count], prefix_edges)
+        common_suffix = self._common_run(self.suffixes[:count], suffix_edges)
+        prefix_bonus = common_prefix / 4 * 0.2 * np.where(common_prefix >= 3, 1.5, 1.0)
+        suffix_bonus = common_suffix / 3 * 0.1 * np.where(common_suffix >= 2, 1.3, 1.0)
+        substring_bonus = np.minimum(5, n) / longest * 0.15
+        length_penalty = np.abs(n - m) / longest * 0.15
+
+        raw = 1.0 - distance / longest + prefix_bonus + suffix_bonus + substring_bonus + 0.1 - length_penalty
+        long_ok = raw >= min_raw_similarity(threshold) - 1e-9
+
+        is_short = (n <= 3) | (m <= 3)
+        keep = np.where(is_short, short_ok, long_ok)
+        words = self.words
+        return [words[row] for row in np.nonzero(keep)[0].tolist()]
+
+    def __contains__(self, word):
+        return word in self.nodes
+
+    def __len__(self):
+        return len(self.words)
+
+    def __getstate__(self):
+        """hanya baris terpakai yang di-pickle"""
+        count = len(self.words)
+        return {
+            'words': self.words,
+            'lengths': self.lengths[:count].copy(),
+            'histograms': self.histograms[:count].copy(),
+            'prefixes': self.prefixes[:count].copy(),
+            'suffixes': self.suffixes[:count].copy(),
+        }
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.nodes = {word: row for row, word in enumerate(self.words)}
+
+# testing function
+def test_similarity_filter():
+    """kandidat prefilter + similarity harus sama persis dengan scan seluruh vocabulary"""
+    import random
+    try:
+        from algorithm.levenshtein import LevenshteinMatcher
+    except ImportError:  # dijalankan langsung: python algorithm/similarity_filter.py
+        from levenshtein import LevenshteinMatcher
+
+    print("=== SIMILARITY FILTER TEST ===")
+    matcher = LevenshteinMatcher()
+    all_passed = True
+
+    # pasangan yang diterima similarity() walau edit distance-nya besar relatif terhadap panjang kata
+    for pattern, word, threshold in [("node", "nodejs", 0.7), ("sql", "mysql", 0.7), ("engineer", "engineering", 0.7),
+                                     ("develop", "developer", 0.8), ("python", "pythonic", 0.8)]:
+        vocabulary = SimilarityFilter()
+        for candidate in (word, "unrelated", "xyz"):
+            vocabulary.add(candidate)
+        found = word in matcher.match_vocabulary(pattern, vocabulary.candidates(pattern, threshold), threshold)
+        all_passed = all_passed and found
+        print(f"{'✅' if found else '❌'} {pattern} -> {word} (threshold {threshold})")
+
+    rng = random.Random(11)
+    stems = ["develop", "engineer", "manage", "python", "sql", "node", "analyst", "account", "data", "c"]
+    words = set()
+    for _ in range(3000):
+        if rng.random() < 0.5:
+            word = rng.choice(stems)
+            for _ in range(rng.randint(0, 4)):
+                position = rng.randint(0, len(word))
+                word = word[:position] + rng.choice('abcdeginorst0') + word[position + 1 if rng.random() < 0.5 else position:]
+        else:
+            word = ''.join(rng.choice('abcdeilmnoprst19') for _ in range(rng.randint(1, 14)))
+        words.add(word)
+
+    vocabulary = SimilarityFilter()
+    for word in words:
+        vocabulary.add(word)
+
+    checked = pruned = 0
+    for pattern in stems + ["managment", "analysys", "c++", "node.js", "pyton", "ab"]:
+        for threshold in (0.5, 0.6, 0.7, 0.8, 0.9):
+            candidates = vocabulary.candidates(pattern, threshold)
+            expected = sorted(matcher.match_vocabulary(pattern, words, threshold))
+            result = sorted(matcher.match_vocabulary(pattern, candidates, threshold))
+            checked += 1
+            pruned += len(words) - len(candidates)
+            if result != expected:
+                all_passed = False
+                print(f"❌ {pattern} (threshold {threshold}): missing {sorted(set(expected) - set(result))[:5]}")
+
+    print(f"{'✅' if all_passed else '❌'} prefilter equals full vocabulary scan ({checked} queries, {pruned // checked} of {len(words)} words pruned per query)")
+    return all_passed
+
+if __name__ == "__main__":
+    if test_similarity_filter():
+        print("✅ Test PASSED")
+    else:
+        print("❌ Test FAILED")
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Benchmark full-corpus search latency for ATS CV Search
+Runs SearchController.search_cvs against a warm corpus index without PostgreSQL.
+
+Latency target (full corpus, warm index, INDEX algorithm):
+    p95 <= 300 ms per query for 2,500 CVs
+KMP/BM/AC scan every candidate CV with the selected matcher, their p95 is reported only.
+
+Usage:
+    uv run benchmark_search.py                  # synthetic corpus, 2,500 CVs
+    uv run benchmark_search.py --docs 100000    # synthetic corpus, 100k CVs
+    uv run benchmark_search.py --real           # real CVs from data/ (uses text cache)
+    uv run benchmark_search.py --matchers       # KMP vs Boyer-Moore variants vs Aho-Corasick (str and bytes) on real CV texts
+"""
+
+import os
+import sys
+import time
+import random
+import tempfile
+import argparse
+from contextlib import contextmanager
+from pathlib import Path
+
+LATENCY_TARGET_MS = 300  # p95 algoritma INDEX untuk 2,500 cv
+TARGET_ALGORITHM = 'INDEX'
+
+COMMON_WORDS = (
+    "the and of to in with for on as by at from experience team management customer service "
+    "sales project data skills responsible company business support development professional "
+    "work training system office client reports financial years manager including staff "
+    "operations communication process quality marketing planning analysis performance"
+).split()
+
+SKILL_WORDS = (
+    "python java sql excel javascript react node.js c++ accounting payroll budgeting auditing "
+    "tableau powerbi sap quickbooks photoshop illustrator autocad linux docker kubernetes aws "
+    "azure salesforce agile scrum leadership negotiation recruiting nursing teaching cooking"
+).split()
+
+QUERIES = [
+    ["python"],
+    ["accounting", "excel"],
+    ["project management"],
+    ["customer service", "sales", "leadership"],
+    ["kubernetes", "docker", "aws", "linux", "python", "java", "sql", "react", "agile", "scrum"],
+    ["c++", "node.js"],
+]
+
+# pattern panjang untuk membandingkan matcher (boyer-moore unggul di pattern panjang)
+MATCHER_PATTERNS = ["project management", "customer service", "communication skills", "microsoft office", "python"]
+
+def generate_synthetic_text(rng: random.Random, length_words: int) -> str:
+    """buat teks cv sintetis dengan distribusi kata mirip cv asli (zipf-like)"""
+    words = []
+    for _ in range(length_words):
+        roll = rng.random()
+        if roll < 0.75:
+            words.append(COMMON_WORDS[int(rng.paretovariate(1.2)) % len(COMMON_WORDS)])
+        elif roll < 0.9:
+            words.append(SKILL_WORDS[int(rng.paretovariate(1.0)) % len(SKILL_WORDS)])
+        else:
+            # kata unik / jarang (nama, angka, istilah khusus)
+            words.append(''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(3, 10))))
+    return ' '.join(words)
+
+class BenchmarkRepository:
+    """pengganti ResumeRepository untuk ResumeCatalog supaya benchmark tidak butuh database"""
+
+    def __init__(self, resumes):
+        self.resumes = resumes
+
+    def get_catalog_state(self):
+        return len(self.resumes), None, None
+
+    def get_resume_rows(self, updated_since=None):
+        return [(resume.id, resume.category, resume.file_path, resume.name, resume.phone, resume.birthdate, resume.address)
+                for resume in self.resumes]
+
+def build_synthetic_corpus(controller, num_docs: int, work_dir: str, seed: int = 42):
+    """buat resume sintetis + file placeholder, teks langsung dimasukkan ke cache extractor"""
+    from database.models import Resume
+
+    rng = random.Random(seed)
+    docs_dir = os.path.join(work_dir, 'docs')
+    os.makedirs(docs_dir, exist_ok=True)
+
+    resumes = []
+    for i in range(num_docs):
+        resume_id = f"SYN{i:06d}"
+        file_path = os.path.join(docs_dir, f"{resume_id}.pdf")
+        with open(file_path, 'w') as file:
+            file.write(resume_id)
+
+        text = generate_synthetic_text(rng, rng.randint(150, 700))
+        controller.pdf_extractor.text_cache[file_path] = text
+        resumes.append(Resume(id=resume_id, category='SYNTHETIC', file_path=file_path))
+
+    return resumes
+
+def load_real_corpus(limit=None):
+    """ambil resume dari folder data/ (teks diekstrak sekali lalu tersimpan di text cache)"""
+    from database.models import Resume
+
+    data_dir = Path(__file__).parent.parent / "data"
+    resumes = []
+    for pdf_file in sorted(data_dir.glob("*/*.pdf")):
+        resumes.append(Resume(id=pdf_file.stem, category=pdf_file.parent.name, file_path=str(pdf_file.resolve())))
+        if limit and len(resumes) >= limit:
+            break
+    return resumes
+
+def percentile(values, pct):
+    """percentile sederhana (nearest rank)"""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+@contextmanager
+def quiet():
+    """matikan log per-search supaya tidak mengganggu timing"""
+    real_stdout = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        yield
+    finally:
+        sys.stdout.close()
+        sys.stdout = real_stdout
+
+def run_search_benchmark(controller, resumes, algorithms, repeats, scoring='COUNT'):
+    """jalankan semua query terhadap index yang sudah warm, return {algorithm: [latency ms]}"""
+    from database.catalog import ResumeCatalog
+
+    controller.catalog = ResumeCatalog(BenchmarkRepository(resumes))
+    # query diulang beberapa kali, query cache dimatikan supaya yang diukur memang search-nya
+    cache_budget = controller.query_cache.max_bytes
+    controller.query_cache.max_bytes = 0
+
+    # query pertama membangun index (cold), tidak dihitung dalam latency
+    start = time.perf_counter()
+    with quiet():
+        controller.search_cvs(QUERIES[0], algorithm='KMP', top_n=10)
+    print(f"🏗️  index warm-up: {(time.perf_counter() - start) * 1000:.0f}ms")
+
+    latencies = {}
+    for algorithm in algorithms:
+        for keywords in QUERIES:
+            for _ in range(repeats):
+                with quiet():
+                    start = time.perf_counter()
+                    results, _ = controller.search_cvs(keywords, algorithm=algorithm, top_n=10, scoring=scoring)
+                    elapsed = (time.perf_counter() - start) * 1000
+                latencies.setdefault(algorithm, []).append(elapsed)
+            print(f"   {algorithm:5s} {', '.join(keywords)[:60]:60s} {elapsed:8.1f}ms  ({len(results)} results)")
+
+    # latency query berulang yang dijawab dari cache (hanya dilaporkan)
+    controller.query_cache.max_bytes = cache_budget
+    with quiet():
+        controller.search_cvs(QUERIES[1], algorithm='KMP', top_n=10, scoring=scoring)
+        start = time.perf_counter()
+        controller.search_cvs(QUERIES[1], algorithm='KMP', top_n=10, scoring=scoring)
+        elapsed = (time.perf_counter() - start) * 1000
+    print(f"⚡ repeated query (cache hit): {elapsed:.1f}ms, cache stats: {controller.query_cache.get_stats()}")
+
+    return latencies
+
+def char_positions(results, data):
+    """ubah posisi byte hasil search_bytes jadi posisi karakter supaya bisa dibandingkan dengan search str"""
+    return {pattern: [len(bytes(data[:pos]).decode('utf-8')) for pos in positions] for pattern, positions in results.items()}
+
+def run_matcher_benchmark(texts, patterns):
+    """bandingkan naive, kmp, varian boyer-moore dan aho-corasick (str dan bytes) pada teks cv asli, hasil harus identik"""
+    from algorithm.kmp import KMPMatcher
+    from algorithm.bm import BoyerMooreMatcher, VARIANTS, naive_search
+    from algorithm.aho_corasick import AhoCorasick
+
+    matchers = {'naive': lambda pattern: (lambda text: naive_search(text, pattern)),
+                'kmp': lambda pattern: KMPMatcher().compile(pattern).search}
+    for variant in VARIANTS:
+        matchers[f'bm-{variant}'] = lambda pattern, variant=variant: BoyerMooreMatcher(variant).compile(pattern).search
+    matchers['ac'] = lambda pattern: AhoCorasick([pattern]).compile().search
+
+    # varian bytes memindai memoryview utf-8 (seperti slice corpus pack), di-encode di luar timing
+    byte_matchers = {'kmp': lambda pattern: KMPMatcher().compile(pattern).search_bytes}
+    for variant in VARIANTS:
+        byte_matchers[f'bm-{variant}'] = lambda pattern, variant=variant: BoyerMooreMatcher(variant).compile(pattern).search_bytes
+    byte_matchers['ac'] = lambda pattern: AhoCorasick([pattern]).compile().search_bytes
+    datas = [memoryview(text.encode('utf-8')) for text in texts]
+
+    print(f"{'pattern':24s}" + ''.join(f"{name:>14s}" for name in matchers) + ''.join(f"{name + '/b':>14s}" for name in byte_matchers))
+    all_consistent = True
+    for pattern in patterns:
+        row = f"{pattern:24s}"
+        expected = None
+        for name, factory in matchers.items():
+            search = factory(pattern)
+            start = time.perf_counter()
+            results = [search(text) for text in texts]
+            elapsed = (time.perf_counter() - start) * 1000
+            if expected is None:
+                expected = results
+            all_consistent = all_consistent and results == expected
+            row += f"{elapsed:12.1f}ms"
+        for name, factory in byte_matchers.items():
+            search = factory(pattern)
+            start = time.perf_counter()
+            results = [search(data) for data in datas]
+            elapsed = (time.perf_counter() - start) * 1000
+            all_consistent = all_consistent and [char_positions(result, data) for result, data in zip(results, datas)] == expected
+            row += f"{elapsed:12.1f}ms"
+        print(row)
+
+    print("✅ all matchers consistent" if all_consistent else "❌ matcher results differ")
+    return all_consistent
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark full-corpus CV search latency')
+    parser.add_argument('--docs', type=int, default=2500, help='number of synthetic CVs (default 2500)')
+    parser.add_argument('--real', action='store_true', help='use real CVs from data/ instead of synthetic text')
+    parser.add_argument('--repeats', type=int, default=3, help='runs per query per algorithm')
+    parser.add_argument('--algorithms', default='INDEX,KMP,BM,AC', help='comma separated exact algorithms')
+    parser.add_argument('--scoring', default='COUNT', help='ranking mode: COUNT or BM25')
+    parser.add_argument('--matchers', action='store_true', help='compare KMP and Boyer-Moore variants on real CV texts')
+    args = parser.parse_args()
+
+    if args.matchers:
+        sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+        from utils.pdf_extractor import PDFExtractor, SKIPPED_TEXTS
+
+        extractor = PDFExtractor()
+        texts = [extractor.extract_text_for_matching(resume.file_path) for resume in load_real_corpus()]
+        texts = [text for text in texts if text and text not in SKIPPED_TEXTS]
+        extractor.shutdown()
+
+        print(f"=== MATCHER BENCHMARK: {len(texts)} real cv texts ===")
+        sys.exit(0 if run_matcher_benchmark(texts, MATCHER_PATTERNS) else 1)
+
+    work_dir = tempfile.mkdtemp(prefix='ats_bench_')
+    if not args.real:
+        # index dan text cache sintetis jangan sampai menimpa cache asli
+        os.environ['ATS_CACHE_DIR'] = os.path.join(work_dir, 'cache')
+
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from controller.search import SearchController
+
+    controller = SearchController()
+    controller.full_corpus = True
+
+    if args.real:
+        resumes = load_real_corpus()
+    else:
+        resumes = build_synthetic_corpus(controller, args.docs, work_dir)
+
+    print(f"=== SEARCH BENCHMARK: {len(resumes)} cvs ({'real' if args.real else 'synthetic'}) ===")
+
+    latencies = run_search_benchmark(controller, resumes, args.algorithms.split(','), args.repeats, args.scoring)
+    controller.shutdown()
+
+    print()
+    for algorithm, values in latencies.items():
+        print(f"📊 {algorithm:5s} p50 = {percentile(values, 50):.1f}ms, p95 = {percentile(values, 95):.1f}ms, "
+              f"max = {max(values):.1f}ms over {len(values)} queries")
+
+    # target resmi berlaku untuk algoritma INDEX pada 2,500 cv; algoritma scan dan corpus lebih besar hanya dilaporkan
+    if TARGET_ALGORITHM in latencies and len(resumes) <= 2500:
+        p95 = percentile(latencies[TARGET_ALGORITHM], 95)
+        if p95 <= LATENCY_TARGET_MS:
+            print(f"✅ {TARGET_ALGORITHM} within latency target (p95 <= {LATENCY_TARGET_MS}ms)")
+        else:
+            print(f"❌ {TARGET_ALGORITHM} latency target missed (p95 <= {LATENCY_TARGET_MS}ms)")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
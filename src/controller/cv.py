@@ -17,6 +17,12 @@ class CVController:
         self.pdf_extractor = PDFExtractor()
         self.regex_extractor = RegexExtractor()
     
+    def _existing_file_path(self, resume) -> Optional[str]:
+        """path file cv yang benar-benar ada, lokasi baru dicari lewat repository hanya jika file tidak ditemukan"""
+        if os.path.isfile(resume.file_path):
+            return resume.file_path
+        return self.repo.revalidate_path(resume.id)
+    
     def get_cv_text(self, resume_id: str) -> Optional[str]:
         """ambil teks cv untuk pattern matching"""
         resume = self.repo.get_resume_by_id(resume_id)
@@ -60,9 +66,11 @@ class CVController:
     def open_cv_file(self, resume_id: str) -> bool:
         """buka file cv dengan aplikasi default - improved Linux support"""
         resume = self.repo.get_resume_by_id(resume_id)
-        if not resume or not os.path.exists(resume.file_path):
+        file_path = self._existing_file_path(resume) if resume else None
+        if not file_path:
             print(f"❌ cv file not found for resume {resume_id}")
             return False
+        resume.file_path = file_path
         
         try:
             print(f"📄 opening cv file: {resume.file_path}")
@@ -142,7 +150,7 @@ class CVController:
         if not resume:
             return False
         
-        return os.path.exists(resume.file_path) and os.path.isfile(resume.file_path)
+        return self._existing_file_path(resume) is not None
     
     def get_cv_preview(self, resume_id: str, max_length: int = 500) -> Optional[str]:
         """get preview text dari cv untuk quick view"""
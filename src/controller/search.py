@@ -1,98 +1,180 @@
 # src/controller/search.py
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from database.models import SearchResult, SearchTimingInfo
-from database.repo import ResumeRepository
-from utils.pdf_extractor import PDFExtractor
+from database.catalog import ResumeCatalog
+from utils.pdf_extractor import PDFExtractor, SKIPPED_TEXTS
 from utils.timer import SearchTimer
+from utils.corpus_index import CorpusIndex
+from utils.query_cache import QueryCache
+from utils.pack_scanner import PackScanner, matching_view
 from algorithm.kmp import KMPMatcher
 from algorithm.bm import BoyerMooreMatcher
 from algorithm.aho_corasick import AhoCorasick
 from algorithm.levenshtein import LevenshteinMatcher
+from algorithm.inverted_index import InvertedIndex
+from algorithm.bm25 import BM25Scorer
+import heapq
+import threading
 import time
 
+class SearchCancelled(BaseException):
+    """dilempar saat search dibatalkan lewat cancel_search(); BaseException supaya tidak tertelan except Exception"""
+
 class SearchController:
     """controller untuk operasi pencarian cv dengan algoritma yang tepat"""
     
+    PARTIAL_INTERVAL = 0.1  # detik antar publish hasil sementara selama exact scan
+    PARALLEL_MIN_CVS = 200  # kandidat minimal sebelum exact scan dibagi ke worker process
+    
     def __init__(self):
-        self.repo = ResumeRepository()
+        self.catalog = ResumeCatalog.shared()  # resume di memory, di-refresh inkremental dari database
         self.pdf_extractor = PDFExtractor()
+        self.pack_scanner = PackScanner()  # exact scan corpus pack di process pool (mmap, tanpa pickle teks)
         self.timer = SearchTimer()
+        self.corpus_index = CorpusIndex()  # persistent inverted index untuk keyword satu kata
+        self.query_cache = QueryCache(max_bytes=16 * 1024 * 1024)  # hasil query berulang, di-invalidate lewat versi index
+        self._synced_catalog = None  # (versi catalog, jumlah resume) terakhir yang sudah di-sync ke corpus index
         
         # initialize matchers
         self.kmp_matcher = KMPMatcher()
         self.bm_matcher = BoyerMooreMatcher()
-        self.aho_corasick = AhoCorasick()
         self.levenshtein_matcher = LevenshteinMatcher()
+        self.bm25_scorer = BM25Scorer()
         
         # progress callback
         self.progress_callback = None
+        self.partial_results_callback = None  # dipanggil dengan top-n sementara setiap tahap/batch selesai
+        self._cancel_event = threading.Event()
         
-        # performance settings - MUCH SMALLER LIMITS FOR SPEED
-        self.max_cvs_to_process = 30  # reduced from 50 to 30 for faster results
+        # performance settings
+        # full corpus mode: semua cv kandidat dari inverted index discan, tanpa cap jumlah cv / early exit
+        self.full_corpus = True
+        self.max_cvs_to_process = 30  # hanya dipakai jika full_corpus = False
         self.batch_size = 5  # smaller batches for better progress updates
     
     def set_progress_callback(self, callback):
         """set callback function untuk progress updates"""
         self.progress_callback = callback
     
+    def set_partial_results_callback(self, callback):
+        """set callback untuk top-n sementara selama search berjalan"""
+        self.partial_results_callback = callback
+    
+    def cancel_search(self):
+        """batalkan search yang sedang berjalan (aman dipanggil dari thread lain)
+        
+        untuk membatalkan request yang mungkin belum mulai, set cancel_event yang dikirim ke search_cvs
+        """
+        self._cancel_event.set()
+    
+    def _check_cancelled(self):
+        if self._cancel_event.is_set():
+            raise SearchCancelled()
+    
+    def _publish_partial(self, resumes, keyword_counts, top_n, fuzzy_keys, scoring):
+        """kirim top-n sementara ke partial_results_callback"""
+        if self.partial_results_callback:
+            self.partial_results_callback(self._rank_top_results(resumes, keyword_counts, top_n, fuzzy_keys, scoring))
+    
     def search_cvs(self, keywords: List[str], algorithm: str = 'KMP', 
-                   top_n: int = 10, fuzzy_threshold: float = 0.7) -> Tuple[List[SearchResult], str]:
-        """pencarian cv dengan exact dan fuzzy matching yang optimal"""
+                   top_n: int = 10, fuzzy_threshold: float = 0.7, scoring: str = 'COUNT',
+                   cancel_event: Optional[threading.Event] = None) -> Tuple[List[SearchResult], str]:
+        """pencarian cv dengan exact dan fuzzy matching yang optimal
+        
+        scoring: 'COUNT' (rank berdasarkan total match) atau 'BM25' (relevansi dengan idf dan normalisasi panjang cv)
+        cancel_event: event pembatalan milik request ini, dibuat pemanggil sebelum search diserahkan ke thread lain
+        (tanpa event dibuat event baru); raise SearchCancelled jika event di-set selama search berjalan
+        """
         
-        print(f"🔍 starting search: keywords={keywords}, algorithm={algorithm}, threshold={fuzzy_threshold}")
+        print(f"🔍 starting search: keywords={keywords}, algorithm={algorithm}, threshold={fuzzy_threshold}, scoring={scoring}")
         
         # reset timer
         self.timer.reset()
+        # event tidak pernah di-clear di sini, cancel yang datang sebelum search mulai tetap berlaku
+        self._cancel_event = cancel_event if cancel_event is not None else threading.Event()
+        self._check_cancelled()
         
-        # ambil semua resume
-        all_resumes = self.repo.get_all_resumes()
+        # ambil semua resume dari catalog di memory (database hanya dicek perubahannya)
+        all_resumes = self.catalog.resumes()
         if not all_resumes:
             return [], "no cvs found in database"
         
-        # limit resumes for performance
-        resumes = all_resumes[:self.max_cvs_to_process]
-        print(f"📄 processing {len(resumes)} resumes (limited from {len(all_resumes)} total)")
+        if self.full_corpus:
+            resumes = all_resumes
+            print(f"📄 processing all {len(resumes)} resumes (full corpus)")
+        else:
+            # limit resumes for performance
+            resumes = all_resumes[:self.max_cvs_to_process]
+            print(f"📄 processing {len(resumes)} resumes (limited from {len(all_resumes)} total)")
+        
+        # index hanya di-sync saat catalog berubah, query berikutnya (termasuk cache hit) tidak menyentuh filesystem
+        catalog_state = (self.catalog.version, len(resumes))
+        if catalog_state != self._synced_catalog:
+            self.corpus_index.sync(resumes, self.pdf_extractor, self.progress_callback, self._check_cancelled)
+            self._synced_catalog = catalog_state
+        self._check_cancelled()
+        
+        # query yang sama pada versi corpus yang sama langsung dijawab dari cache
+        self.timer.start_cache_lookup(algorithm)
+        cache_key = QueryCache.make_key(keywords, algorithm, fuzzy_threshold, top_n, scoring, len(resumes))
+        # data resume (nama, kontak) ikut di hasil, jadi cache juga dibuang saat catalog berubah
+        cache_version = (self.catalog.version, self.corpus_index.version)
+        cached_results = self.query_cache.get(cache_key, cache_version)
+        self.timer.stop_cache_lookup(cached_results is not None, self.query_cache.get_stats())
+        if cached_results is not None:
+            print(f"⚡ query cache hit, returning {len(cached_results)} results")
+            return cached_results, self.timer.get_search_summary()
         
         # jika user pilih levenshtein sebagai algoritma utama
         if algorithm.upper() == 'LEVENSHTEIN':
             print("🔍 using levenshtein as primary algorithm")
             self.timer.start_fuzzy_search(len(keywords))
-            results = self._fuzzy_search(resumes, keywords, fuzzy_threshold)
+            fuzzy_counts = self._fuzzy_search(
+                resumes, keywords, fuzzy_threshold,
+                lambda counts: self._publish_partial(resumes, counts, top_n, set(counts), scoring)
+            )
             self.timer.stop_fuzzy_search()
             
-            # sort and return
-            results.sort(key=lambda x: x.total_matches, reverse=True)
-            top_results = results[:top_n]
+            # top-n lewat heap, SearchResult hanya dibuat untuk hasil akhir
+            top_results = self._rank_top_results(resumes, fuzzy_counts, top_n, set(fuzzy_counts), scoring)
+            self.query_cache.put(cache_key, cache_version, top_results)
             timing_summary = self.timer.get_search_summary()
             
             print(f"🎯 levenshtein search completed with {len(top_results)} results")
             return top_results, timing_summary
         
-        # untuk exact matching algorithms (KMP, BM, AC)
+        # untuk exact matching algorithms (KMP, BM, AC) dan INDEX (postings tanpa scan)
         self.timer.start_exact_search(algorithm, len(resumes))
-        exact_results = self._exact_search_batched(resumes, keywords, algorithm)
+        keyword_counts = self._exact_search_batched(
+            resumes, keywords, algorithm,
+            lambda counts: self._publish_partial(resumes, counts, top_n, (), scoring)
+        )
         self.timer.stop_exact_search()
         
-        print(f"✅ exact search completed with {len(exact_results)} matches")
+        exact_matched = self._count_matched_resumes(keyword_counts)
+        print(f"✅ exact search completed with {exact_matched} matches")
         
         # fuzzy matching sebagai fallback jika ada keyword yang tidak ketemu
-        unfound_keywords = self._get_unfound_keywords(exact_results, keywords)
+        unfound_keywords = self._get_unfound_keywords(keyword_counts, keywords)
+        fuzzy_keys = set()
         
-        if unfound_keywords and len(exact_results) < top_n:
+        if unfound_keywords and exact_matched < top_n:
             print(f"🔍 starting fuzzy fallback for: {unfound_keywords}")
+            # hasil exact sudah bisa ditampilkan selama fuzzy fallback berjalan
+            self._publish_partial(resumes, keyword_counts, top_n, (), scoring)
             self.timer.start_fuzzy_search(len(unfound_keywords))
-            # limit fuzzy search to fewer CVs
-            fuzzy_resumes = resumes[:200]  # only search top 200 for fuzzy
-            fuzzy_results = self._fuzzy_search(fuzzy_resumes, unfound_keywords, fuzzy_threshold)
+            fuzzy_counts = self._fuzzy_search(
+                resumes, unfound_keywords, fuzzy_threshold,
+                lambda counts: self._publish_partial(resumes, {**keyword_counts, **counts}, top_n, set(counts), scoring)
+            )
             self.timer.stop_fuzzy_search()
-            combined_results = self._combine_results(exact_results, fuzzy_results)
-            print(f"✅ fuzzy fallback completed. total results: {len(combined_results)}")
-        else:
-            combined_results = exact_results
+            keyword_counts.update(fuzzy_counts)
+            fuzzy_keys.update(fuzzy_counts)
+            print(f"✅ fuzzy fallback completed. total results: {self._count_matched_resumes(keyword_counts)}")
         
-        # sort by total matches
-        combined_results.sort(key=lambda x: x.total_matches, reverse=True)
-        top_results = combined_results[:top_n]
+        # top-n lewat heap berukuran top_n, bukan sort semua hasil
+        top_results = self._rank_top_results(resumes, keyword_counts, top_n, fuzzy_keys, scoring)
+        self.query_cache.put(cache_key, cache_version, top_results)
         timing_summary = self.timer.get_search_summary()
         
         # show extraction stats
@@ -102,184 +184,325 @@ class SearchController:
         print(f"🎯 returning top {len(top_results)} results")
         return top_results, timing_summary
 
-    def _exact_search_batched(self, resumes, keywords, algorithm):
-        """exact matching dengan batch processing untuk performance"""
-        results = []
+    def _exact_search_batched(self, resumes, keywords, algorithm, on_batch=None):
+        """exact matching dengan batch processing, return {keyword: {resume id: jumlah match}}
+        
+        index hanya dipakai sebagai prefilter kandidat cv, jumlah match selalu dihitung algoritma terpilih (KMP/BM/AC)
+        on_batch dipanggil dengan count map sementara (paling sering sekali per PARTIAL_INTERVAL)
+        """
+        if algorithm.upper() == 'INDEX':
+            return self._index_counts(resumes, keywords)
+        
+        # cv yang tidak mengandung keyword menurut index pasti tidak match, tidak perlu discan
+        candidates = {}
+        for keyword in keywords:
+            keyword_lower = keyword.lower().strip()
+            if not keyword_lower or keyword_lower in candidates:
+                continue
+            
+            if InvertedIndex.is_indexable(keyword_lower):
+                candidates[keyword_lower] = self.corpus_index.lookup_candidates(keyword_lower)
+            else:
+                candidates[keyword_lower] = self.corpus_index.phrase_candidates(keyword_lower)
+        
+        keyword_counts = {keyword: {} for keyword in keywords if keyword.lower().strip()}
+        
+        candidate_ids = set()
+        for hits in candidates.values():
+            candidate_ids.update(hits)
+        resumes = [resume for resume in resumes if resume.id in candidate_ids]
+        self.timer.set_scanned_cvs(0)
+        if not resumes:
+            return keyword_counts
+        
+        # pattern / automaton di-compile sekali per query, bukan per cv
+        compiled_patterns = self._compile_patterns(list(candidates), algorithm)
+        
+        # corpus besar discan paralel di worker process, sisanya (cv di luar corpus pack) lanjut di thread ini
+        scanned_resumes = 0
+        if self.full_corpus and self.pack_scanner.is_parallel() and len(resumes) >= self.PARALLEL_MIN_CVS:
+            scanned_resumes, resumes = self._scan_pack_parallel(resumes, candidates, compiled_patterns, keyword_counts, on_batch)
+        
+        matched_resumes = 0
         total_resumes = len(resumes)
+        last_publish = time.perf_counter()
         
-        for batch_start in range(0, total_resumes, self.batch_size):
-            batch_end = min(batch_start + self.batch_size, total_resumes)
-            batch_resumes = resumes[batch_start:batch_end]
+        # teks diambil langsung dari corpus pack (lihat _matching_data), tidak perlu ekstraksi pdf
+        for start in range(0, total_resumes, self.batch_size):
+            self._check_cancelled()
+            batch_resumes = resumes[start:start + self.batch_size]
             
             # update progress
             if self.progress_callback:
-                progress = int((batch_start / total_resumes) * 100)
-                self.progress_callback(f"Processing batch {batch_start//self.batch_size + 1} ({progress}%)")
+                progress = int((start / total_resumes) * 100)
+                self.progress_callback(f"Processing batch {start//self.batch_size + 1} ({progress}%)")
             
-            batch_results = self._process_resume_batch(batch_resumes, keywords, algorithm)
-            results.extend(batch_results)
+            matched_resumes += self._process_resume_batch(batch_resumes, keywords, algorithm, keyword_counts, candidates, compiled_patterns)
+            self.timer.set_scanned_cvs(scanned_resumes + start + len(batch_resumes))
             
-            # early termination if we have enough good results
-            if len(results) >= 50:  # enough results for top_n selection
+            # early termination if we have enough good results (hanya mode terbatas)
+            if not self.full_corpus and matched_resumes >= 50:
                 break
+            
+            # partial result dibatasi waktu supaya ranking sementara tidak dihitung ulang setiap batch
+            if on_batch and time.perf_counter() - last_publish >= self.PARTIAL_INTERVAL:
+                on_batch(keyword_counts)
+                last_publish = time.perf_counter()
         
-        return results
+        return keyword_counts
 
-    def _process_resume_batch(self, batch_resumes, keywords, algorithm):
-        """process a batch of resumes"""
-        batch_results = []
+    def _scan_pack_parallel(self, resumes, candidates, compiled_patterns, keyword_counts, on_batch=None):
+        """scan cv yang teksnya ada di corpus pack lewat PackScanner, count dicatat ke keyword_counts
+        
+        return (jumlah cv yang sudah discan, resume yang tidak ada di pack dan harus discan di thread ini)
+        """
+        pack = self.corpus_index.corpus_pack
+        jobs = []
+        remaining = []
+        for resume in resumes:
+            if resume.id in pack:
+                jobs.append((resume.id, tuple(keyword for keyword, hits in candidates.items() if resume.id in hits)))
+            else:
+                remaining.append(resume)
+        
+        # count worker per keyword lowercase, dicatat ke semua keyword asli yang sama setelah lowercase
+        original_keywords = {}
+        for keyword in keyword_counts:
+            original_keywords.setdefault(keyword.lower().strip(), []).append(keyword)
+        
+        scanned = 0
+        last_publish = time.perf_counter()
+        self._check_cancelled()
+        for chunk_size, counts in self.pack_scanner.scan(pack, jobs, compiled_patterns):
+            self._check_cancelled()
+            for keyword_lower, hits in counts.items():
+                for keyword in original_keywords.get(keyword_lower, ()):
+                    keyword_counts[keyword].update(hits)
+            
+            scanned += chunk_size
+            self.timer.set_scanned_cvs(scanned)
+            if self.progress_callback:
+                self.progress_callback(f"Scanning corpus ({int(scanned / len(jobs) * 100)}%)")
+            if on_batch and time.perf_counter() - last_publish >= self.PARTIAL_INTERVAL:
+                on_batch(keyword_counts)
+                last_publish = time.perf_counter()
+        
+        return scanned, remaining
+
+    def _index_counts(self, resumes, keywords):
+        """algoritma INDEX: jumlah match langsung dari postings inverted index, tanpa scan teks"""
+        keyword_counts = {keyword: {} for keyword in keywords if keyword.lower().strip()}
+        resume_ids = {resume.id for resume in resumes}
+        matches = {}
+        
+        for keyword, counts in keyword_counts.items():
+            keyword_lower = keyword.lower().strip()
+            if keyword_lower not in matches:
+                # keyword satu kata dari postings, phrase multi-kata dari posisi term yang berurutan
+                if InvertedIndex.is_indexable(keyword_lower):
+                    matches[keyword_lower] = self.corpus_index.lookup(keyword_lower)
+                else:
+                    matches[keyword_lower] = self.corpus_index.phrase_lookup(keyword_lower)
+            
+            for resume_id, positions in matches[keyword_lower].items():
+                if resume_id in resume_ids:
+                    counts[resume_id] = len(positions)
+        
+        return keyword_counts
+    
+    def _compile_patterns(self, scan_keywords, algorithm):
+        """compile keyword yang perlu discan, return {keyword: compiled pattern}"""
+        if algorithm.upper() == 'AC':
+            # satu automaton untuk semua keyword, dijalankan sekali per cv
+            automaton = AhoCorasick(scan_keywords).compile()
+            return {keyword: automaton for keyword in scan_keywords}
+        
+        matcher = self.bm_matcher if algorithm.upper() == 'BM' else self.kmp_matcher
+        return {keyword: matcher.compile(keyword) for keyword in scan_keywords}
+
+    def _process_resume_batch(self, batch_resumes, keywords, algorithm, keyword_counts, candidates=None, compiled_patterns=None):
+        """process a batch of resumes, jumlah match dicatat ke keyword_counts; return jumlah resume yang match
+        
+        candidates: {keyword: set resume id} dari index, cv di luar set tidak discan untuk keyword tersebut
+        """
+        matched_resumes = 0
+        candidates = candidates or {}
+        
+        if compiled_patterns is None:
+            scan_keywords = {kw.lower().strip() for kw in keywords} - {''}
+            compiled_patterns = self._compile_patterns(sorted(scan_keywords), algorithm)
         
         for resume in batch_resumes:
             try:
-                cv_text = self.pdf_extractor.extract_text_for_matching(resume.file_path)
-                if not cv_text or cv_text in ["large file skipped", "failed file skipped", "timeout skipped", "too many pages skipped", "no text extracted"]:
-                    continue
-                
-                keyword_matches = {}
-                total_matches = 0
-                matched_keywords = []
+                cv_data = None  # diambil hanya jika ada keyword yang perlu discan
+                scanned = {}  # compiled pattern -> hasil scan pada cv ini
+                matched = False
                 
                 for keyword in keywords:
                     keyword_lower = keyword.lower().strip()
                     if not keyword_lower:
                         continue
                     
-                    # pilih algoritma
-                    matches = {}
-                    if algorithm.upper() == 'KMP':
-                        positions = self.kmp_matcher.search(cv_text, keyword_lower)
-                        if positions:
-                            matches[keyword_lower] = positions
-                    elif algorithm.upper() == 'BM':
-                        positions = self.bm_matcher.search(cv_text, keyword_lower)
-                        if positions:
-                            matches[keyword_lower] = positions
-                    elif algorithm.upper() == 'AC':
-                        matches = self.aho_corasick.search_multiple(cv_text, [keyword_lower])
-                    else:
-                        # default to KMP
-                        positions = self.kmp_matcher.search(cv_text, keyword_lower)
-                        if positions:
-                            matches[keyword_lower] = positions
+                    if keyword_lower in candidates and resume.id not in candidates[keyword_lower]:
+                        continue
+                    
+                    if cv_data is None:
+                        cv_data = self._matching_data(resume)
+                    if not cv_data:
+                        continue
+                    
+                    # automaton aho-corasick dipakai bersama semua keyword, cukup discan sekali per cv
+                    compiled = compiled_patterns[keyword_lower]
+                    matches = scanned.get(compiled)
+                    if matches is None:
+                        matches = compiled.search_bytes(cv_data)
+                        scanned[compiled] = matches
+                    positions = matches.get(keyword_lower, [])
                     
                     # count matches
-                    if matches and keyword_lower in matches:
-                        match_count = len(matches[keyword_lower])
-                        keyword_matches[keyword] = match_count
-                        total_matches += match_count
-                        matched_keywords.append(keyword)
+                    if positions:
+                        keyword_counts.setdefault(keyword, {})[resume.id] = len(positions)
+                        matched = True
                 
-                # add to results if has matches
-                if total_matches > 0:
-                    result = SearchResult(
-                        resume=resume,
-                        keyword_matches=keyword_matches,
-                        total_matches=total_matches,
-                        matched_keywords=matched_keywords
-                    )
-                    batch_results.append(result)
+                if matched:
+                    matched_resumes += 1
                     
             except Exception as e:
                 print(f"⚠️ error processing {resume.id}: {e}")
                 continue
         
-        return batch_results
+        return matched_resumes
 
-    def _fuzzy_search(self, resumes, keywords, threshold):
-        """fuzzy matching dengan limits untuk performance"""
-        results = []
-        total_resumes = min(len(resumes), 100)  # limit fuzzy search
-        limited_resumes = resumes[:total_resumes]
+    def _matching_data(self, resume):
+        """teks lowercase terpotong (utf-8) untuk exact matcher, slice zero-copy dari corpus pack (fallback ke extractor)"""
+        view = self.corpus_index.text_view(resume.id)
+        if view is not None:
+            return matching_view(view)
         
-        for idx, resume in enumerate(limited_resumes):
+        cv_text = self.pdf_extractor.extract_text_for_matching(resume.file_path)
+        if not cv_text or cv_text in SKIPPED_TEXTS:
+            return b""
+        return cv_text.encode('utf-8')
+
+    def _fuzzy_search(self, resumes, keywords, threshold, on_keyword=None):
+        """fuzzy matching lewat vocabulary corpus, return {"<keyword> (fuzzy)": {resume id: jumlah match}}
+        
+        on_keyword dipanggil dengan count map sementara setiap satu keyword selesai
+        """
+        resume_ids = {resume.id for resume in resumes}
+        fuzzy_counts = {}
+        
+        for idx, keyword in enumerate(keywords):
+            keyword_lower = keyword.lower().strip()
+            if not keyword_lower:
+                continue
+            
+            self._check_cancelled()
+            
             # progress update
-            if self.progress_callback and idx % 20 == 0:
-                progress = int((idx / total_resumes) * 100)
-                self.progress_callback(f"Fuzzy matching CV {idx+1}/{total_resumes} ({progress}%)")
+            if self.progress_callback:
+                self.progress_callback(f"Fuzzy matching '{keyword}' ({idx+1}/{len(keywords)})")
             
             try:
-                cv_text = self.pdf_extractor.extract_text(resume.file_path)
-                if not cv_text or cv_text in ["large file skipped", "failed file skipped", "timeout skipped", "too many pages skipped", "no text extracted"]:
-                    continue
-                
-                fuzzy_matches = {}
-                total_fuzzy_matches = 0
-                matched_keywords = []
+                if ' ' in keyword_lower:
+                    # keyword multi-kata: approximate substring search langsung di teks cv,
+                    # hanya cv yang lolos prefilter trigram (q-gram lemma) yang discan
+                    max_distance = self.levenshtein_matcher.max_distance_for(keyword_lower, threshold)
+                    candidate_ids = self.corpus_index.scan_candidates(keyword_lower, max_distance)
+                    counts = fuzzy_counts.setdefault(f"{keyword} (fuzzy)", {})
+                    for resume in resumes:
+                        if resume.id not in candidate_ids:
+                            continue
+                        self._check_cancelled()
+                        stream = self.corpus_index.token_stream(resume.id)
+                        if stream is None:
+                            continue
+                        matches = self.levenshtein_matcher.search_approximate(stream.text, keyword_lower, max_distance)
+                        if matches:
+                            counts[resume.id] = len(matches[keyword_lower])
+                else:
+                    # kandidat prefilter dinilai similarity-nya, yang lolos di-expand ke resume lewat postings
+                    candidates = self.corpus_index.fuzzy_candidates(keyword_lower, threshold)
+                    similar_words = self.levenshtein_matcher.match_vocabulary(keyword_lower, candidates, threshold)
+                    counts = fuzzy_counts.setdefault(f"{keyword} (fuzzy)", {})
+                    for resume_id, positions in self.corpus_index.fuzzy_lookup(similar_words).items():
+                        if resume_id in resume_ids:
+                            counts[resume_id] = len(positions)
                 
-                for keyword in keywords:
-                    keyword_lower = keyword.lower().strip()
-                    if not keyword_lower:
-                        continue
-                    
-                    # use levenshtein matcher
-                    matches = self.levenshtein_matcher.search(cv_text, keyword_lower, threshold)
-                    
-                    if matches and keyword_lower in matches:
-                        match_count = len(matches[keyword_lower])
-                        fuzzy_key = f"{keyword} (fuzzy)"
-                        fuzzy_matches[fuzzy_key] = match_count
-                        total_fuzzy_matches += match_count
-                        matched_keywords.append(fuzzy_key)
-                
-                # add to results if has fuzzy matches
-                if total_fuzzy_matches > 0:
-                    result = SearchResult(
-                        resume=resume,
-                        keyword_matches=fuzzy_matches,
-                        total_matches=total_fuzzy_matches,
-                        matched_keywords=matched_keywords,
-                        fuzzy_matches=fuzzy_matches
-                    )
-                    results.append(result)
+                if on_keyword:
+                    on_keyword(fuzzy_counts)
                     
             except Exception as e:
-                print(f"⚠️ error in fuzzy search for {resume.id}: {e}")
+                print(f"⚠️ error in fuzzy search for '{keyword}': {e}")
                 continue
         
-        return results
+        return fuzzy_counts
+
+    def get_suggestions(self, keyword: str, max_suggestions: int = 5) -> List[str]:
+        """saran kata ("did you mean") dari vocabulary corpus"""
+        keyword_lower = keyword.lower().strip()
+        threshold = 0.6  # sama dengan default LevenshteinMatcher.get_suggestions
+        candidates = self.corpus_index.fuzzy_candidates(keyword_lower, threshold)
+        return self.levenshtein_matcher.get_suggestions(keyword_lower, candidates, threshold, max_suggestions)
 
-    def _get_unfound_keywords(self, results, original_keywords):
+    def _get_unfound_keywords(self, keyword_counts, original_keywords):
         """get keywords yang tidak ditemukan dalam exact search"""
-        found_keywords = set()
-        
-        for result in results:
-            found_keywords.update(result.matched_keywords)
-        
-        unfound = []
-        for keyword in original_keywords:
-            if keyword not in found_keywords:
-                unfound.append(keyword)
-        
-        return unfound
+        return [keyword for keyword in original_keywords if not keyword_counts.get(keyword)]
+
+    def _count_matched_resumes(self, keyword_counts):
+        """jumlah resume berbeda yang match minimal satu keyword"""
+        matched = set()
+        for counts in keyword_counts.values():
+            matched.update(counts)
+        return len(matched)
 
-    def _combine_results(self, exact_results, fuzzy_results):
-        """combine exact dan fuzzy search results"""
-        combined_dict = {}
+    def _rank_top_results(self, resumes, keyword_counts, top_n, fuzzy_keys=(), scoring='COUNT'):
+        """pilih top_n resume dengan heap berukuran top_n atas tuple (score, resume idx),
+        SearchResult hanya dibuat untuk hasil akhir; skor sama diurutkan sesuai urutan resume"""
+        use_bm25 = scoring.upper() == 'BM25'
+        if use_bm25:
+            # df = jumlah cv yang di-rank yang mengandung keyword, panjang cv dari index (tanpa scan corpus)
+            scores = self.bm25_scorer.top_k(
+                list(keyword_counts.values()), self.corpus_index.document_length,
+                len(resumes), self.corpus_index.average_document_length(), top_n
+            )
+        else:
+            scores = {}
+            for counts in keyword_counts.values():
+                for resume_id, count in counts.items():
+                    scores[resume_id] = scores.get(resume_id, 0) + count
         
-        # add exact results
-        for result in exact_results:
-            combined_dict[result.resume.id] = result
+        resume_idx = {resume.id: idx for idx, resume in enumerate(resumes)}
+        top = heapq.nlargest(top_n, ((score, -resume_idx[resume_id]) for resume_id, score in scores.items() if resume_id in resume_idx))
         
-        # add fuzzy results
-        for fuzzy_result in fuzzy_results:
-            resume_id = fuzzy_result.resume.id
-            
-            if resume_id in combined_dict:
-                # merge with existing result
-                existing = combined_dict[resume_id]
-                existing.keyword_matches.update(fuzzy_result.keyword_matches)
-                existing.total_matches += fuzzy_result.total_matches
-                existing.matched_keywords.extend(fuzzy_result.matched_keywords)
-                existing.fuzzy_matches = fuzzy_result.fuzzy_matches
-            else:
-                # add as new result
-                combined_dict[resume_id] = fuzzy_result
+        results = []
+        for score, neg_idx in top:
+            resume = resumes[-neg_idx]
+            keyword_matches = {keyword: counts[resume.id] for keyword, counts in keyword_counts.items() if resume.id in counts}
+            fuzzy_matches = {keyword: count for keyword, count in keyword_matches.items() if keyword in fuzzy_keys}
+            results.append(SearchResult(
+                resume=resume,
+                keyword_matches=keyword_matches,
+                total_matches=sum(keyword_matches.values()),
+                matched_keywords=list(keyword_matches),
+                fuzzy_matches=fuzzy_matches or None,
+                relevance_score=score if use_bm25 else None
+            ))
         
-        return list(combined_dict.values())
+        return results
+
+    def shutdown(self):
+        """lepas resource background (process pool ekstraksi dan scan)"""
+        self.pdf_extractor.shutdown()
+        self.pack_scanner.shutdown()
 
     def get_available_algorithms(self) -> List[str]:
         """get daftar algoritma yang tersedia"""
-        return ['KMP', 'BM', 'AC', 'LEVENSHTEIN']
+        return ['KMP', 'BM', 'AC', 'INDEX', 'LEVENSHTEIN']
+    
+    def get_available_scoring_modes(self) -> List[str]:
+        """get daftar mode ranking yang tersedia"""
+        return ['COUNT', 'BM25']
     
     def validate_keywords(self, keywords_text: str) -> Tuple[bool, List[str], str]:
         """validate dan parse keywords input"""
@@ -6,5 +6,6 @@ for the ATS CV Search application.
 
 from .config_simple import DatabaseConfig
 from .repo import ResumeRepository
+from .catalog import ResumeCatalog
 
-__all__ = ['DatabaseConfig', 'ResumeRepository']
\ No newline at end of file
+__all__ = ['DatabaseConfig', 'ResumeRepository', 'ResumeCatalog']
\ No newline at end of file
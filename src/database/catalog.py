@@ -0,0 +1,210 @@
+# src/database/catalog.py
+import threading
+import time
+from array import array
+from datetime import timedelta
+from typing import Dict, List, Optional
+from database.models import Resume
+from database.repo import ResumeRepository
+
+class ResumeCatalog:
+    """katalog resume di memory, dimuat sekali dari database dan disimpan per kolom (id, kategori, path, ...)
+
+    refresh inkremental lewat watermark updated_at: cek perubahan cukup satu query kecil
+    (count + max updated_at + waktu database) dan hanya baris yang berubah yang diambil ulang. baris
+    yang dihapus terlihat dari jumlah baris dan memicu full reload
+
+    updated_at berisi waktu mulai transaksi, jadi transaksi yang mulai sebelum refresh dan commit
+    sesudahnya membawa updated_at yang lebih tua dari watermark. baris diambil ulang dengan jendela
+    overlap WATERMARK_OVERLAP ke belakang dari waktu refresh sebelumnya selama jendela itu masih bisa
+    berisi commit yang terlambat
+    """
+
+    REFRESH_INTERVAL = 2.0  # detik, query dalam interval ini langsung dijawab dari memory
+    WATERMARK_OVERLAP = timedelta(minutes=5)  # batas lama transaksi tulis ke tabel resumes (misal import setup_postgres)
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, repo=None):
+        self.repo = repo or ResumeRepository()
+        self.ids: List[str] = []
+        self.category_codes = array('H')  # index ke self.categories
+        self.categories: List[str] = []
+        self.paths: List[Optional[str]] = []  # None jika file cv tidak ditemukan
+        self.names: List[Optional[str]] = []
+        self.phones: List[Optional[str]] = []
+        self.birthdates: List = []
+        self.addresses: List[Optional[str]] = []
+        self.positions: Dict[str, int] = {}  # resume id -> posisi di kolom
+        self.version = 0  # naik setiap kali isi catalog berubah
+        self.watermark = None  # updated_at terbaru yang sudah dimuat
+        self.checked_at = None  # waktu database (LOCALTIMESTAMP) saat refresh terakhir
+        self.loaded = False
+        self._category_lookup: Dict[str, int] = {}
+        self._last_refresh = 0.0
+        self._resumes = None  # list Resume versi sekarang, dibuat saat pertama diminta
+        self._lock = threading.RLock()
+
+    @classmethod
+    def shared(cls) -> 'ResumeCatalog':
+        """catalog bersama untuk satu proses"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _category_code(self, category: str) -> int:
+        code = self._category_lookup.get(category)
+        if code is None:
+            code = len(self.categories)
+            self.categories.append(category)
+            self._category_lookup[category] = code
+        return code
+
+    def _row(self, pos: int) -> tuple:
+        return (self.ids[pos], self.categories[self.category_codes[pos]], self.paths[pos],
+                self.names[pos], self.phones[pos], self.birthdates[pos], self.addresses[pos])
+
+    def _set_rows(self, rows):
+        """isi ulang semua kolom dari baris (id, category, file_path, name, phone, birthdate, address)"""
+        self.ids = [row[0] for row in rows]
+        self.categories = []
+        self._category_lookup = {}
+        self.category_codes = array('H', (self._category_code(row[1]) for row in rows))
+        self.paths = [row[2] for row in rows]
+        self.names = [row[3] for row in rows]
+        self.phones = [row[4] for row in rows]
+        self.birthdates = [row[5] for row in rows]
+        self.addresses = [row[6] for row in rows]
+        self.positions = {resume_id: pos for pos, resume_id in enumerate(self.ids)}
+
+    def _changed(self):
+        self.version += 1
+        self._resumes = None
+
+    def _reload(self) -> bool:
+        """muat ulang seluruh tabel"""
+        state = self.repo.get_catalog_state()  # diambil sebelum load, perubahan selama load ikut refresh berikutnya
+        rows = self.repo.get_resume_rows()
+        if rows is None:
+            return False
+
+        self._set_rows(rows)
+        self.watermark = state[1] if state else None
+        self.checked_at = state[2] if state else None
+        self.loaded = True
+        self._changed()
+        print(f"📇 resume catalog loaded: {len(self.ids)} resumes")
+        return True
+
+    def _apply(self, rows) -> bool:
+        """upsert baris yang berubah sejak watermark, return True jika ada yang berbeda"""
+        changed = inserted = False
+        for row in rows:
+            pos = self.positions.get(row[0])
+            if pos is None:
+                self.positions[row[0]] = len(self.ids)
+                self.ids.append(row[0])
+                self.category_codes.append(self._category_code(row[1]))
+                self.paths.append(row[2])
+                self.names.append(row[3])
+                self.phones.append(row[4])
+                self.birthdates.append(row[5])
+                self.addresses.append(row[6])
+                changed = inserted = True
+            elif self._row(pos) != tuple(row):
+                self.category_codes[pos] = self._category_code(row[1])
+                self.paths[pos] = row[2]
+                self.names[pos] = row[3]
+                self.phones[pos] = row[4]
+                self.birthdates[pos] = row[5]
+                self.addresses[pos] = row[6]
+                changed = True
+
+        if inserted:
+            # urutan tetap sama dengan full load (kategori lalu id), tie ranking search bergantung urutan ini
+            self._set_rows(sorted((self._row(pos) for pos in range(len(self.ids))), key=lambda row: (row[1], row[0])))
+        if changed:
+            self._changed()
+        return changed
+
+    def refresh(self, force: bool = False) -> bool:
+        """sinkronkan catalog dengan database (paling sering sekali per REFRESH_INTERVAL), return True jika berubah"""
+        with self._lock:
+            now = time.monotonic()
+            if self.loaded and not force and now - self._last_refresh < self.REFRESH_INTERVAL:
+                return False
+            self._last_refresh = now
+
+            if not self.loaded:
+                return self._reload()
+
+            state = self.repo.get_catalog_state()
+            if state is None:
+                return False  # database tidak bisa dihubungi, tetap pakai isi catalog yang ada
+            count, latest, checked_at = state
+
+            if latest is None or self.watermark is None or self.checked_at is None:
+                # tanpa updated_at perubahan hanya terdeteksi dari jumlah baris
+                return self._reload() if count != len(self.ids) or latest is not None else False
+
+            # baris yang commit setelah refresh sebelumnya punya updated_at >= window_start. jika
+            # watermark sudah lebih tua dari jendela itu, perubahan baru pasti menaikkan max updated_at
+            window_start = self.checked_at - self.WATERMARK_OVERLAP
+            changed = False
+            if latest > self.watermark or self.watermark >= window_start:
+                rows = self.repo.get_resume_rows(updated_since=window_start)
+                if rows is None:
+                    return False
+                changed = self._apply(rows)  # baris yang tidak berubah diabaikan
+            self.watermark = latest
+            self.checked_at = checked_at
+
+            if count != len(self.ids):
+                # ada baris yang dihapus
+                return self._reload()
+            return changed
+
+    def resumes(self) -> List[Resume]:
+        """semua resume yang file cv-nya ditemukan, urut kategori lalu id
+
+        objek Resume dibuat sekali per versi catalog, query berikutnya hanya membaca memory
+        """
+        with self._lock:
+            self.refresh()
+            if self._resumes is None:
+                self._resumes = [self._resume(pos) for pos in range(len(self.ids)) if self.paths[pos]]
+            return list(self._resumes)
+
+    def _resume(self, pos: int) -> Resume:
+        return Resume(
+            id=self.ids[pos],
+            category=self.categories[self.category_codes[pos]],
+            file_path=self.paths[pos],
+            name=self.names[pos],
+            phone=self.phones[pos],
+            birthdate=self.birthdates[pos],
+            address=self.addresses[pos]
+        )
+
+    def get(self, resume_id: str) -> Optional[Resume]:
+        """resume berdasarkan id dari memory, None jika tidak ada atau file tidak ditemukan"""
+        with self._lock:
+            self.refresh()
+            pos = self.positions.get(resume_id)
+            return self._resume(pos) if pos is not None and self.paths[pos] else None
+
+    def get_stats(self):
+        """statistik catalog untuk monitoring"""
+        return {
+            'resumes': len(self.ids),
+            'missing_files': sum(1 for path in self.paths if not path),
+            'categories': len(self.categories),
+            'version': self.version,
+            'watermark': self.watermark,
+            'checked_at': self.checked_at
+        }
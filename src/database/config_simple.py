@@ -1,8 +1,21 @@
 import psycopg2
+import psycopg2.pool
 import os
+import threading
+import time
 
 class DatabaseConfig:
-    def __init__(self):
+    # pool koneksi dipakai bersama oleh semua instance (repository, controller, main)
+    _pool = None
+    _pool_lock = threading.Lock()
+    _slots = None  # semaphore seukuran pool, dibuat bersama pool; getconn menunggu di sini saat pool penuh
+    _last_used = {}  # id(conn) -> waktu terakhir dikembalikan ke pool
+    _checked_out = {}  # id(conn) -> (pool, semaphore) asal koneksi yang sedang dipinjam
+
+    HEALTH_CHECK_INTERVAL = 30.0  # koneksi yang idle lebih lama dari ini dicek dulu dengan SELECT 1
+    POOL_TIMEOUT = 10.0  # batas waktu menunggu koneksi kosong
+    
+    def __init__(self, max_connections: int = 10):
         self.config = {
             'host': 'localhost',
             'user': 'postgres', 
@@ -10,16 +23,116 @@ class DatabaseConfig:
             'database': 'kaggle_resumes',
             'port': 5433
         }
+        self.max_connections = max_connections
+    
+    def _get_pool(self):
+        """pool koneksi bersama dan semaphore-nya, dibuat saat pertama dipakai (atau dibuat ulang setelah close_pool)"""
+        cls = DatabaseConfig
+        with cls._pool_lock:
+            if cls._pool is None or cls._pool.closed:
+                cls._pool = psycopg2.pool.ThreadedConnectionPool(1, self.max_connections, **self.config)
+                # semaphore selalu seukuran pool yang sedang aktif, bukan pool pertama yang pernah dibuat
+                cls._slots = threading.BoundedSemaphore(self.max_connections)
+                cls._last_used = {}
+            return cls._pool, cls._slots
+    
+    def _is_healthy(self, conn) -> bool:
+        """koneksi dari pool masih bisa dipakai (server restart / timeout memutus koneksi idle)"""
+        if conn.closed:
+            return False
+        last_used = DatabaseConfig._last_used.get(id(conn))
+        if last_used is None or time.monotonic() - last_used < self.HEALTH_CHECK_INTERVAL:
+            return True  # koneksi baru atau baru saja dipakai
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            return True
+        except psycopg2.Error:
+            return False
     
     def get_connection(self):
+        """pinjam koneksi dari pool, wajib dikembalikan lewat release_connection"""
         try:
-            return psycopg2.connect(**self.config)
-        except:
+            pool, slots = self._get_pool()
+        except Exception as e:
+            print(f"❌ database connection failed: {e}")
+            return None
+        
+        if not slots.acquire(timeout=self.POOL_TIMEOUT):
+            print("❌ database connection pool exhausted")
             return None
+        
+        # koneksi rusak dibuang dan diganti koneksi baru (reconnect); setelah server restart
+        # semua koneksi idle bisa putus, jadi coba sampai pool habis lalu satu koneksi baru
+        for _ in range(pool.maxconn + 1):
+            try:
+                conn = pool.getconn()
+            except Exception as e:
+                print(f"❌ database connection failed: {e}")
+                break
+            
+            if self._is_healthy(conn):
+                if not conn.autocommit:
+                    # query repository hanya read, tanpa transaksi terbuka koneksi langsung siap dipakai ulang
+                    conn.autocommit = True
+                with DatabaseConfig._pool_lock:
+                    DatabaseConfig._checked_out[id(conn)] = (pool, slots)
+                return conn
+            
+            DatabaseConfig._last_used.pop(id(conn), None)
+            pool.putconn(conn, close=True)
+        
+        slots.release()
+        return None
+    
+    def release_connection(self, conn):
+        """kembalikan koneksi ke pool, koneksi yang sudah putus ditutup dan tidak dipakai ulang"""
+        if conn is None:
+            return
+        
+        with DatabaseConfig._pool_lock:
+            checked_out = DatabaseConfig._checked_out.pop(id(conn), None)
+        if checked_out is None:
+            # koneksi tidak sedang dipinjam (release dua kali), permit semaphore tidak boleh dilepas lagi
+            print("⚠️ database connection released twice, ignored")
+            return
+        
+        pool, slots = checked_out
+        try:
+            if pool.closed:
+                conn.close()
+                return
+            
+            broken = bool(conn.closed)
+            if not broken and conn.info.transaction_status != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+                try:
+                    conn.rollback()
+                except psycopg2.Error:
+                    broken = True
+            
+            if broken:
+                DatabaseConfig._last_used.pop(id(conn), None)
+            else:
+                DatabaseConfig._last_used[id(conn)] = time.monotonic()
+            pool.putconn(conn, close=broken)
+        except Exception as e:
+            print(f"⚠️ failed to release database connection: {e}")
+        finally:
+            slots.release()
+    
+    @classmethod
+    def close_pool(cls):
+        """tutup semua koneksi di pool (saat aplikasi keluar)"""
+        with cls._pool_lock:
+            if cls._pool is not None and not cls._pool.closed:
+                cls._pool.closeall()
+            cls._pool = None
+            cls._slots = None
+            cls._last_used = {}
     
     def test_connection(self):
         conn = self.get_connection()
         if conn:
-            conn.close()
+            self.release_connection(conn)
             return True
         return False
@@ -50,6 +50,7 @@ class SearchResult:
     matched_keywords: List[str]
     cv_summary: Optional[CVSummary] = None
     fuzzy_matches: Optional[Dict[str, int]] = None
+    relevance_score: Optional[float] = None  # skor bm25, None jika di-rank berdasarkan total_matches
 
 @dataclass
 class SearchTimingInfo:
@@ -1,135 +1,276 @@
 # src/database/repo.py
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from datetime import datetime
 import os
+import psycopg2
+import psycopg2.errors
 from database.config_simple import DatabaseConfig
 from database.models import Resume
 
 class ResumeRepository:
     """repository untuk akses data resume dengan path correction dan optimasi"""
     
+    # resume id -> (file_path di database, path absolut hasil resolve atau '' jika tidak ditemukan),
+    # dipakai bersama semua repository supaya filesystem tidak di-probe ulang setiap load
+    _resolved_paths = {}
+    
     def __init__(self):
         self.db_config = DatabaseConfig()
         # set data base path relative to project root (go up two levels from src/database/)
-        self.data_base_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', 'data')
+        self.data_base_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'data')
         self.data_base_path = os.path.abspath(self.data_base_path)
         print(f"data base path: {self.data_base_path}")
     
-    def get_all_resumes(self) -> List[Resume]:
-        """ambil semua data resume dari database dengan path validation yang diperbaiki"""
+    def _is_canonical(self, stored_path: str) -> bool:
+        """path sudah ditulis dalam bentuk canonical saat ingest (absolut, ternormalisasi, di dalam data dir)"""
+        return (os.path.isabs(stored_path) and os.path.normpath(stored_path) == stored_path
+                and stored_path.startswith(self.data_base_path + os.sep))
+    
+    def _probe_path(self, resume_id: str, category: str, stored_path: str) -> Optional[str]:
+        """cari file cv di beberapa kemungkinan lokasi (stat per kandidat), hanya untuk ingest dan validasi ulang"""
+        possible_paths = [
+            stored_path,  # original path
+            os.path.join(self.data_base_path, f"{category}", f"{resume_id}.pdf"),  # category/id.pdf
+            os.path.join(self.data_base_path, stored_path),  # data/stored_path
+            os.path.join(self.data_base_path, category, os.path.basename(stored_path)),  # data/category/filename
+        ]
+        
+        for path in possible_paths:
+            if os.path.exists(path) and os.path.isfile(path):
+                return os.path.abspath(path)
+        return None
+    
+    def _resolve_path(self, resume_id: str, category: str, stored_path: str) -> Optional[str]:
+        """path file cv tanpa menyentuh filesystem jika sudah diketahui
+        
+        path canonical dari database langsung dipakai, path lama di-probe sekali per proses;
+        keberadaan file baru dicek ulang lewat revalidate_path saat file gagal dibuka
+        """
+        entry = self._resolved_paths.get(resume_id)
+        if entry is None or entry[0] != stored_path:
+            if self._is_canonical(stored_path):
+                path = stored_path
+            else:
+                path = self._probe_path(resume_id, category, stored_path) or ''
+            entry = (stored_path, path)
+            self._resolved_paths[resume_id] = entry
+        return entry[1] or None
+    
+    def _write_back_paths(self, conn, updates: List[Tuple[str, str]]):
+        """simpan path hasil resolve ke resumes.file_path supaya load berikutnya tidak perlu probe"""
+        if not updates:
+            return
+        
+        try:
+            # updated_at diurus trigger; path yang ditulis sama dengan path di catalog, baris yang
+            # ikut terambil ulang oleh refresh berikutnya tidak mengubah isi catalog
+            with conn.cursor() as cursor:
+                cursor.executemany("UPDATE resumes SET file_path = %s WHERE id = %s", updates)
+            if not conn.autocommit:
+                conn.commit()
+            for path, resume_id in updates:
+                self._resolved_paths[resume_id] = (path, path)
+            print(f"stored {len(updates)} resolved cv paths")
+        except Exception as e:
+            print(f"error storing resolved paths: {e}")
+    
+    def resolve_stored_paths(self) -> int:
+        """resolve path semua resume sekali saat ingest dan tulis path canonical ke database, return jumlah path yang diperbaiki"""
         conn = self.db_config.get_connection()
         if not conn:
             print("failed to connect to database")
-            return []
+            return 0
         
         try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT id, category, file_path, name, phone, birthdate, address
-                FROM resumes
-                ORDER BY category, id
-            """)
-            
-            results = cursor.fetchall()
-            resumes = []
-            
-            for row in results:
-                # build actual file path with multiple fallback options
-                resume_id = row[0]
-                category = row[1]
-                stored_path = row[2]
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT id, category, file_path FROM resumes")
                 
-                # try different path combinations
-                possible_paths = [
-                    stored_path,  # original path
-                    os.path.join(self.data_base_path, f"{category}", f"{resume_id}.pdf"),  # category/id.pdf
-                    os.path.join(self.data_base_path, stored_path),  # data/stored_path
-                    os.path.join(self.data_base_path, category, os.path.basename(stored_path)),  # data/category/filename
-                ]
+                updates = []
+                missing = 0
+                for resume_id, category, stored_path in cursor.fetchall():
+                    actual_path = self._probe_path(resume_id, category, stored_path)
+                    if actual_path is None:
+                        missing += 1
+                    elif actual_path != stored_path:
+                        updates.append((actual_path, resume_id))
                 
-                actual_path = None
-                for path in possible_paths:
-                    if os.path.exists(path) and os.path.isfile(path):
-                        actual_path = os.path.abspath(path)
-                        break
+                self._write_back_paths(conn, updates)
+                if missing:
+                    print(f"{missing} resumes have no cv file on disk")
+                return len(updates)
+            
+        except Exception as e:
+            print(f"error resolving resume paths: {e}")
+            return 0
+        finally:
+            self.db_config.release_connection(conn)
+    
+    def revalidate_path(self, resume_id: str) -> Optional[str]:
+        """cek ulang lokasi file cv (misal setelah gagal dibuka), path baru disimpan ke map dan database"""
+        self._resolved_paths.pop(resume_id, None)
+        conn = self.db_config.get_connection()
+        if not conn:
+            return None
+        
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT category, file_path FROM resumes WHERE id = %s", (resume_id,))
+                row = cursor.fetchone()
+                if not row:
+                    return None
                 
-                if actual_path:
-                    resume = Resume(
-                        id=resume_id,
-                        category=category, 
-                        file_path=actual_path,
-                        name=row[3],
-                        phone=row[4],
-                        birthdate=row[5],
-                        address=row[6]
-                    )
-                    resumes.append(resume)
-                else:
+                category, stored_path = row
+                actual_path = self._probe_path(resume_id, category, stored_path)
+                if actual_path is None:
+                    self._resolved_paths[resume_id] = (stored_path, '')
                     print(f"file not found for resume {resume_id}: {stored_path}")
-            
-            print(f"loaded {len(resumes)} valid resumes from database")
-            return resumes
+                elif actual_path != stored_path:
+                    self._write_back_paths(conn, [(actual_path, resume_id)])
+                else:
+                    self._resolved_paths[resume_id] = (stored_path, actual_path)
+                return actual_path
             
         except Exception as e:
-            print(f"error loading resumes: {e}")
-            return []
+            print(f"error revalidating path for resume {resume_id}: {e}")
+            return None
         finally:
-            if conn and not conn.closed:
-                cursor.close()
-                conn.close()
+            self.db_config.release_connection(conn)
     
-    def get_resume_by_id(self, resume_id: str) -> Optional[Resume]:
-        """ambil resume berdasarkan id dengan path validation yang diperbaiki"""
+    def get_catalog_state(self) -> Optional[Tuple[int, Optional[datetime], datetime]]:
+        """jumlah baris, updated_at terbaru dan waktu database (query kecil untuk cek perubahan), None jika gagal"""
         conn = self.db_config.get_connection()
         if not conn:
             return None
         
         try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT id, category, file_path, name, phone, birthdate, address
-                FROM resumes WHERE id = %s
-            """, (resume_id,))
+            with conn.cursor() as cursor:
+                try:
+                    # LOCALTIMESTAMP bertipe sama dengan updated_at (timestamp tanpa zona waktu)
+                    cursor.execute("SELECT COUNT(*), MAX(updated_at), LOCALTIMESTAMP FROM resumes")
+                except psycopg2.errors.UndefinedColumn:
+                    # tabel lama tanpa kolom updated_at, perubahan hanya terlihat dari jumlah baris
+                    if not conn.autocommit:
+                        conn.rollback()
+                    cursor.execute("SELECT COUNT(*), NULL, LOCALTIMESTAMP FROM resumes")
+                return cursor.fetchone()
             
-            row = cursor.fetchone()
-            if row:
-                # build actual file path
-                category = row[1]
-                stored_path = row[2]
+        except Exception as e:
+            print(f"error checking resumes table: {e}")
+            return None
+        finally:
+            self.db_config.release_connection(conn)
+    
+    def get_resume_rows(self, updated_since: Optional[datetime] = None) -> Optional[List[tuple]]:
+        """baris resume (id, category, file_path, name, phone, birthdate, address) urut kategori lalu id
+        
+        file_path sudah di-resolve, None jika file cv tidak ditemukan. updated_since hanya mengambil
+        baris dengan updated_at >= updated_since (refresh inkremental ResumeCatalog). return None jika gagal
+        """
+        conn = self.db_config.get_connection()
+        if not conn:
+            print("failed to connect to database")
+            return None
+        
+        try:
+            with conn.cursor() as cursor:
+                if updated_since is None:
+                    cursor.execute("""
+                        SELECT id, category, file_path, name, phone, birthdate, address
+                        FROM resumes
+                        ORDER BY category, id
+                    """)
+                else:
+                    cursor.execute("""
+                        SELECT id, category, file_path, name, phone, birthdate, address
+                        FROM resumes WHERE updated_at >= %s
+                        ORDER BY category, id
+                    """, (updated_since,))
                 
-                possible_paths = [
-                    stored_path,
-                    os.path.join(self.data_base_path, f"{category}", f"{resume_id}.pdf"),
-                    os.path.join(self.data_base_path, stored_path),
-                    os.path.join(self.data_base_path, category, os.path.basename(stored_path)),
-                ]
+                results = cursor.fetchall()
+                rows = []
+                resolved_paths = []
                 
-                actual_path = None
-                for path in possible_paths:
-                    if os.path.exists(path) and os.path.isfile(path):
-                        actual_path = os.path.abspath(path)
-                        break
+                for row in results:
+                    resume_id = row[0]
+                    category = row[1]
+                    stored_path = row[2]
+                    
+                    # path dari map id -> path, filesystem hanya di-probe untuk path yang belum canonical
+                    actual_path = self._resolve_path(resume_id, category, stored_path)
+                    
+                    if actual_path:
+                        if actual_path != stored_path:
+                            resolved_paths.append((actual_path, resume_id))
+                    else:
+                        print(f"file not found for resume {resume_id}: {stored_path}")
+                    rows.append((resume_id, category, actual_path) + tuple(row[3:7]))
                 
-                if actual_path:
-                    return Resume(
-                        id=row[0],
-                        category=row[1],
-                        file_path=actual_path, 
-                        name=row[3],
-                        phone=row[4],
-                        birthdate=row[5],
-                        address=row[6]
-                    )
-                else:
-                    print(f"file not found for resume {resume_id}")
+                self._write_back_paths(conn, resolved_paths)
+                return rows
+            
+        except Exception as e:
+            print(f"error loading resumes: {e}")
             return None
+        finally:
+            self.db_config.release_connection(conn)
+    
+    def get_all_resumes(self) -> List[Resume]:
+        """ambil semua data resume dari database dengan path validation yang diperbaiki"""
+        rows = self.get_resume_rows()
+        if rows is None:
+            return []
+        
+        resumes = [
+            Resume(
+                id=row[0],
+                category=row[1],
+                file_path=row[2],
+                name=row[3],
+                phone=row[4],
+                birthdate=row[5],
+                address=row[6]
+            )
+            for row in rows if row[2]
+        ]
+        print(f"loaded {len(resumes)} valid resumes from database")
+        return resumes
+    
+    def get_resume_by_id(self, resume_id: str) -> Optional[Resume]:
+        """ambil resume berdasarkan id dengan path validation yang diperbaiki"""
+        conn = self.db_config.get_connection()
+        if not conn:
+            return None
+        
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("""
+                    SELECT id, category, file_path, name, phone, birthdate, address
+                    FROM resumes WHERE id = %s
+                """, (resume_id,))
+                
+                row = cursor.fetchone()
+                if row:
+                    actual_path = self._resolve_path(resume_id, row[1], row[2])
+                    
+                    if actual_path:
+                        return Resume(
+                            id=row[0],
+                            category=row[1],
+                            file_path=actual_path, 
+                            name=row[3],
+                            phone=row[4],
+                            birthdate=row[5],
+                            address=row[6]
+                        )
+                    else:
+                        print(f"file not found for resume {resume_id}")
+                return None
             
         except Exception as e:
             print(f"error getting resume {resume_id}: {e}")
             return None
         finally:
-            if conn and not conn.closed:
-                cursor.close()
-                conn.close()
+            self.db_config.release_connection(conn)
     
     def get_resumes_by_category(self, category: str) -> List[Resume]:
         """ambil resume berdasarkan kategori dengan optimasi"""
@@ -138,54 +279,39 @@ class ResumeRepository:
             return []
         
         try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT id, category, file_path, name, phone, birthdate, address
-                FROM resumes WHERE category = %s
-                ORDER BY id
-            """, (category,))
-            
-            results = cursor.fetchall()
-            resumes = []
-            
-            for row in results:
-                resume_id = row[0]
-                stored_path = row[2]
+            with conn.cursor() as cursor:
+                cursor.execute("""
+                    SELECT id, category, file_path, name, phone, birthdate, address
+                    FROM resumes WHERE category = %s
+                    ORDER BY id
+                """, (category,))
                 
-                # apply same path fixing logic
-                possible_paths = [
-                    stored_path,
-                    os.path.join(self.data_base_path, f"{category}", f"{resume_id}.pdf"),
-                    os.path.join(self.data_base_path, stored_path),
-                ]
+                results = cursor.fetchall()
+                resumes = []
                 
-                actual_path = None
-                for path in possible_paths:
-                    if os.path.exists(path) and os.path.isfile(path):
-                        actual_path = os.path.abspath(path)
-                        break
+                for row in results:
+                    # apply same path resolution (map id -> path)
+                    actual_path = self._resolve_path(row[0], category, row[2])
+                    
+                    if actual_path:
+                        resume = Resume(
+                            id=row[0],
+                            category=row[1],
+                            file_path=actual_path,
+                            name=row[3], 
+                            phone=row[4],
+                            birthdate=row[5],
+                            address=row[6]
+                        )
+                        resumes.append(resume)
                 
-                if actual_path:
-                    resume = Resume(
-                        id=row[0],
-                        category=row[1],
-                        file_path=actual_path,
-                        name=row[3], 
-                        phone=row[4],
-                        birthdate=row[5],
-                        address=row[6]
-                    )
-                    resumes.append(resume)
-            
-            return resumes
+                return resumes
             
         except Exception as e:
             print(f"error getting resumes for category {category}: {e}")
             return []
         finally:
-            if conn and not conn.closed:
-                cursor.close()
-                conn.close()
+            self.db_config.release_connection(conn)
     
     def test_data_directory(self):
         """test apakah directory data dan file pdf ada"""
@@ -60,8 +60,8 @@ def import_data_to_db(conn):
         for index, row in resumes_df.iterrows():
             resume_id = str(row['ID'])
             category = row['Category']
-            # Build file path relative to data directory
-            file_path = str(data_dir / category / f"{resume_id}.pdf")
+            # Canonical absolute path, resolved once here so the app never has to probe for it
+            file_path = os.path.abspath(str(data_dir / category / f"{resume_id}.pdf"))
 
             cursor.execute(sql, (resume_id, category, file_path))
             count += 1
@@ -95,6 +95,16 @@ def import_data_to_db(conn):
         print(f"❌ Failed to import data: {e}")
         return False
 
+def resolve_paths():
+    """Resolve file paths of all rows (including rows from earlier imports) and store canonical paths"""
+    from database.repo import ResumeRepository
+    from database.config_simple import DatabaseConfig
+    
+    print("🔗 Resolving CV file paths...")
+    fixed = ResumeRepository().resolve_stored_paths()
+    print(f"✅ {fixed} file paths corrected to canonical absolute paths")
+    DatabaseConfig.close_pool()
+
 def verify_data(conn):
     """Verify imported data and check file paths"""
     try:
@@ -134,6 +144,7 @@ def main():
     
     try:
         if import_data_to_db(conn):
+            resolve_paths()
             verify_data(conn)
             print("\n🎉 Migration completed successfully!")
             print("The ATS application is now ready to use with PostgreSQL backend.")
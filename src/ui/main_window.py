@@ -6,13 +6,18 @@ from PyQt5 import QtWidgets, QtCore, QtGui
 from ui.search_panel import SearchPanel
 from ui.results_panel import ResultsPanel
 from ui.summary_view import SummaryView
+from ui.search_worker import SearchWorker
 from controller.search import SearchController
 from controller.cv import CVController
+from database.config_simple import DatabaseConfig
 from database.repo import ResumeRepository
+from database.catalog import ResumeCatalog
 
 class MainWindow(QtWidgets.QMainWindow):
     """main window aplikasi cv search dengan optimized startup"""
     
+    search_dispatched = QtCore.pyqtSignal(int, dict, object)  # request id, search params, cancel event -> SearchWorker.run_search
+    
     def __init__(self):
         super().__init__()
         
@@ -21,8 +26,14 @@ class MainWindow(QtWidgets.QMainWindow):
         self.cv_controller = CVController()
         self.repo = ResumeRepository()
         
-        # setupAnd.  progress callback
-        self.search_controller.set_progress_callback(self.update_progress)
+        # search berjalan di thread terpisah, gui tetap responsif selama search
+        self.search_thread = QtCore.QThread(self)
+        self.search_worker = SearchWorker(self.search_controller)
+        self.search_worker.moveToThread(self.search_thread)
+        self.search_thread.start()
+        self.search_request_id = 0
+        self.search_in_progress = False
+        self.search_keywords = []
         
         # create UI components
         self.setup_ui()
@@ -89,13 +100,23 @@ class MainWindow(QtWidgets.QMainWindow):
         help_menu.addAction(about_action)
 
     def setup_connections(self):
-        """setup signal connections tanpa threading complexity"""
+        """setup signal connections, search dijalankan oleh SearchWorker di thread terpisah"""
         print("setting up signal connections...")
         
         # search panel to main window
         self.search_panel.search_requested.connect(self.perform_search)
+        self.search_panel.cancel_requested.connect(self.cancel_search)
         print("search panel connected")
         
+        # main window to search worker (queued ke thread worker)
+        self.search_dispatched.connect(self.search_worker.run_search)
+        self.search_worker.progress.connect(self.update_progress)
+        self.search_worker.partial_results.connect(self.on_partial_results)
+        self.search_worker.search_finished.connect(self.on_search_finished)
+        self.search_worker.search_cancelled.connect(self.on_search_cancelled)
+        self.search_worker.search_failed.connect(self.on_search_failed)
+        print("search worker connected")
+        
         # results panel to main window
         self.results_panel.summary_requested.connect(self.show_cv_summary)
         self.results_panel.view_cv_requested.connect(self.view_cv_file)
@@ -112,7 +133,8 @@ class MainWindow(QtWidgets.QMainWindow):
         print("checking database connection...")
         
         try:
-            resumes = self.repo.get_all_resumes()
+            # load catalog sekali di awal, search pertama langsung membaca memory
+            resumes = ResumeCatalog.shared().resumes()
             if resumes:
                 count = len(resumes)
                 print(f"database connected successfully! found {count} resumes")
@@ -154,83 +176,116 @@ class MainWindow(QtWidgets.QMainWindow):
     def update_progress(self, message: str):
         """update progress in status bar"""
         self.statusBar().showMessage(message)
-        QtWidgets.QApplication.processEvents()  # update UI immediately
 
     @QtCore.pyqtSlot(dict)
     def perform_search(self, search_params):
-        """handle search request dengan direct execution (no threading)"""
-        try:
-            # extract parameters from dict
-            keywords = search_params.get('keywords', [])
-            algorithm = search_params.get('algorithm', 'KMP')
-            top_n = search_params.get('top_n', 10)
-            threshold = search_params.get('threshold', 0.7)
-            
-            print(f"starting search:")
-            print(f"keywords: {keywords}")
-            print(f"algorithm: {algorithm}")
-            print(f"top_n: {top_n}")
-            print(f"threshold: {threshold}")
-            
-            # validate keywords
-            if not keywords:
-                QtWidgets.QMessageBox.warning(
-                    self, "Warning", "Please enter keywords to search"
-                )
-                return
-            
-            # update ui state
-            self.search_panel.set_search_enabled(False)
-            self.results_panel.show_loading("Searching CVs...")
-            self.statusBar().showMessage(f"searching for: {', '.join(keywords)}")
-            
-            # process events to update ui immediately
-            QtWidgets.QApplication.processEvents()
-            
-            # perform search directly (no threading to avoid complexity)
-            results, timing_info = self.search_controller.search_cvs(
-                keywords=keywords,
-                algorithm=algorithm,
-                top_n=top_n,
-                fuzzy_threshold=threshold
+        """kirim search request ke worker thread, search yang masih berjalan dibatalkan"""
+        # extract parameters from dict
+        keywords = search_params.get('keywords', [])
+        
+        print(f"starting search:")
+        print(f"keywords: {keywords}")
+        print(f"algorithm: {search_params.get('algorithm', 'KMP')}")
+        print(f"top_n: {search_params.get('top_n', 10)}")
+        print(f"threshold: {search_params.get('threshold', 0.7)}")
+        print(f"scoring: {search_params.get('scoring', 'COUNT')}")
+        
+        # validate keywords
+        if not keywords:
+            QtWidgets.QMessageBox.warning(
+                self, "Warning", "Please enter keywords to search"
             )
-            
-            print(f"search completed with {len(results)} results")
-            
-            # show results
-            self.results_panel.show_search_results(results, timing_info)
-            
-            # update status
-            result_count = len(results)
-            if result_count > 0:
-                self.statusBar().showMessage(
-                    f"found {result_count} matching cvs for: {', '.join(keywords)}"
-                )
-            else:
-                self.statusBar().showMessage(
-                    f"no cvs found for: {', '.join(keywords)} (try different keywords)"
-                )
-            
-        except Exception as e:
-            print(f"search error: {e}")
-            import traceback
-            traceback.print_exc()
-            
-            # show error dialog
-            QtWidgets.QMessageBox.critical(
-                self,
-                "Search Error", 
-                f"An error occurred during search:\n\n{str(e)}\n\n"
-                f"Please check:\n"
-                f"• Database connection\n"
-                f"• CV files exist in data folder\n"
-                f"• Keywords are valid"
+            return
+        
+        # request lama dibatalkan dan hasilnya diabaikan, request baru dapat event pembatalan sendiri
+        self.search_request_id += 1
+        cancel_event = self.search_worker.begin_request(self.search_request_id)
+        self.search_in_progress = True
+        self.search_keywords = keywords
+        
+        # update ui state
+        self.search_panel.set_search_enabled(False)
+        self.results_panel.show_loading("Searching CVs...")
+        self.statusBar().showMessage(f"searching for: {', '.join(keywords)}")
+        
+        self.search_dispatched.emit(self.search_request_id, search_params, cancel_event)
+
+    @QtCore.pyqtSlot()
+    def cancel_search(self):
+        """batalkan search yang sedang berjalan (misal keyword diubah user)"""
+        if not self.search_in_progress:
+            return
+        
+        self.search_worker.cancel()
+        self.search_request_id += 1
+        self.search_worker.latest_request_id = self.search_request_id
+        self.search_in_progress = False
+        self.search_panel.set_search_enabled(True)
+        self.statusBar().showMessage("search cancelled")
+
+    @QtCore.pyqtSlot(int, object)
+    def on_partial_results(self, request_id, results):
+        """tampilkan top-n sementara selama search masih berjalan"""
+        if request_id != self.search_request_id or not results:
+            return
+        
+        self.results_panel.show_search_results(results, "⏳ partial results - still searching...")
+        self.statusBar().showMessage(f"found {len(results)} matching cvs so far for: {', '.join(self.search_keywords)}")
+
+    @QtCore.pyqtSlot(int, object, str)
+    def on_search_finished(self, request_id, results, timing_info):
+        """tampilkan hasil akhir search"""
+        if request_id != self.search_request_id:
+            return
+        
+        print(f"search completed with {len(results)} results")
+        self.search_in_progress = False
+        self.search_panel.set_search_enabled(True)
+        
+        # show results
+        self.results_panel.show_search_results(results, timing_info)
+        
+        # update status
+        result_count = len(results)
+        if result_count > 0:
+            self.statusBar().showMessage(
+                f"found {result_count} matching cvs for: {', '.join(self.search_keywords)}"
             )
-            self.statusBar().showMessage("search failed")
-            
-        finally:
-            # restore ui state
-            self.search_panel.set_search_enabled(True)
+        else:
+            self.statusBar().showMessage(
+                f"no cvs found for: {', '.join(self.search_keywords)} (try different keywords)"
+            )
+
+    @QtCore.pyqtSlot(int)
+    def on_search_cancelled(self, request_id):
+        """search dibatalkan di worker; request yang sudah digantikan cukup diabaikan"""
+        if request_id != self.search_request_id:
+            return
+        
+        self.search_in_progress = False
+        self.search_panel.set_search_enabled(True)
+        self.statusBar().showMessage("search cancelled")
+
+    @QtCore.pyqtSlot(int, str)
+    def on_search_failed(self, request_id, error):
+        """tampilkan error dari worker"""
+        if request_id != self.search_request_id:
+            return
+        
+        self.search_in_progress = False
+        self.search_panel.set_search_enabled(True)
+        
+        # show error dialog
+        QtWidgets.QMessageBox.critical(
+            self,
+            "Search Error", 
+            f"An error occurred during search:\n\n{error}\n\n"
+            f"Please check:\n"
+            f"• Database connection\n"
+            f"• CV files exist in data folder\n"
+            f"• Keywords are valid"
+        )
+        self.statusBar().showMessage("search failed")
 
     @QtCore.pyqtSlot(str)
     def show_cv_summary(self, resume_id):
@@ -345,6 +400,11 @@ class MainWindow(QtWidgets.QMainWindow):
         
         if reply == QtWidgets.QMessageBox.Yes:
             print("application closing...")
+            self.search_worker.cancel()
+            self.search_thread.quit()
+            self.search_thread.wait()
+            self.search_controller.shutdown()
+            DatabaseConfig.close_pool()
             event.accept()
         else:
             event.ignore()
\ No newline at end of file
@@ -2,9 +2,10 @@
 from PyQt5 import QtWidgets, QtCore
 from typing import List
 from database.models import SearchResult
+from ui.results_view import ResultsListModel, ResultCardDelegate
 
 class ResultsPanel(QtWidgets.QWidget):
-    """panel untuk menampilkan hasil pencarian cv"""
+    """panel untuk menampilkan hasil pencarian cv (model/view, hanya card yang terlihat yang digambar)"""
     
     summary_requested = QtCore.pyqtSignal(str)  # resume_id
     view_cv_requested = QtCore.pyqtSignal(str)  # resume_id
@@ -49,51 +50,65 @@ class ResultsPanel(QtWidgets.QWidget):
         self.results_header.hide()
         layout.addWidget(self.results_header)
         
-        # scroll area for results
-        self.scroll_area = QtWidgets.QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAsNeeded)
-        self.scroll_area.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
-        self.scroll_area.setStyleSheet("""
-            QScrollArea {
+        # stack: halaman pesan (initial / loading / no results) dan list hasil
+        self.stack = QtWidgets.QStackedWidget()
+        
+        self.message_label = QtWidgets.QLabel()
+        self.message_label.setAlignment(QtCore.Qt.AlignCenter)
+        message_page = QtWidgets.QWidget()
+        message_layout = QtWidgets.QVBoxLayout(message_page)
+        message_layout.setContentsMargins(0, 0, 0, 0)
+        message_layout.addWidget(self.message_label)
+        message_layout.addStretch()
+        self.stack.addWidget(message_page)
+        
+        # list hasil: model + delegate, card digambar langsung tanpa widget per hasil
+        self.results_model = ResultsListModel(self)
+        self.results_delegate = ResultCardDelegate(self)
+        self.results_view = QtWidgets.QListView()
+        self.results_view.setModel(self.results_model)
+        self.results_view.setItemDelegate(self.results_delegate)
+        self.results_view.setUniformItemSizes(True)  # semua card sama tinggi, layout tidak perlu mengukur tiap baris
+        self.results_view.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
+        self.results_view.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        self.results_view.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
+        self.results_view.setMouseTracking(True)  # hover state untuk border card
+        self.results_view.setStyleSheet("""
+            QListView {
                 border: none;
                 background-color: transparent;
             }
         """)
+        self.stack.addWidget(self.results_view)
+        layout.addWidget(self.stack)
         
-        # container widget for results
-        self.results_widget = QtWidgets.QWidget()
-        self.results_layout = QtWidgets.QVBoxLayout(self.results_widget)
-        self.results_layout.setSpacing(10)
-        self.results_layout.setContentsMargins(0, 0, 0, 0)
-        
-        self.scroll_area.setWidget(self.results_widget)
-        layout.addWidget(self.scroll_area)
+        self.results_delegate.summary_clicked.connect(self.summary_requested)
+        self.results_delegate.view_cv_clicked.connect(self.view_cv_requested)
         
         # show initial message
         self.show_initial_message()
     
-    def show_initial_message(self):
-        """show initial welcome message"""
-        msg = QtWidgets.QLabel("Enter keywords and click Search to find matching CVs")
-        msg.setAlignment(QtCore.Qt.AlignCenter)
-        msg.setStyleSheet("""
-            QLabel {
-                color: #7f8c8d;
+    def _show_message(self, text: str, color: str, background: str, border: str):
+        """tampilkan halaman pesan menggantikan list hasil"""
+        self.message_label.setText(text)
+        self.message_label.setStyleSheet(f"""
+            QLabel {{
+                color: {color};
                 font-size: 16px;
                 padding: 50px;
-                background-color: #f8f9fa;
+                background-color: {background};
                 border-radius: 8px;
-                border: 2px dashed #bdc3c7;
-            }
+                border: {border};
+            }}
         """)
-        self.results_layout.addWidget(msg)
-        self.results_layout.addStretch()
+        self.stack.setCurrentIndex(0)
+    
+    def show_initial_message(self):
+        """show initial welcome message"""
+        self._show_message("Enter keywords and click Search to find matching CVs", "#7f8c8d", "#f8f9fa", "2px dashed #bdc3c7")
     
     def show_search_results(self, results: List[SearchResult], timing_info: str):
-        """show search results dengan detailed info"""
-        self.clear_results()
-        
+        """show search results; dipanggil berulang untuk hasil partial, model hanya meng-update baris yang berubah"""
         # show timing info
         self.timing_label.setText(timing_info)
         self.timing_label.show()
@@ -103,237 +118,36 @@ class ResultsPanel(QtWidgets.QWidget):
         self.results_header.setText(f"Results ({result_count} CVs found)")
         self.results_header.show()
         
-        if not results:
-            self.show_no_results()
-            return
-        
         # store results
         self.search_results = results
         
-        # create result cards
-        for i, result in enumerate(results):
-            card = self._create_result_card(result, i + 1)
-            self.results_layout.addWidget(card)
+        if not results:
+            self.results_model.clear()
+            self.show_no_results()
+            return
         
-        self.results_layout.addStretch()
+        self.results_model.set_results(results)
+        self.stack.setCurrentIndex(1)
     
     def show_no_results(self):
         """show no results message"""
-        msg = QtWidgets.QLabel("No matching CVs found.\nTry different keywords or use fuzzy matching.")
-        msg.setAlignment(QtCore.Qt.AlignCenter)
-        msg.setStyleSheet("""
-            QLabel {
-                color: #e74c3c;
-                font-size: 16px;
-                padding: 30px;
-                background-color: #fdf2f2;
-                border-radius: 8px;
-                border: 2px solid #f5c6cb;
-            }
-        """)
-        self.results_layout.addWidget(msg)
-        self.results_layout.addStretch()
+        self._show_message("No matching CVs found.\nTry different keywords or use fuzzy matching.", "#e74c3c", "#fdf2f2", "2px solid #f5c6cb")
     
     def clear_results(self):
         """clear previous results"""
-        while self.results_layout.count():
-            child = self.results_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-        
+        self.search_results = []
+        self.results_model.clear()
         self.timing_label.hide()
         self.results_header.hide()
     
-    def _create_result_card(self, result: SearchResult, rank: int) -> QtWidgets.QWidget:
-        """create result card untuk satu cv dengan detailed info"""
-        card = QtWidgets.QFrame()
-        card.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #dee2e6;
-                border-radius: 8px;
-                padding: 5px;
-                margin: 2px;
-            }
-            QFrame:hover {
-                border-color: #3498db;
-                box-shadow: 0 2px 8px rgba(52, 152, 219, 0.2);
-            }
-        """)
-        
-        layout = QtWidgets.QVBoxLayout(card)
-        layout.setSpacing(12)
-        layout.setContentsMargins(15, 15, 15, 15)
-        
-        # header with name and rank
-        header_layout = QtWidgets.QHBoxLayout()
-        
-        # candidate name
-        name = result.resume.name or f"Candidate {result.resume.id}"
-        name_label = QtWidgets.QLabel(f"#{rank}. {name}")
-        name_label.setStyleSheet("""
-            QLabel {
-                font-size: 16px;
-                font-weight: bold;
-                color: #2c3e50;
-            }
-        """)
-        header_layout.addWidget(name_label)
-        
-        # category badge
-        category_badge = QtWidgets.QLabel(result.resume.category)
-        category_badge.setStyleSheet("""
-            QLabel {
-                background-color: #e9ecef;
-                color: #495057;
-                padding: 2px 8px;
-                border-radius: 12px;
-                font-size: 11px;
-                font-weight: bold;
-            }
-        """)
-        header_layout.addWidget(category_badge)
-        
-        # total matches
-        matches_label = QtWidgets.QLabel(f"{result.total_matches} matches")
-        matches_label.setStyleSheet("""
-            QLabel {
-                font-size: 14px;
-                color: #27ae60;
-                font-weight: bold;
-                background-color: #d4edda;
-                padding: 4px 8px;
-                border-radius: 12px;
-            }
-        """)
-        header_layout.addWidget(matches_label)
-        header_layout.addStretch()
-        
-        layout.addLayout(header_layout)
-        
-        # matched keywords with counts
-        keywords_text = self._format_matched_keywords(result.keyword_matches)
-        keywords_label = QtWidgets.QLabel(keywords_text)
-        keywords_label.setStyleSheet("""
-            QLabel {
-                font-size: 12px;
-                color: #6c757d;
-                background-color: #f8f9fa;
-                padding: 8px;
-                border-radius: 4px;
-                border-left: 3px solid #3498db;
-            }
-        """)
-        keywords_label.setWordWrap(True)
-        layout.addWidget(keywords_label)
-        
-        # contact info if available
-        if result.resume.phone or result.resume.address:
-            contact_parts = []
-            if result.resume.phone:
-                contact_parts.append(f"📞 {result.resume.phone}")
-            if result.resume.address:
-                contact_parts.append(f"📍 {result.resume.address[:50]}...")
-            
-            contact_label = QtWidgets.QLabel(" | ".join(contact_parts))
-            contact_label.setStyleSheet("""
-                QLabel {
-                    font-size: 11px;
-                    color: #868e96;
-                    padding: 4px 0;
-                }
-            """)
-            layout.addWidget(contact_label)
-        
-        # action buttons
-        buttons_layout = QtWidgets.QHBoxLayout()
-        
-        # summary button
-        summary_btn = QtWidgets.QPushButton("📋 Summary")
-        summary_btn.setStyleSheet(self._get_button_style("#3498db"))
-        summary_btn.clicked.connect(
-            lambda: self.summary_requested.emit(result.resume.id)
-        )
-        buttons_layout.addWidget(summary_btn)
-        
-        # view cv button
-        view_btn = QtWidgets.QPushButton("📄 View CV")
-        view_btn.setStyleSheet(self._get_button_style("#2ecc71"))
-        view_btn.clicked.connect(
-            lambda: self.view_cv_requested.emit(result.resume.id)
-        )
-        buttons_layout.addWidget(view_btn)
-        
-        buttons_layout.addStretch()
-        layout.addLayout(buttons_layout)
-        
-        return card
-    
-    def _format_matched_keywords(self, keyword_matches: dict) -> str:
-        """format matched keywords untuk display yang readable"""
-        if not keyword_matches:
-            return "❌ No keywords matched"
-        
-        formatted = []
-        for keyword, count in keyword_matches.items():
-            if count > 0:
-                if "(fuzzy)" in keyword.lower():
-                    formatted.append(f"🔍 {keyword}: {count}x")
-                else:
-                    formatted.append(f"✅ {keyword}: {count}x")
-        
-        return "  •  ".join(formatted) if formatted else "❌ No keywords matched"
-    
-    def _get_button_style(self, color: str) -> str:
-        """get button style dengan hover effects"""
-        return f"""
-            QPushButton {{
-                background-color: {color};
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-size: 12px;
-                font-weight: bold;
-                min-width: 90px;
-            }}
-            QPushButton:hover {{
-                background-color: {color}dd;
-                transform: translateY(-1px);
-            }}
-            QPushButton:pressed {{
-                background-color: {color}bb;
-                transform: translateY(0px);
-            }}
-        """
-    
     def show_loading(self, message: str = "Searching..."):
-        """show loading state dengan animation"""
+        """show loading state"""
         self.clear_results()
-        
-        loading_widget = QtWidgets.QWidget()
-        loading_layout = QtWidgets.QVBoxLayout(loading_widget)
-        loading_layout.setAlignment(QtCore.Qt.AlignCenter)
-        
-        loading_label = QtWidgets.QLabel(f"🔍 {message}")
-        loading_label.setAlignment(QtCore.Qt.AlignCenter)
-        loading_label.setStyleSheet("""
-            QLabel {
-                font-size: 16px;
-                color: #3498db;
-                padding: 50px;
-                background-color: #f0f8ff;
-                border-radius: 8px;
-                border: 2px solid #3498db;
-            }
-        """)
-        
-        loading_layout.addWidget(loading_label)
-        self.results_layout.addWidget(loading_widget)
+        self._show_message(f"🔍 {message}", "#3498db", "#f0f8ff", "2px solid #3498db")
     
     def get_result_by_id(self, resume_id: str) -> SearchResult:
         """get search result by resume id"""
         for result in self.search_results:
             if result.resume.id == resume_id:
                 return result
-        return None
\ No newline at end of file
+        return None
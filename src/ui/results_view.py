@@ -0,0 +1,241 @@
+# src/ui/results_view.py
+from typing import List, Optional
+from PyQt5 import QtWidgets, QtCore, QtGui
+from database.models import SearchResult
+
+def format_matched_keywords(keyword_matches: dict) -> str:
+    """format matched keywords untuk display yang readable"""
+    if not keyword_matches:
+        return "❌ No keywords matched"
+
+    formatted = []
+    for keyword, count in keyword_matches.items():
+        if count > 0:
+            if "(fuzzy)" in keyword.lower():
+                formatted.append(f"🔍 {keyword}: {count}x")
+            else:
+                formatted.append(f"✅ {keyword}: {count}x")
+
+    return "  •  ".join(formatted) if formatted else "❌ No keywords matched"
+
+class ResultsListModel(QtCore.QAbstractListModel):
+    """model hasil search untuk QListView, update top-n dilakukan inkremental (insert/remove/dataChanged)"""
+
+    ResultRole = QtCore.Qt.UserRole + 1  # SearchResult utuh untuk delegate
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.results: List[SearchResult] = []
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.results)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self.results):
+            return None
+
+        result = self.results[index.row()]
+        if role == self.ResultRole:
+            return result
+        if role == QtCore.Qt.DisplayRole:
+            return result.resume.name or f"Candidate {result.resume.id}"
+        if role == QtCore.Qt.ToolTipRole:
+            return format_matched_keywords(result.keyword_matches)
+        return None
+
+    def result_at(self, row: int) -> Optional[SearchResult]:
+        return self.results[row] if 0 <= row < len(self.results) else None
+
+    @staticmethod
+    def _same_row(old: SearchResult, new: SearchResult) -> bool:
+        """baris tidak perlu di-repaint jika resume dan angka match-nya sama"""
+        return old is new or (
+            old.resume.id == new.resume.id
+            and old.keyword_matches == new.keyword_matches
+            and old.relevance_score == new.relevance_score
+        )
+
+    def set_results(self, results: List[SearchResult]):
+        """ganti isi model dengan top-n baru (misal hasil partial yang di-rank ulang)
+
+        hanya baris yang berubah yang di-update; baris baru di akhir di-insert dan baris sisa di-remove,
+        jadi view tidak membangun ulang seluruh list dan posisi scroll tetap
+        """
+        old_count, new_count = len(self.results), len(results)
+        common = min(old_count, new_count)
+
+        first_changed = last_changed = None
+        for row in range(common):
+            if not self._same_row(self.results[row], results[row]):
+                if first_changed is None:
+                    first_changed = row
+                last_changed = row
+
+        if new_count < old_count:
+            self.beginRemoveRows(QtCore.QModelIndex(), new_count, old_count - 1)
+            self.results = list(results)
+            self.endRemoveRows()
+        elif new_count > old_count:
+            self.beginInsertRows(QtCore.QModelIndex(), old_count, new_count - 1)
+            self.results = list(results)
+            self.endInsertRows()
+        else:
+            self.results = list(results)
+
+        if first_changed is not None:
+            self.dataChanged.emit(self.index(first_changed), self.index(last_changed))
+
+    def clear(self):
+        self.beginResetModel()
+        self.results = []
+        self.endResetModel()
+
+class ResultCardDelegate(QtWidgets.QStyledItemDelegate):
+    """menggambar satu hasil search sebagai card langsung dengan QPainter (tanpa widget per hasil)
+
+    view hanya memanggil paint untuk baris yang terlihat, jadi biaya render tidak bergantung jumlah hasil
+    """
+
+    summary_clicked = QtCore.pyqtSignal(str)  # resume_id
+    view_cv_clicked = QtCore.pyqtSignal(str)  # resume_id
+
+    CARD_HEIGHT = 172
+    SPACING = 10  # jarak antar card
+    PADDING = 15
+    BUTTON_WIDTH = 110
+    BUTTON_HEIGHT = 32
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.name_font = self._font(16, bold=True)
+        self.badge_font = self._font(11, bold=True)
+        self.matches_font = self._font(14, bold=True)
+        self.keywords_font = self._font(12)
+        self.contact_font = self._font(11)
+        self.button_font = self._font(12, bold=True)
+
+    @staticmethod
+    def _font(pixel_size: int, bold: bool = False) -> QtGui.QFont:
+        font = QtGui.QFont()
+        font.setPixelSize(pixel_size)
+        font.setBold(bold)
+        return font
+
+    def sizeHint(self, option, index):
+        return QtCore.QSize(option.rect.width(), self.CARD_HEIGHT + self.SPACING)
+
+    def _card_rect(self, rect: QtCore.QRect) -> QtCore.QRect:
+        return rect.adjusted(1, self.SPACING // 2, -1, -self.SPACING // 2)
+
+    def _button_rects(self, card: QtCore.QRect):
+        """rect tombol summary dan view cv di dalam card"""
+        top = card.bottom() - self.PADDING - self.BUTTON_HEIGHT
+        summary = QtCore.QRect(card.left() + self.PADDING, top, self.BUTTON_WIDTH, self.BUTTON_HEIGHT)
+        return summary, summary.translated(self.BUTTON_WIDTH + 10, 0)
+
+    def _draw_pill(self, painter, left: int, top: int, text: str, font, background: str, color: str, height: int) -> int:
+        """gambar badge rounded, return posisi x setelah badge"""
+        width = QtGui.QFontMetrics(font).horizontalAdvance(text) + 16
+        rect = QtCore.QRect(left, top, width, height)
+        painter.setPen(QtCore.Qt.NoPen)
+        painter.setBrush(QtGui.QColor(background))
+        painter.drawRoundedRect(rect, height / 2, height / 2)
+        painter.setPen(QtGui.QColor(color))
+        painter.setFont(font)
+        painter.drawText(rect, QtCore.Qt.AlignCenter, text)
+        return rect.right() + 8
+
+    def _draw_button(self, painter, rect: QtCore.QRect, text: str, color: str):
+        painter.setPen(QtCore.Qt.NoPen)
+        painter.setBrush(QtGui.QColor(color))
+        painter.drawRoundedRect(rect, 6, 6)
+        painter.setPen(QtGui.QColor("white"))
+        painter.setFont(self.button_font)
+        painter.drawText(rect, QtCore.Qt.AlignCenter, text)
+
+    def paint(self, painter, option, index):
+        result = index.data(ResultsListModel.ResultRole)
+        if result is None:
+            return
+
+        painter.save()
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+
+        # card background
+        card = self._card_rect(option.rect)
+        hovered = bool(option.state & QtWidgets.QStyle.State_MouseOver)
+        painter.setPen(QtGui.QPen(QtGui.QColor("#3498db" if hovered else "#dee2e6"), 1))
+        painter.setBrush(QtGui.QColor("white"))
+        painter.drawRoundedRect(card, 8, 8)
+
+        left = card.left() + self.PADDING
+        width = card.width() - 2 * self.PADDING
+        top = card.top() + self.PADDING
+
+        # header: rank + name, category badge, total matches
+        matches_text = f"{result.total_matches} matches"
+        if result.relevance_score is not None:
+            matches_text += f" · score {result.relevance_score:.2f}"
+        badges_width = (QtGui.QFontMetrics(self.badge_font).horizontalAdvance(result.resume.category or "")
+                        + QtGui.QFontMetrics(self.matches_font).horizontalAdvance(matches_text) + 56)
+
+        name = result.resume.name or f"Candidate {result.resume.id}"
+        name_metrics = QtGui.QFontMetrics(self.name_font)
+        name_text = name_metrics.elidedText(f"#{index.row() + 1}. {name}", QtCore.Qt.ElideRight, max(width - badges_width, 80))
+        painter.setFont(self.name_font)
+        painter.setPen(QtGui.QColor("#2c3e50"))
+        painter.drawText(QtCore.QRect(left, top, width, 28), QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter, name_text)
+
+        x = left + name_metrics.horizontalAdvance(name_text) + 10
+        if result.resume.category:
+            x = self._draw_pill(painter, x, top + 4, result.resume.category, self.badge_font, "#e9ecef", "#495057", 20)
+        self._draw_pill(painter, x, top + 1, matches_text, self.matches_font, "#d4edda", "#27ae60", 26)
+
+        # matched keywords with counts
+        top += 40
+        keywords_rect = QtCore.QRect(left, top, width, 34)
+        painter.setPen(QtCore.Qt.NoPen)
+        painter.setBrush(QtGui.QColor("#f8f9fa"))
+        painter.drawRoundedRect(keywords_rect, 4, 4)
+        painter.setBrush(QtGui.QColor("#3498db"))
+        painter.drawRect(QtCore.QRect(left, top, 3, 34))
+        painter.setFont(self.keywords_font)
+        painter.setPen(QtGui.QColor("#6c757d"))
+        keywords_text = QtGui.QFontMetrics(self.keywords_font).elidedText(
+            format_matched_keywords(result.keyword_matches), QtCore.Qt.ElideRight, width - 20
+        )
+        painter.drawText(keywords_rect.adjusted(11, 0, -8, 0), QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter, keywords_text)
+
+        # contact info if available
+        contact_parts = []
+        if result.resume.phone:
+            contact_parts.append(f"📞 {result.resume.phone}")
+        if result.resume.address:
+            contact_parts.append(f"📍 {result.resume.address[:50]}...")
+        if contact_parts:
+            top += 40
+            painter.setFont(self.contact_font)
+            painter.setPen(QtGui.QColor("#868e96"))
+            contact_text = QtGui.QFontMetrics(self.contact_font).elidedText(" | ".join(contact_parts), QtCore.Qt.ElideRight, width)
+            painter.drawText(QtCore.QRect(left, top, width, 18), QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter, contact_text)
+
+        # action buttons
+        summary_rect, view_rect = self._button_rects(card)
+        self._draw_button(painter, summary_rect, "📋 Summary", "#3498db")
+        self._draw_button(painter, view_rect, "📄 View CV", "#2ecc71")
+
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        """klik pada area tombol yang digambar diteruskan sebagai sinyal"""
+        if event.type() == QtCore.QEvent.MouseButtonRelease and event.button() == QtCore.Qt.LeftButton:
+            result = index.data(ResultsListModel.ResultRole)
+            if result is not None:
+                summary_rect, view_rect = self._button_rects(self._card_rect(option.rect))
+                if summary_rect.contains(event.pos()):
+                    self.summary_clicked.emit(result.resume.id)
+                    return True
+                if view_rect.contains(event.pos()):
+                    self.view_cv_clicked.emit(result.resume.id)
+                    return True
+        return super().editorEvent(event, model, option, index)
@@ -5,9 +5,11 @@ class SearchPanel(QtWidgets.QWidget):
     """panel input untuk pencarian cv tanpa 4-param emit issue"""
     
     search_requested = QtCore.pyqtSignal(dict)
+    cancel_requested = QtCore.pyqtSignal()  # search berjalan dibatalkan (tombol cancel / keyword diubah)
     
     def __init__(self):
         super().__init__()
+        self.searching = False
         self.setup_ui()
         self.setup_connections()
     
@@ -122,6 +124,7 @@ class SearchPanel(QtWidgets.QWidget):
         self.kmp_radio = QtWidgets.QRadioButton("KMP")
         self.bm_radio = QtWidgets.QRadioButton("BM")
         self.ac_radio = QtWidgets.QRadioButton("AC")  # Aho-Corasick
+        self.index_radio = QtWidgets.QRadioButton("Index")  # inverted index, tanpa scan teks
         
         # set KMP as default
         self.kmp_radio.setChecked(True)
@@ -129,6 +132,7 @@ class SearchPanel(QtWidgets.QWidget):
         exact_layout.addWidget(self.kmp_radio)
         exact_layout.addWidget(self.bm_radio)
         exact_layout.addWidget(self.ac_radio)
+        exact_layout.addWidget(self.index_radio)
         layout.addLayout(exact_layout)
         
         # fuzzy matching algorithm
@@ -144,6 +148,7 @@ class SearchPanel(QtWidgets.QWidget):
             "• KMP: Fast single pattern matching\n"
             "• BM: Efficient for longer patterns\n"
             "• AC: Multiple pattern matching (bonus)\n"
+            "• Index: Counts from inverted index, no text scan (fastest)\n"
             "• Levenshtein: Handles typos and variations"
         )
         desc_label.setStyleSheet("""
@@ -194,6 +199,18 @@ class SearchPanel(QtWidgets.QWidget):
         """)
         layout.addWidget(self.matches_spin)
         
+        # relevance ranking (bm25) instead of raw match count
+        self.bm25_checkbox = QtWidgets.QCheckBox("Rank by relevance (BM25)")
+        self.bm25_checkbox.setToolTip("rank dengan idf per keyword dan normalisasi panjang cv, bukan total match")
+        self.bm25_checkbox.setStyleSheet("""
+            QCheckBox {
+                font-size: 12px;
+                font-weight: normal;
+                color: #2c3e50;
+            }
+        """)
+        layout.addWidget(self.bm25_checkbox)
+        
         return group
     
     def _create_threshold_section(self) -> QtWidgets.QGroupBox:
@@ -265,8 +282,9 @@ class SearchPanel(QtWidgets.QWidget):
     
     def setup_connections(self):
         """setup signal connections"""
-        self.search_button.clicked.connect(self.on_search_clicked)
+        self.search_button.clicked.connect(self.on_search_button_clicked)
         self.keywords_input.returnPressed.connect(self.on_search_clicked)
+        self.keywords_input.textEdited.connect(self.on_keywords_edited)
         self.threshold_slider.valueChanged.connect(self.update_threshold_label)
     
     def update_threshold_label(self, value):
@@ -274,6 +292,18 @@ class SearchPanel(QtWidgets.QWidget):
         threshold = value / 100.0
         self.threshold_label.setText(f"{threshold:.2f} ({value}% similarity)")
     
+    def on_search_button_clicked(self):
+        """tombol search berubah jadi tombol cancel selama search berjalan"""
+        if self.searching:
+            self.cancel_requested.emit()
+        else:
+            self.on_search_clicked()
+    
+    def on_keywords_edited(self, text):
+        """keyword diubah selama search berjalan, hasil search lama tidak relevan lagi"""
+        if self.searching:
+            self.cancel_requested.emit()
+    
     def on_search_clicked(self):
         """handle search button click"""
         keywords_text = self.keywords_input.text().strip()
@@ -300,30 +330,33 @@ class SearchPanel(QtWidgets.QWidget):
             algorithm = "BM"
         elif self.ac_radio.isChecked():
             algorithm = "AC"
+        elif self.index_radio.isChecked():
+            algorithm = "INDEX"
         elif self.levenshtein_radio.isChecked():
             algorithm = "LEVENSHTEIN"
         
         # get other parameters
         top_n = self.matches_spin.value()
         threshold = self.threshold_slider.value() / 100.0
+        scoring = "BM25" if self.bm25_checkbox.isChecked() else "COUNT"
         
         # create search parameters dict
         search_params = {
             'keywords': keywords,
             'algorithm': algorithm,
             'top_n': top_n,
-            'threshold': threshold
+            'threshold': threshold,
+            'scoring': scoring
         }
         
         print(f"🎯 emitting search signal with params: {search_params}")
         self.search_requested.emit(search_params)
     
     def set_search_enabled(self, enabled: bool):
-        """enable/disable search functionality"""
-        self.search_button.setEnabled(enabled)
-        self.keywords_input.setEnabled(enabled)
+        """switch antara mode siap search dan mode searching (keyword tetap bisa diedit untuk search baru)"""
+        self.searching = not enabled
         
         if enabled:
             self.search_button.setText("🔍 Search CVs")
         else:
-            self.search_button.setText("⏳ Searching...")
\ No newline at end of file
+            self.search_button.setText("⏹ Cancel Search")
\ No newline at end of file
@@ -0,0 +1,73 @@
+# src/ui/search_worker.py
+import threading
+import traceback
+from PyQt5 import QtCore
+from controller.search import SearchController, SearchCancelled
+
+class SearchWorker(QtCore.QObject):
+    """menjalankan search_cvs di QThread terpisah supaya gui tidak freeze selama search
+
+    setiap request punya id yang naik terus; request yang sudah digantikan request baru dilewati,
+    dan gui cukup mengabaikan sinyal dengan id lama
+    """
+
+    progress = QtCore.pyqtSignal(str)
+    partial_results = QtCore.pyqtSignal(int, object)  # request id, top-n sementara
+    search_finished = QtCore.pyqtSignal(int, object, str)  # request id, results, timing info
+    search_cancelled = QtCore.pyqtSignal(int)
+    search_failed = QtCore.pyqtSignal(int, str)
+
+    def __init__(self, search_controller: SearchController):
+        super().__init__()
+        self.search_controller = search_controller
+        self.latest_request_id = 0  # di-set dari gui thread setiap ada request baru
+        self._running_request_id = 0
+        self._cancel_event = threading.Event()  # event pembatalan request terbaru, diganti dari gui thread
+
+        search_controller.set_progress_callback(self.progress.emit)
+        search_controller.set_partial_results_callback(self._emit_partial_results)
+
+    def begin_request(self, request_id: int) -> threading.Event:
+        """daftarkan request baru sebelum dikirim ke worker (dipanggil dari gui thread)
+
+        request sebelumnya dibatalkan lewat event miliknya, request baru mendapat event sendiri
+        yang dikirim bersama request, jadi cancel tidak bisa hilang di antara dispatch dan search mulai
+        """
+        self._cancel_event.set()
+        self._cancel_event = threading.Event()
+        self.latest_request_id = request_id
+        return self._cancel_event
+
+    def cancel(self):
+        """batalkan search yang sedang berjalan (dipanggil dari gui thread)"""
+        self._cancel_event.set()
+
+    @QtCore.pyqtSlot(int, dict, object)
+    def run_search(self, request_id: int, search_params: dict, cancel_event: threading.Event):
+        """jalankan satu request search (slot ini berjalan di thread worker)"""
+        if request_id != self.latest_request_id:
+            # sudah ada request yang lebih baru di antrian
+            self.search_cancelled.emit(request_id)
+            return
+
+        self._running_request_id = request_id
+        try:
+            results, timing_info = self.search_controller.search_cvs(
+                keywords=search_params.get('keywords', []),
+                algorithm=search_params.get('algorithm', 'KMP'),
+                top_n=search_params.get('top_n', 10),
+                fuzzy_threshold=search_params.get('threshold', 0.7),
+                scoring=search_params.get('scoring', 'COUNT'),
+                cancel_event=cancel_event
+            )
+            self.search_finished.emit(request_id, results, timing_info)
+        except SearchCancelled:
+            print(f"⏹️ search request {request_id} cancelled")
+            self.search_cancelled.emit(request_id)
+        except Exception as e:
+            print(f"search error: {e}")
+            traceback.print_exc()
+            self.search_failed.emit(request_id, str(e))
+
+    def _emit_partial_results(self, results):
+        self.partial_results.emit(self._running_request_id, results)
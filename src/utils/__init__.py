@@ -6,5 +6,7 @@ This package contains utility functions and classes for the ATS CV Search applic
 from .pdf_extractor import PDFExtractor
 from .regex_extractor import RegexExtractor
 from .timer import SearchTimer
+from .text_cache import TextCache
+from .corpus_index import CorpusIndex
 
-__all__ = ['PDFExtractor', 'RegexExtractor', 'SearchTimer']
+__all__ = ['PDFExtractor', 'RegexExtractor', 'SearchTimer', 'TextCache', 'CorpusIndex']
@@ -0,0 +1,234 @@
+# src/utils/corpus_index.py
+import os
+import pickle
+from typing import Dict, List, Optional
+from algorithm.inverted_index import InvertedIndex
+from algorithm.ngram_filter import NGramFilter
+from algorithm.similarity_filter import SimilarityFilter
+from utils.pdf_extractor import SKIPPED_TEXTS, MATCH_TEXT_LIMIT
+from utils.text_cache import get_cache_dir
+from utils.corpus_pack import CorpusPack
+from utils.token_stream import TokenStream, TokenStreamStore
+
+class CorpusIndex:
+    """inverted index seluruh corpus cv, disinkronkan dengan resume di database dan disimpan ke disk"""
+
+    FORMAT_VERSION = 9
+
+    def __init__(self, index_path: Optional[str] = None):
+        self.index_path = index_path or os.path.join(get_cache_dir(), 'corpus_index.pkl')
+        self.index = InvertedIndex()
+        self.fuzzy_index = InvertedIndex()  # vocabulary kata ternormalisasi (alnum lowercase) untuk fuzzy search
+        self.fuzzy_filter = SimilarityFilter()  # prefilter vocabulary untuk kandidat fuzzy (tanpa false negative)
+        self.token_streams = TokenStreamStore(os.path.dirname(self.index_path))
+        self.ngrams = NGramFilter()  # bitset trigram per slot, prefilter sebelum scan teks penuh
+        self.doc_ids = []  # slot (integer doc di index) -> resume id
+        self.slots = {}  # resume id -> slot
+        self.fingerprints = {}  # resume id -> (file path, size, mtime) saat di-index
+        self.version = 0  # naik setiap kali isi index berubah
+        if not self._load():
+            # index di disk tidak dipakai, file pack generasi lain sisa index lama ikut dibuang
+            self.token_streams.remove_orphans()
+
+    def _fingerprint(self, pdf_path: str):
+        """fingerprint file untuk deteksi perubahan tanpa membaca isi file"""
+        try:
+            stat = os.stat(pdf_path)
+            return (pdf_path, stat.st_size, stat.st_mtime_ns)
+        except OSError:
+            return None
+
+    def _load(self) -> bool:
+        """load index dari disk jika ada dan formatnya cocok, return False jika index harus dibangun ulang"""
+        if not os.path.exists(self.index_path):
+            return False
+
+        try:
+            with open(self.index_path, 'rb') as file:
+                state = pickle.load(file)
+            if state.get('format_version') != self.FORMAT_VERSION:
+                print("⚠️ corpus index format changed, rebuilding")
+                return False
+            if not state['token_streams'].is_valid():
+                print("⚠️ corpus pack missing or truncated, rebuilding")
+                return False
+
+            self.index = state['index']
+            self.fuzzy_index = state['fuzzy_index']
+            self.fuzzy_filter = state['fuzzy_filter']
+            self.token_streams = state['token_streams']
+            self.ngrams = state['ngrams']
+            self.doc_ids = state['doc_ids']
+            self.fingerprints = state['fingerprints']
+            self.version = state['version']
+            self.slots = {resume_id: slot for slot, resume_id in enumerate(self.doc_ids) if resume_id is not None}
+            print(f"📚 loaded corpus index: {self.index.get_stats()}")
+            return True
+        except Exception as e:
+            print(f"⚠️ failed to load corpus index, rebuilding: {e}")
+            return False
+
+    def save(self):
+        """simpan index ke disk (tulis ke file sementara lalu rename)
+
+        compact menulis pack ke file generasi baru, file pack lama baru dihapus setelah rename index berhasil,
+        jadi save yang gagal di tengah jalan selalu menyisakan index dan pack yang cocok
+        """
+        tmp_path = self.index_path + '.tmp'
+        try:
+            self.token_streams.compact()
+        except OSError as e:
+            print(f"⚠️ failed to compact corpus pack: {e}")
+
+        state = {
+            'format_version': self.FORMAT_VERSION,
+            'index': self.index,
+            'fuzzy_index': self.fuzzy_index,
+            'fuzzy_filter': self.fuzzy_filter,
+            'token_streams': self.token_streams,
+            'ngrams': self.ngrams,
+            'doc_ids': self.doc_ids,
+            'fingerprints': self.fingerprints,
+            'version': self.version,
+        }
+        try:
+            with open(tmp_path, 'wb') as file:
+                pickle.dump(state, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            print(f"⚠️ failed to save corpus index: {e}")
+            return
+        self.token_streams.discard_stale()
+
+    def sync(self, resumes, pdf_extractor, progress_callback=None, check_cancelled=None) -> int:
+        """pastikan semua resume ter-index, teks yang belum ada diekstrak paralel; return jumlah dokumen baru
+
+        resume yang sudah ter-index dari path yang sama tidak di-stat ulang. file hanya dicek lagi jika
+        belum pernah berhasil diekstrak atau path-nya berubah (repository menulis path baru saat file gagal dibuka)
+        check_cancelled dipanggil sebelum setiap file diproses dan boleh raise untuk menghentikan sync;
+        dokumen yang sudah ter-index tetap disimpan, sisanya di-index pada sync berikutnya
+        """
+        stale = {}
+        for resume in resumes:
+            known = self.fingerprints.get(resume.id)
+            if known is not None and known[0] == resume.file_path:
+                continue
+
+            stale.setdefault(resume.file_path, []).append((resume.id, self._fingerprint(resume.file_path)))
+
+        if not stale:
+            return 0
+
+        print(f"📚 indexing {sum(len(items) for items in stale.values())} cvs")
+        indexed = 0
+        changed = False
+
+        try:
+            for done, (pdf_path, text) in enumerate(pdf_extractor.extract_texts_parallel(list(stale)), 1):
+                if check_cancelled:
+                    check_cancelled()
+                if progress_callback and done % 20 == 0:
+                    progress_callback(f"Indexing CV {done}/{len(stale)}")
+
+                for resume_id, fingerprint in stale[pdf_path]:
+                    changed = self._remove(resume_id) or changed
+                    if not text or text in SKIPPED_TEXTS:
+                        continue
+
+                    # teks di-tokenize sekali di sini, index dan matcher memakai token stream yang sama
+                    self._add(resume_id, self.token_streams.add(resume_id, text))
+                    if fingerprint is not None:
+                        self.fingerprints[resume_id] = fingerprint
+                    indexed += 1
+                    changed = True
+
+                # teks sudah ada di corpus pack, salinan string di memory extractor tidak perlu disimpan
+                pdf_extractor.evict(pdf_path)
+        finally:
+            # juga saat sync dihentikan di tengah jalan, dokumen yang sudah masuk index tidak diekstrak ulang
+            if changed:
+                self.version += 1
+                self.save()
+                print(f"📚 corpus index updated: {self.index.get_stats()}")
+        return indexed
+
+    def _add(self, resume_id: str, stream: TokenStream):
+        """index dokumen baru di slot baru (postings tetap urut berdasarkan slot)"""
+        slot = len(self.doc_ids)
+        self.doc_ids.append(resume_id)
+        self.slots[resume_id] = slot
+        self.index.add_tokens(slot, stream.terms(MATCH_TEXT_LIMIT))  # exact search memakai teks terpotong
+        self.fuzzy_index.add_tokens(slot, stream.tokens())  # fuzzy search memakai teks penuh
+        self.ngrams.add(slot, stream.text)
+        for word in self.fuzzy_index.doc_terms[slot]:
+            self.fuzzy_filter.add(word)
+
+    def _remove(self, resume_id: str) -> bool:
+        """hapus dokumen lama dari index, slot-nya tidak dipakai ulang"""
+        slot = self.slots.pop(resume_id, None)
+        self.fingerprints.pop(resume_id, None)
+        if slot is None:
+            return False
+
+        self.index.remove_document(slot)
+        self.fuzzy_index.remove_document(slot)
+        self.token_streams.remove(resume_id)
+        self.ngrams.remove(slot)
+        self.doc_ids[slot] = None
+        return True
+
+    def lookup(self, keyword: str) -> Dict[str, List[int]]:
+        """cari keyword tanpa spasi lewat postings, return {resume id: [positions]}"""
+        return {self.doc_ids[slot]: positions for slot, positions in self.index.lookup(keyword).items()}
+
+    def lookup_candidates(self, keyword: str) -> set:
+        """resume id yang mengandung keyword tanpa spasi (prefilter exact matcher, posisi tidak dihitung)"""
+        return {self.doc_ids[slot] for slot in self.index.lookup_docs(keyword)}
+
+    def phrase_lookup(self, phrase: str) -> Dict[str, List[int]]:
+        """cari phrase multi-kata lewat posisi term, return {resume id: [positions]}"""
+        return {self.doc_ids[slot]: positions for slot, positions in self.index.phrase_lookup(phrase).items()}
+
+    def phrase_candidates(self, phrase: str) -> set:
+        """resume id yang mengandung phrase multi-kata"""
+        return {self.doc_ids[slot] for slot in self.index.phrase_candidates(phrase)}
+
+    def fuzzy_candidates(self, word: str, threshold: float) -> List[str]:
+        """kata vocabulary yang mungkin mencapai similarity threshold terhadap word (superset, dinilai ulang oleh matcher)"""
+        # kata dari cv yang sudah dihapus tetap ada di filter, saring lewat postings
+        return [candidate for candidate in self.fuzzy_filter.candidates(word, threshold) if candidate in self.fuzzy_index.postings]
+
+    def fuzzy_lookup(self, words: List[str]) -> Dict[str, List[int]]:
+        """resume yang mengandung salah satu kata vocabulary, return {resume id: [positions]}"""
+        return {self.doc_ids[slot]: positions for slot, positions in self.fuzzy_index.lookup_terms(words).items()}
+
+    def scan_candidates(self, keyword: str, max_distance: int = 0) -> set:
+        """resume id yang mungkin mengandung keyword dalam max_distance edit (prefilter bitset trigram)"""
+        doc_ids = self.doc_ids
+        return {doc_ids[slot] for slot in self.ngrams.candidates(keyword, max_distance).tolist() if doc_ids[slot] is not None}
+
+    def document_length(self, resume_id: str) -> int:
+        """jumlah term cv di teks exact search (0 jika belum ter-index)"""
+        slot = self.slots.get(resume_id)
+        return 0 if slot is None else self.index.doc_lengths.get(slot, 0)
+
+    def average_document_length(self) -> float:
+        """rata-rata jumlah term per cv, dihitung inkremental saat index berubah"""
+        return self.index.average_length()
+
+    def token_stream(self, resume_id: str) -> Optional[TokenStream]:
+        """token stream cv (teks lowercase + token) yang dibuat saat ingest"""
+        return self.token_streams.get(resume_id)
+
+    def text_view(self, resume_id: str) -> Optional[memoryview]:
+        """teks lowercase cv (utf-8) sebagai slice zero-copy dari corpus pack"""
+        return self.token_streams.texts.view(resume_id)
+
+    @property
+    def corpus_pack(self) -> CorpusPack:
+        """corpus pack teks semua cv, bisa dikirim ke worker process (hanya index offset yang di-pickle)"""
+        return self.token_streams.texts
+
+    def has_document(self, resume_id: str) -> bool:
+        """cek apakah resume sudah ter-index"""
+        return resume_id in self.slots
@@ -0,0 +1,174 @@
+# src/utils/corpus_pack.py
+import os
+import copy
+import glob
+import mmap
+from typing import Dict, Optional
+
+class CorpusPack:
+    """blob biner append-only berisi record per resume id (misal teks utf-8 semua cv), dibaca lewat mmap
+
+    index (resume id -> offset, panjang) ikut di-pickle bersama pemiliknya, file blob-nya tidak.
+    proses lain yang menerima pack hasil pickle membuka file yang sama, jadi semua proses berbagi
+    satu salinan corpus di page cache dan slice dibaca zero-copy lewat memoryview
+
+    compact menulis file generasi baru (misal corpus.1.pack), file lama baru dihapus lewat discard_stale
+    setelah index yang menunjuk file baru tersimpan
+    """
+
+    def __init__(self, path: str):
+        self.base_path = path
+        self.path = path  # file aktif, berganti ke generasi baru setiap compact
+        self.generation = 0
+        self.offsets = {}  # resume id -> (offset, panjang) dalam byte
+        self.end = 0  # akhir data valid di file, byte setelahnya sisa tulis yang belum tercatat
+        self.dead_bytes = 0  # byte milik record yang sudah dihapus, dibuang saat compact
+        self._mmap = None
+        self._stale_paths = []  # file generasi lama yang masih dipakai index di disk
+
+    def put(self, resume_id: str, data: bytes):
+        """tambahkan record di akhir file (record lama dengan id sama dianggap terhapus)"""
+        self.remove(resume_id)
+        self._close_mmap()
+
+        mode = 'r+b' if os.path.exists(self.path) else 'w+b'
+        with open(self.path, mode) as file:
+            # buang sisa tulis yang tidak tercatat (misal proses mati sebelum index disimpan)
+            file.truncate(self.end)
+            file.seek(self.end)
+            file.write(data)
+
+        self.offsets[resume_id] = (self.end, len(data))
+        self.end += len(data)
+
+    def remove(self, resume_id: str) -> bool:
+        """hapus record dari index, byte-nya baru dibuang saat compact"""
+        entry = self.offsets.pop(resume_id, None)
+        if entry is None:
+            return False
+        self.dead_bytes += entry[1]
+        return True
+
+    def view(self, resume_id: str) -> Optional[memoryview]:
+        """slice record langsung dari mmap (tanpa copy)"""
+        entry = self.offsets.get(resume_id)
+        if entry is None:
+            return None
+
+        buffer = self._get_mmap()
+        if buffer is None:
+            return None
+
+        offset, length = entry
+        return memoryview(buffer)[offset:offset + length]
+
+    def text(self, resume_id: str) -> Optional[str]:
+        """decode record utf-8 jadi string"""
+        view = self.view(resume_id)
+        return None if view is None else str(view, 'utf-8')
+
+    def __contains__(self, resume_id):
+        return resume_id in self.offsets
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def _get_mmap(self):
+        if self._mmap is None:
+            if self.end == 0:
+                return None
+            try:
+                with open(self.path, 'rb') as file:
+                    self._mmap = mmap.mmap(file.fileno(), self.end, access=mmap.ACCESS_READ)
+            except (OSError, ValueError) as e:
+                print(f"⚠️ failed to map {self.path}: {e}")
+                return None
+        return self._mmap
+
+    def _close_mmap(self):
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                pass  # masih ada slice yang dipakai, mmap ditutup saat tidak direferensikan lagi
+            self._mmap = None
+
+    def is_valid(self) -> bool:
+        """cek file cocok dengan index (file hilang / terpotong berarti harus rebuild)"""
+        try:
+            return os.path.getsize(self.path) >= self.end
+        except OSError:
+            return self.end == 0
+
+    def compact(self):
+        """tulis ulang record yang masih hidup ke file generasi baru jika lebih dari separuh isi file sudah dihapus
+
+        file lama tidak disentuh, index di disk yang masih menunjuk file lama tetap valid sampai discard_stale
+        """
+        if self.dead_bytes * 2 <= self.end:
+            return
+
+        buffer = self._get_mmap()
+        if buffer is None:
+            return
+
+        generation = self.generation + 1
+        root, ext = os.path.splitext(self.base_path)
+        new_path = f"{root}.{generation}{ext}"
+        offsets = {}
+        position = 0
+        with open(new_path, 'wb') as file:
+            for resume_id, (offset, length) in self.offsets.items():
+                file.write(buffer[offset:offset + length])
+                offsets[resume_id] = (position, length)
+                position += length
+
+        self._close_mmap()
+        self._stale_paths.append(self.path)
+        self.path = new_path
+        self.generation = generation
+        self.offsets = offsets
+        self.end = position
+        self.dead_bytes = 0
+
+    def discard_stale(self):
+        """hapus file generasi lama, dipanggil setelah index yang menunjuk file aktif tersimpan"""
+        for path in self._stale_paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._stale_paths = []
+
+    def remove_orphans(self):
+        """hapus file generasi lain, hanya aman saat tidak ada index di disk yang masih menunjuk file tersebut"""
+        root, ext = os.path.splitext(self.base_path)
+        for path in [self.base_path] + glob.glob(f"{glob.escape(root)}.*{ext}"):
+            if path != self.path and path not in self._stale_paths and os.path.exists(path):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def subset(self, resume_ids) -> 'CorpusPack':
+        """pack atas file yang sama dengan index hanya untuk resume id tertentu (ringan dikirim ke worker)"""
+        pack = copy.copy(self)
+        pack.offsets = {resume_id: self.offsets[resume_id] for resume_id in resume_ids if resume_id in self.offsets}
+        return pack
+
+    def close(self):
+        self._close_mmap()
+
+    def __getstate__(self):
+        """mmap tidak ikut di-pickle, dibuka ulang saat dibutuhkan"""
+        state = self.__dict__.copy()
+        state['_mmap'] = None
+        state['_stale_paths'] = []
+        return state
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            'records': len(self.offsets),
+            'bytes': self.end,
+            'dead_bytes': self.dead_bytes,
+        }
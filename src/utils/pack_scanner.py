@@ -0,0 +1,128 @@
+# src/utils/pack_scanner.py
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Iterator, List, Optional, Tuple
+from utils.corpus_pack import CorpusPack
+from utils.pdf_extractor import MATCH_TEXT_LIMIT
+
+def matching_view(view: memoryview) -> memoryview:
+    """potong teks lowercase (utf-8) ke MATCH_TEXT_LIMIT karakter tanpa copy"""
+    # batas MATCH_TEXT_LIMIT dalam karakter, untuk teks ascii sama dengan byte
+    if bytes(view[:MATCH_TEXT_LIMIT]).isascii():
+        return view[:MATCH_TEXT_LIMIT]
+    return view[:len(str(view, 'utf-8')[:MATCH_TEXT_LIMIT].encode('utf-8'))]
+
+def scan_pack(pack: CorpusPack, jobs: List[Tuple[str, Tuple[str, ...]]], compiled_patterns) -> Dict[str, Dict[str, int]]:
+    """scan record corpus pack dengan pattern yang sudah di-compile - dipakai proses utama maupun worker
+
+    jobs: [(resume id, keyword lowercase yang perlu discan di cv tersebut)]
+    return {keyword lowercase: {resume id: jumlah match}}
+    """
+    counts = {}
+    for resume_id, keywords in jobs:
+        view = pack.view(resume_id)
+        if view is None:
+            continue
+        data = matching_view(view)
+        scanned = {}  # compiled pattern -> hasil scan pada cv ini (automaton aho-corasick dipakai bersama)
+
+        for keyword in keywords:
+            compiled = compiled_patterns[keyword]
+            matches = scanned.get(compiled)
+            if matches is None:
+                matches = compiled.search_bytes(data)
+                scanned[compiled] = matches
+            positions = matches.get(keyword, [])
+            if positions:
+                counts.setdefault(keyword, {})[resume_id] = len(positions)
+    return counts
+
+def _scan_in_worker(pack: CorpusPack, jobs, compiled_patterns) -> Dict[str, Dict[str, int]]:
+    """entry point worker process: pack hasil unpickle di-mmap sendiri lalu ditutup setelah chunk selesai"""
+    try:
+        return scan_pack(pack, jobs, compiled_patterns)
+    finally:
+        pack.close()
+
+class PackScanner:
+    """scan exact matcher atas corpus pack di process pool
+
+    worker hanya menerima index offset (subset pack) dan pattern ter-compile, teks dibaca worker lewat mmap
+    dari file pack yang sama sehingga tidak ada teks cv yang di-pickle antar proses
+    """
+
+    CHUNKS_PER_WORKER = 4  # lebih banyak chunk supaya partial result dan cancel tetap responsif
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._pool = None
+
+    def is_parallel(self) -> bool:
+        return self.max_workers > 1
+
+    def scan(self, pack: CorpusPack, jobs, compiled_patterns) -> Iterator[Tuple[int, Dict[str, Dict[str, int]]]]:
+        """bagi jobs ke beberapa chunk, yield (jumlah cv di chunk, counts) begitu masing-masing chunk selesai"""
+        if not jobs:
+            return
+
+        chunk_count = max(1, min(len(jobs), self.max_workers * self.CHUNKS_PER_WORKER))
+        chunk_size = -(-len(jobs) // chunk_count)
+        chunks = [jobs[start:start + chunk_size] for start in range(0, len(jobs), chunk_size)]
+
+        pool = self._get_pool()
+        if pool is None:
+            # fallback sequential jika process pool tidak bisa dibuat
+            for chunk in chunks:
+                yield len(chunk), scan_pack(pack, chunk, compiled_patterns)
+            return
+
+        futures = {
+            pool.submit(_scan_in_worker, pack.subset(resume_id for resume_id, _ in chunk), chunk, compiled_patterns): chunk
+            for chunk in chunks
+        }
+        remaining = dict(futures)
+
+        try:
+            for future in as_completed(futures):
+                chunk = remaining.pop(future)
+                try:
+                    counts = future.result()
+                except BrokenProcessPool as e:
+                    # pool mati (misal worker gagal start), sisa chunk discan sequential
+                    print(f"⚠️ scan pool broken, falling back to sequential: {e}")
+                    remaining[future] = chunk
+                    self.shutdown()
+                    break
+                except Exception as e:
+                    print(f"⚠️ worker failed scanning chunk, scanning locally: {e}")
+                    counts = scan_pack(pack, chunk, compiled_patterns)
+                yield len(chunk), counts
+        finally:
+            # consumer berhenti lebih awal (cancel / early termination), batalkan sisa pekerjaan
+            for future in futures:
+                future.cancel()
+
+        for chunk in remaining.values():
+            yield len(chunk), scan_pack(pack, chunk, compiled_patterns)
+
+    def _get_pool(self) -> Optional[ProcessPoolExecutor]:
+        """buat process pool saat pertama dibutuhkan"""
+        if self._pool is None:
+            try:
+                # spawn supaya aman dipakai dari aplikasi qt yang sudah punya thread
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+            except (OSError, ValueError, NotImplementedError) as e:
+                print(f"⚠️ process pool unavailable, scanning sequentially: {e}")
+                return None
+        return self._pool
+
+    def shutdown(self):
+        """matikan process pool scan"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
@@ -2,108 +2,248 @@
 import PyPDF2
 import os
 import re
-from typing import Optional
+import signal
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, Iterable, Iterator, Tuple
 import time
+from utils.text_cache import TextCache
+
+# teks penanda file yang gagal / di-skip saat ekstraksi
+SKIPPED_TEXTS = ("large file skipped", "failed file skipped", "timeout skipped", "too many pages skipped", "no text extracted")
+
+# panjang maksimal teks (lowercase) yang discan exact matcher
+MATCH_TEXT_LIMIT = 3000
+
+class ExtractionTimeout(BaseException):
+    """dilempar oleh SIGALRM di worker; BaseException supaya tidak tertelan except Exception di parser"""
+
+def _read_pdf_text(pdf_path: str, max_file_size_mb: float, max_pages: int, max_extraction_time: float) -> Tuple[Optional[str], bool]:
+    """parse pdf jadi cleaned text, return (text, failed) - dipakai proses utama maupun worker"""
+    # check file size
+    try:
+        file_size_mb = os.path.getsize(pdf_path) / (1024 * 1024)
+        if file_size_mb > max_file_size_mb:
+            return "large file skipped", True
+    except OSError:
+        return None, True
+
+    start_time = time.time()
+
+    try:
+        with open(pdf_path, 'rb') as file:
+            pdf_reader = PyPDF2.PdfReader(file)
+
+            # quick check - if too many pages, skip
+            if len(pdf_reader.pages) > 10:
+                return "too many pages skipped", True
+
+            text = ""
+            max_pages = min(len(pdf_reader.pages), max_pages)
+
+            for i in range(max_pages):
+                # check timeout (fallback kalau preemption via SIGALRM tidak tersedia)
+                if time.time() - start_time > max_extraction_time:
+                    print(f"⏱️ timeout extracting {pdf_path}")
+                    return "timeout skipped", True
+
+                try:
+                    page = pdf_reader.pages[i]
+                    page_text = page.extract_text()
+                    if page_text:
+                        text += page_text + "\n"
+
+                    # if we have enough text, stop
+                    if len(text) > 5000:
+                        break
+
+                except Exception as e:
+                    print(f"⚠️ error extracting page {i} from {pdf_path}: {e}")
+                    continue
+
+            if text.strip():
+                return PDFExtractor._clean_text(text), False
+            else:
+                return "no text extracted", True
+
+    except Exception as e:
+        print(f"⚠️ error reading pdf {pdf_path}: {e}")
+        return None, True
+
+def _raise_extraction_timeout(signum, frame):
+    """signal handler untuk SIGALRM di worker"""
+    raise ExtractionTimeout()
+
+def _extract_in_worker(pdf_path: str, max_file_size_mb: float, max_pages: int, max_extraction_time: float) -> Tuple[str, Optional[str], bool]:
+    """entry point worker process: ekstraksi satu file dengan preemptive timeout"""
+    # setitimer hanya ada di unix, di windows tetap pakai timeout check per halaman
+    use_alarm = hasattr(signal, 'setitimer')
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _raise_extraction_timeout)
+        signal.setitimer(signal.ITIMER_REAL, max_extraction_time)
+
+    try:
+        text, failed = _read_pdf_text(pdf_path, max_file_size_mb, max_pages, max_extraction_time)
+    except ExtractionTimeout:
+        print(f"⏱️ timeout extracting {pdf_path} (preempted)")
+        text, failed = "timeout skipped", True
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+    return pdf_path, text, failed
 
 class PDFExtractor:
     """ekstraksi teks dari file pdf dengan optimasi aggressive"""
     
-    def __init__(self):
+    def __init__(self, disk_cache: Optional[TextCache] = None):
         self.max_file_size_mb = 5  # reduced from 10MB
         self.max_pages = 2  # reduced from 5 pages
         self.max_extraction_time = 3  # max 3 seconds per file
         self.text_cache = {}  # simple cache
+        self.disk_cache = disk_cache if disk_cache is not None else TextCache()  # persistent across restarts
         self.failed_files = set()  # track failed files
+        
+        # process pool untuk ekstraksi paralel (dibuat lazy saat pertama dipakai)
+        self.max_workers = os.cpu_count() or 1
+        self._pool = None
     
     def extract_text(self, pdf_path: str) -> Optional[str]:
         """ekstrak teks dari file pdf dengan timeout dan aggressive limits"""
-        if not os.path.exists(pdf_path):
-            return None
+        found, text = self._get_cached_text(pdf_path)
+        if found:
+            return text
         
-        # check if already failed
-        if pdf_path in self.failed_files:
-            return "failed file skipped"
+        text, failed = _read_pdf_text(pdf_path, self.max_file_size_mb, self.max_pages, self.max_extraction_time)
+        self._store_result(pdf_path, text, failed)
+        return text
+    
+    def extract_texts_parallel(self, pdf_paths: Iterable[str]) -> Iterator[Tuple[str, Optional[str]]]:
+        """ekstrak banyak pdf di process pool, yield (path, text) begitu masing-masing selesai"""
+        pending = []
         
-        # check cache first
-        if pdf_path in self.text_cache:
-            return self.text_cache[pdf_path]
+        # file yang sudah ada di cache langsung di-yield tanpa masuk pool
+        for pdf_path in pdf_paths:
+            found, text = self._get_cached_text(pdf_path)
+            if found:
+                yield pdf_path, text
+            else:
+                pending.append(pdf_path)
         
-        # check file size
-        try:
-            file_size_mb = os.path.getsize(pdf_path) / (1024 * 1024)
-            if file_size_mb > self.max_file_size_mb:
-                self.failed_files.add(pdf_path)
-                return "large file skipped"
-        except:
-            self.failed_files.add(pdf_path)
-            return None
-
-        start_time = time.time()
+        if not pending:
+            return
+        
+        pool = self._get_pool()
+        if pool is None:
+            # fallback sequential jika process pool tidak bisa dibuat
+            for pdf_path in pending:
+                yield pdf_path, self.extract_text(pdf_path)
+            return
+        
+        futures = {
+            pool.submit(_extract_in_worker, pdf_path, self.max_file_size_mb, self.max_pages, self.max_extraction_time): pdf_path
+            for pdf_path in pending
+        }
+        remaining = dict(futures)
         
         try:
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                
-                # quick check - if too many pages, skip
-                if len(pdf_reader.pages) > 10:
-                    self.failed_files.add(pdf_path)
-                    return "too many pages skipped"
-                
-                text = ""
-                max_pages = min(len(pdf_reader.pages), self.max_pages)
+            for future in as_completed(futures):
+                pdf_path = remaining.pop(future)
+                try:
+                    _, text, failed = future.result()
+                except BrokenProcessPool as e:
+                    # pool mati (misal worker gagal start), sisa file diekstrak sequential
+                    print(f"⚠️ extraction pool broken, falling back to sequential: {e}")
+                    remaining[future] = pdf_path
+                    self.shutdown()
+                    break
+                except Exception as e:
+                    print(f"⚠️ worker failed extracting {pdf_path}: {e}")
+                    text, failed = None, True
                 
-                for i in range(max_pages):
-                    # check timeout
-                    if time.time() - start_time > self.max_extraction_time:
-                        print(f"⏱️ timeout extracting {pdf_path}")
-                        self.failed_files.add(pdf_path)
-                        return "timeout skipped"
-                    
-                    try:
-                        page = pdf_reader.pages[i]
-                        page_text = page.extract_text()
-                        if page_text:
-                            text += page_text + "\n"
-                        
-                        # if we have enough text, stop
-                        if len(text) > 5000:
-                            break
-                            
-                    except Exception as e:
-                        print(f"⚠️ error extracting page {i} from {pdf_path}: {e}")
-                        continue
-                
-                # clean and cache the text
-                if text.strip():
-                    cleaned_text = self._clean_text(text)
-                    self.text_cache[pdf_path] = cleaned_text
-                    return cleaned_text
-                else:
-                    self.failed_files.add(pdf_path)
-                    return "no text extracted"
-                
-        except Exception as e:
-            print(f"⚠️ error reading pdf {pdf_path}: {e}")
-            self.failed_files.add(pdf_path)
-            return None
-
+                self._store_result(pdf_path, text, failed)
+                yield pdf_path, text
+        finally:
+            # consumer berhenti lebih awal (early termination), batalkan sisa pekerjaan
+            for future in futures:
+                future.cancel()
+        
+        for pdf_path in remaining.values():
+            yield pdf_path, self.extract_text(pdf_path)
+    
     def extract_text_for_matching(self, pdf_path: str) -> Optional[str]:
         """ekstrak teks khusus untuk pattern matching (lowercase, cleaned)"""
         text = self.extract_text(pdf_path)
-        if text and text not in ["large file skipped", "failed file skipped", "timeout skipped", "too many pages skipped", "no text extracted"]:
+        if text and text not in SKIPPED_TEXTS:
             # convert to lowercase for matching
             text = text.lower()
             # limit length for performance - very aggressive
-            if len(text) > 3000:  # reduced from 10000
-                text = text[:3000]
+            if len(text) > MATCH_TEXT_LIMIT:  # reduced from 10000
+                text = text[:MATCH_TEXT_LIMIT]
             return text
         return text
     
-    def _clean_text(self, text: str) -> str:
+    def evict(self, pdf_path: str):
+        """buang teks dari memory cache, hanya jika teks tersimpan di persistent cache"""
+        if pdf_path in self.text_cache and self.disk_cache.contains(pdf_path):
+            del self.text_cache[pdf_path]
+    
+    def _get_cached_text(self, pdf_path: str) -> Tuple[bool, Optional[str]]:
+        """cek file, failed files, memory cache lalu persistent cache; return (found, text)"""
+        if not os.path.exists(pdf_path):
+            return True, None
+        
+        # check if already failed
+        if pdf_path in self.failed_files:
+            return True, "failed file skipped"
+        
+        # check cache first
+        if pdf_path in self.text_cache:
+            return True, self.text_cache[pdf_path]
+        
+        # check persistent cache (auto-invalidated jika file berubah)
+        cached_text = self.disk_cache.get(pdf_path)
+        if cached_text is not None:
+            self.text_cache[pdf_path] = cached_text
+            return True, cached_text
+        
+        return False, None
+    
+    def _store_result(self, pdf_path: str, text: Optional[str], failed: bool):
+        """simpan hasil ekstraksi ke memory cache dan persistent cache"""
+        if failed:
+            self.failed_files.add(pdf_path)
+        elif text:
+            self.text_cache[pdf_path] = text
+            self.disk_cache.put(pdf_path, text)
+    
+    def _get_pool(self) -> Optional[ProcessPoolExecutor]:
+        """buat process pool saat pertama dibutuhkan"""
+        if self._pool is None:
+            try:
+                # spawn supaya aman dipakai dari aplikasi qt yang sudah punya thread
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+            except (OSError, ValueError, NotImplementedError) as e:
+                print(f"⚠️ process pool unavailable, extracting sequentially: {e}")
+                return None
+        return self._pool
+    
+    def shutdown(self):
+        """matikan process pool ekstraksi"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+    
+    @staticmethod
+    def _clean_text(text: str) -> str:
         """bersihkan teks hasil ekstraksi dengan minimal processing"""
         if not text:
             return ""
-
+        
         # very simple cleaning
         text = re.sub(r'\s+', ' ', text)  # normalize whitespace
         text = text.strip()
@@ -113,11 +253,16 @@ class PDFExtractor:
             text = text[:5000]
         
         return text
-
+    
     def get_extraction_stats(self):
         """get extraction statistics"""
+        disk_stats = self.disk_cache.get_stats()
         return {
             'cached_files': len(self.text_cache),
             'failed_files': len(self.failed_files),
-            'total_processed': len(self.text_cache) + len(self.failed_files)
-        }
\ No newline at end of file
+            'total_processed': len(self.text_cache) + len(self.failed_files),
+            'disk_cache_entries': disk_stats['entries'],
+            'disk_cache_hits': disk_stats['hits'],
+            'disk_cache_misses': disk_stats['misses'],
+            'workers': self.max_workers
+        }
@@ -0,0 +1,112 @@
+# src/utils/query_cache.py
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import replace
+from typing import List, Optional
+
+class QueryCache:
+    """cache hasil search per query di memory (lru) dengan batas ukuran dalam byte
+
+    key sudah berisi versi corpus index: begitu ada cv baru/berubah versinya naik dan
+    semua entry lama dibuang, jadi hasil cache tidak pernah basi
+    """
+
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024):
+        self.max_bytes = max_bytes  # 0 = cache nonaktif
+        self.entries = OrderedDict()  # key -> (results, perkiraan ukuran byte), urut dari yang paling lama dipakai
+        self.size = 0
+        self.corpus_version = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(keywords, algorithm: str, threshold: float, top_n: int, scoring: str, num_resumes: int) -> tuple:
+        """key query: keyword persis seperti diinput (urutan dan huruf besar/kecil) + parameter search
+
+        label keyword_matches / matched_keywords di hasil memakai teks keyword asli, jadi
+        "Python, SQL" dan "sql, python" tidak boleh berbagi entry
+        """
+        return (tuple(keywords), algorithm.upper(), round(threshold, 4), top_n, scoring.upper(), num_resumes)
+
+    @staticmethod
+    def _estimate_size(key, results) -> int:
+        """perkiraan memory entry (objek resume dipakai bersama repository, tidak dihitung)"""
+        size = sys.getsizeof(key) + sum(sys.getsizeof(keyword) for keyword in key[0]) + sys.getsizeof(results)
+        for result in results:
+            size += sys.getsizeof(result) + sys.getsizeof(result.keyword_matches) + sys.getsizeof(result.matched_keywords)
+            if result.fuzzy_matches:
+                size += sys.getsizeof(result.fuzzy_matches)
+        return size
+
+    @staticmethod
+    def _copy_results(results) -> List:
+        """salinan SearchResult (dict / list di dalamnya ikut disalin), caller bebas mengubah hasil tanpa merusak cache"""
+        return [
+            replace(result,
+                    keyword_matches=dict(result.keyword_matches),
+                    matched_keywords=list(result.matched_keywords),
+                    fuzzy_matches=dict(result.fuzzy_matches) if result.fuzzy_matches is not None else None)
+            for result in results
+        ]
+
+    def _check_version(self, corpus_version: int):
+        """buang semua entry jika corpus index sudah berubah sejak entry disimpan"""
+        if corpus_version != self.corpus_version:
+            self.entries.clear()
+            self.size = 0
+            self.corpus_version = corpus_version
+
+    def get(self, key: tuple, corpus_version: int) -> Optional[List]:
+        """ambil hasil search, return None jika tidak ada di cache"""
+        with self._lock:
+            self._check_version(corpus_version)
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self._copy_results(entry[0])
+
+    def put(self, key: tuple, corpus_version: int, results: List):
+        """simpan hasil search, entry yang paling lama tidak dipakai dibuang sampai muat budget"""
+        size = self._estimate_size(key, results)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            self._check_version(corpus_version)
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.size -= old[1]
+
+            self.entries[key] = (self._copy_results(results), size)
+            self.size += size
+            while self.size > self.max_bytes:
+                _, (_, evicted_size) = self.entries.popitem(last=False)
+                self.size -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        """hapus semua entry dan reset statistik"""
+        with self._lock:
+            self.entries.clear()
+            self.size = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def get_stats(self):
+        """statistik cache untuk monitoring"""
+        return {
+            'entries': len(self.entries),
+            'bytes': self.size,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
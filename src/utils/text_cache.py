@@ -0,0 +1,165 @@
+# src/utils/text_cache.py
+import os
+import hashlib
+import sqlite3
+import threading
+from typing import Optional
+
+def get_cache_dir() -> str:
+    """ambil directory cache aplikasi (bisa di-override lewat ATS_CACHE_DIR)"""
+    # default: <project root>/.ats_cache, sejajar dengan folder data/
+    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    cache_dir = os.getenv('ATS_CACHE_DIR', os.path.join(project_root, '.ats_cache'))
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+class TextCache:
+    """persistent cache teks hasil ekstraksi pdf, disimpan dalam satu file sqlite"""
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = db_path or os.path.join(get_cache_dir(), 'text_cache.sqlite3')
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = None
+
+        try:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS texts (
+                    path TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    text TEXT NOT NULL
+                )
+            """)
+            self._conn.commit()
+        except sqlite3.Error as e:
+            # cache bersifat opsional, ekstraksi tetap jalan tanpa cache
+            print(f"⚠️ text cache disabled ({self.db_path}): {e}")
+            self._conn = None
+
+    def _hash_file(self, pdf_path: str) -> str:
+        """hitung content hash dari isi file pdf"""
+        digest = hashlib.blake2b(digest_size=16)
+        with open(pdf_path, 'rb') as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def get(self, pdf_path: str) -> Optional[str]:
+        """ambil teks dari cache, return None jika tidak ada atau file sudah berubah"""
+        if self._conn is None:
+            return None
+
+        key = os.path.abspath(pdf_path)
+        try:
+            stat = os.stat(key)
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT size, mtime_ns, content_hash, text FROM texts WHERE path = ?", (key,)
+                ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            size, mtime_ns, content_hash, text = row
+
+            # ukuran beda berarti file pasti berubah
+            if size != stat.st_size:
+                self.invalidate(key)
+                self.misses += 1
+                return None
+
+            # mtime beda tapi isi sama (misal file di-copy ulang) masih valid
+            if mtime_ns != stat.st_mtime_ns:
+                if self._hash_file(key) != content_hash:
+                    self.invalidate(key)
+                    self.misses += 1
+                    return None
+                with self._lock:
+                    self._conn.execute("UPDATE texts SET mtime_ns = ? WHERE path = ?", (stat.st_mtime_ns, key))
+                    self._conn.commit()
+
+            self.hits += 1
+            return text
+
+        except (OSError, sqlite3.Error) as e:
+            print(f"⚠️ text cache lookup failed for {pdf_path}: {e}")
+            self.misses += 1
+            return None
+
+    def contains(self, pdf_path: str) -> bool:
+        """cek apakah path punya entry di cache (tanpa validasi file, tidak dihitung hit/miss)"""
+        if self._conn is None:
+            return False
+
+        try:
+            with self._lock:
+                row = self._conn.execute("SELECT 1 FROM texts WHERE path = ?", (os.path.abspath(pdf_path),)).fetchone()
+            return row is not None
+        except sqlite3.Error:
+            return False
+
+    def put(self, pdf_path: str, text: str):
+        """simpan teks hasil ekstraksi beserta fingerprint file"""
+        if self._conn is None:
+            return
+
+        key = os.path.abspath(pdf_path)
+        try:
+            stat = os.stat(key)
+            content_hash = self._hash_file(key)
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO texts (path, size, mtime_ns, content_hash, text) VALUES (?, ?, ?, ?, ?)",
+                    (key, stat.st_size, stat.st_mtime_ns, content_hash, text)
+                )
+                self._conn.commit()
+        except (OSError, sqlite3.Error) as e:
+            print(f"⚠️ failed to cache text for {pdf_path}: {e}")
+
+    def invalidate(self, pdf_path: str):
+        """hapus entry cache untuk satu file"""
+        if self._conn is None:
+            return
+
+        with self._lock:
+            self._conn.execute("DELETE FROM texts WHERE path = ?", (os.path.abspath(pdf_path),))
+            self._conn.commit()
+
+    def clear(self):
+        """hapus semua entry cache"""
+        if self._conn is None:
+            return
+
+        with self._lock:
+            self._conn.execute("DELETE FROM texts")
+            self._conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def get_stats(self):
+        """statistik cache untuk monitoring"""
+        entries = 0
+        if self._conn is not None:
+            with self._lock:
+                entries = self._conn.execute("SELECT COUNT(*) FROM texts").fetchone()[0]
+
+        return {
+            'entries': entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'path': self.db_path
+        }
+
+    def close(self):
+        """tutup koneksi sqlite"""
+        if self._conn is not None:
+            with self._lock:
+                self._conn.close()
+            self._conn = None
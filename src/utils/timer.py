@@ -15,6 +15,10 @@ class SearchTimer:
         self.search_results['num_cvs'] = num_cvs
         self.start_times['exact_search'] = time.perf_counter()
     
+    def set_scanned_cvs(self, num_cvs: int):
+        """jumlah cv kandidat yang benar-benar discan matcher (tidak dipanggil untuk algoritma INDEX)"""
+        self.search_results['scanned_cvs'] = num_cvs
+    
     def stop_exact_search(self) -> float:
         """stop timer exact search dan return duration ms"""
         if 'exact_search' in self.start_times:
@@ -38,21 +42,49 @@ class SearchTimer:
             return duration
         return 0.0
     
+    def start_cache_lookup(self, algorithm: str):
+        """mulai timer untuk lookup query cache"""
+        self.search_results['algorithm'] = algorithm
+        self.start_times['cache_lookup'] = time.perf_counter()
+    
+    def stop_cache_lookup(self, hit: bool, cache_stats: Dict[str, int]) -> float:
+        """stop timer lookup query cache, simpan hit/miss dan counter cache"""
+        self.search_results['cache_hit'] = hit
+        self.search_results['cache_hits'] = cache_stats['hits']
+        self.search_results['cache_misses'] = cache_stats['misses']
+        if 'cache_lookup' in self.start_times:
+            duration = (time.perf_counter() - self.start_times['cache_lookup']) * 1000
+            self.search_results['cache_duration'] = duration
+            del self.start_times['cache_lookup']
+            return duration
+        return 0.0
+    
     def get_search_summary(self) -> str:
         """buat summary hasil search timing"""
-        if 'exact_duration' not in self.search_results:
-            return "no search performed"
-        
         algorithm = self.search_results.get('algorithm', 'unknown')
-        num_cvs = self.search_results.get('num_cvs', 0)
-        exact_time = f"{self.search_results['exact_duration']:.0f}ms"
         
-        summary = f"exact match ({algorithm}): {num_cvs} cvs scanned in {exact_time}"
+        if self.search_results.get('cache_hit'):
+            cache_time = f"{self.search_results.get('cache_duration', 0.0):.1f}ms"
+            summary = f"cached result ({algorithm}): returned in {cache_time}"
+        elif 'exact_duration' not in self.search_results:
+            return "no search performed"
+        else:
+            num_cvs = self.search_results.get('num_cvs', 0)
+            exact_time = f"{self.search_results['exact_duration']:.0f}ms"
+            
+            if 'scanned_cvs' in self.search_results:
+                scanned_cvs = self.search_results['scanned_cvs']
+                summary = f"exact match ({algorithm}): {scanned_cvs} of {num_cvs} cvs scanned in {exact_time}"
+            else:
+                summary = f"exact match ({algorithm}): {num_cvs} cvs counted from inverted index (no text scan) in {exact_time}"
+            
+            if 'fuzzy_duration' in self.search_results:
+                fuzzy_keywords = self.search_results.get('fuzzy_keywords', 0)
+                fuzzy_time = f"{self.search_results['fuzzy_duration']:.0f}ms"
+                summary += f"\nfuzzy match: {fuzzy_keywords} keywords processed in {fuzzy_time}"
         
-        if 'fuzzy_duration' in self.search_results:
-            fuzzy_keywords = self.search_results.get('fuzzy_keywords', 0)
-            fuzzy_time = f"{self.search_results['fuzzy_duration']:.0f}ms"
-            summary += f"\nfuzzy match: {fuzzy_keywords} keywords processed in {fuzzy_time}"
+        if 'cache_hits' in self.search_results:
+            summary += f"\nquery cache: {self.search_results['cache_hits']} hits, {self.search_results['cache_misses']} misses"
         
         return summary
     
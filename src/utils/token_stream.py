@@ -0,0 +1,116 @@
+# src/utils/token_stream.py
+import os
+import struct
+from array import array
+from typing import Dict, Optional
+from algorithm.levenshtein import LevenshteinMatcher, WORD_PATTERN
+from utils.corpus_pack import CorpusPack
+
+# header record token: jumlah token
+RECORD_HEADER = struct.Struct('<I')
+
+class TokenStream:
+    """hasil preprocessing satu cv: teks lowercase, offset awal token dan id token ternormalisasi"""
+
+    __slots__ = ('text', 'starts', 'token_ids', 'words')
+
+    def __init__(self, text: str, starts, token_ids, words):
+        self.text = text  # teks cv lowercase (teks penuh hasil ekstraksi)
+        self.starts = starts  # offset karakter awal setiap token (run non-whitespace)
+        self.token_ids = token_ids  # id kata ternormalisasi per token, 0 = token tanpa huruf/angka
+        self.words = words  # vocabulary store: token id -> kata ternormalisasi
+
+    def __len__(self):
+        return len(self.starts)
+
+    def tokens(self):
+        """yield (clean word, start offset) seperti LevenshteinMatcher.tokenize, tanpa tokenize ulang"""
+        words = self.words
+        for token_id, start in zip(self.token_ids, self.starts):
+            if token_id:
+                yield words[token_id], start
+
+    def terms(self, limit: Optional[int] = None):
+        """yield (term, start offset) term asli (dengan punctuation) di text[:limit], sama dengan TERM_PATTERN"""
+        text = self.text if limit is None else self.text[:limit]
+        for start in self.starts:
+            if start >= len(text):
+                break
+            yield WORD_PATTERN.match(text, start).group(), start
+
+class TokenStreamStore:
+    """token stream semua cv, teks lowercase di corpus pack dan array token di pack terpisah
+
+    format record token: jumlah token, array uint32 offset awal token, array uint32 token id
+    """
+
+    def __init__(self, cache_dir: str):
+        self.texts = CorpusPack(os.path.join(cache_dir, 'corpus.pack'))  # blob utf-8 teks lowercase semua cv
+        self.arrays = CorpusPack(os.path.join(cache_dir, 'token_streams.bin'))
+        self.words = ['']  # token id -> kata ternormalisasi
+        self.word_ids = {'': 0}  # kata ternormalisasi -> token id
+
+    def _token_id(self, word: str) -> int:
+        token_id = self.word_ids.get(word)
+        if token_id is None:
+            token_id = len(self.words)
+            self.words.append(word)
+            self.word_ids[word] = token_id
+        return token_id
+
+    def add(self, resume_id: str, text: str) -> TokenStream:
+        """preprocess teks cv (dilakukan sekali saat ingest) dan tambahkan ke file"""
+        text = text.lower()
+        starts = array('I')
+        token_ids = array('I')
+        for match in WORD_PATTERN.finditer(text):
+            starts.append(match.start())
+            token_ids.append(self._token_id(LevenshteinMatcher.normalize_word(match.group())))
+
+        self.texts.put(resume_id, text.encode('utf-8'))
+        self.arrays.put(resume_id, RECORD_HEADER.pack(len(starts)) + starts.tobytes() + token_ids.tobytes())
+        return TokenStream(text, starts, token_ids, self.words)
+
+    def remove(self, resume_id: str) -> bool:
+        removed = self.texts.remove(resume_id)
+        return self.arrays.remove(resume_id) or removed
+
+    def get(self, resume_id: str) -> Optional[TokenStream]:
+        """baca token stream dari mmap, array offset dan token id tidak di-copy"""
+        text = self.texts.text(resume_id)
+        view = self.arrays.view(resume_id)
+        if text is None or view is None:
+            return None
+
+        count, = RECORD_HEADER.unpack_from(view)
+        ids_start = RECORD_HEADER.size + 4 * count
+        starts = view[RECORD_HEADER.size:ids_start].cast('I')
+        token_ids = view[ids_start:ids_start + 4 * count].cast('I')
+        return TokenStream(text, starts, token_ids, self.words)
+
+    def is_valid(self) -> bool:
+        return self.texts.is_valid() and self.arrays.is_valid()
+
+    def compact(self):
+        self.texts.compact()
+        self.arrays.compact()
+
+    def discard_stale(self):
+        self.texts.discard_stale()
+        self.arrays.discard_stale()
+
+    def remove_orphans(self):
+        self.texts.remove_orphans()
+        self.arrays.remove_orphans()
+
+    def close(self):
+        self.texts.close()
+        self.arrays.close()
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            'streams': len(self.arrays),
+            'words': len(self.words) - 1,
+            'text_bytes': self.texts.end,
+            'token_bytes': self.arrays.end,
+        }